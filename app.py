@@ -22,6 +22,18 @@ import os
 import sys
 from pathlib import Path
 
+# Measure startup time. Run with "--profile-imports" to measure the import time of each module as well
+from module.tools.startup_profiler import StartupProfiler
+if "--profile-imports" in sys.argv:
+    StartupProfiler().profileImports()
+else:
+    StartupProfiler()
+
+# Run with "--trace" to record the duration of each pipeline stage. The trace is written to the log directory on exit
+if "--trace" in sys.argv:
+    from module.tools.tracer import Tracer
+    Tracer().enable()
+
 ##########################
 ### Initial Path Setup ###
 ##########################
@@ -0,0 +1,60 @@
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtCore import QSize, Qt
+
+
+def blurImage(image: QImage, radius: float) -> QImage:
+    """ Approximate a gaussian blur by smoothly downscaling and upscaling the image.
+    Unlike QGraphicsBlurEffect, this only uses QImage and is thus safe to call outside the GUI thread """
+    factor = radius / 2
+    if factor <= 1:
+        return image
+    size = image.size()
+    small = image.scaled(
+        max(1, round(size.width() / factor)), max(1, round(size.height() / factor)),
+        aspectRatioMode=Qt.AspectRatioMode.IgnoreAspectRatio,
+        transformMode=Qt.TransformationMode.SmoothTransformation
+    )
+    return small.scaled(
+        size,
+        aspectRatioMode=Qt.AspectRatioMode.IgnoreAspectRatio,
+        transformMode=Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def composeBackground(image: QImage, size: QSize, opacity: float, blur_radius: float) -> QImage:
+    """Scale, blur and fade an image into a background of the given size.
+    Safe to call outside the GUI thread.
+
+    Parameters
+    ----------
+    image : QImage
+        The background image.
+
+    size : QSize
+        The size of the background. The image is scaled to cover it, preserving its aspect ratio.
+
+    opacity : float
+        The opacity of the image in the range [0, 1].
+
+    blur_radius : float
+        The blur radius in pixels. 0 disables blurring.
+
+    Returns
+    -------
+    QImage
+        The background, ready to be drawn.
+    """
+    scaled = image.scaled(
+        size,
+        aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        transformMode=Qt.TransformationMode.SmoothTransformation
+    )
+    scaled = blurImage(scaled, blur_radius)
+
+    background = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    background.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(background)
+    painter.setOpacity(opacity)
+    painter.drawImage(0, 0, scaled)
+    painter.end()
+    return background
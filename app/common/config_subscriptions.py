@@ -0,0 +1,114 @@
+import traceback
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from PyQt6.QtCore import QObject
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+
+
+class ConfigSubscriptions():
+    """ Notify listeners of changes to the config settings they subscribed to.
+
+    Unlike a broadcast signal, a change only invokes the listeners of its setting.
+    Changes made inside `batch()` are delivered once the batch ends, once per setting with its last value.
+    Setting widgets register as setters of their setting, so a setting can be changed through its widget with `set` """
+    _logger = logger
+
+    def __init__(self) -> None:
+        self._listeners = {} # type: dict[str, list[tuple[QObject | None, Callable[[str, Any], None]]]]
+        self._batch_listeners = [] # type: list[tuple[frozenset[str], QObject | None, Callable[[dict[str, Any]], None]]]
+        self._setters = {} # type: dict[str, list[tuple[QObject | None, Callable[[Any], None]]]]
+        self._batch_depth = 0
+        self._pending = {} # type: dict[str, Any]
+
+    def subscribe(self, keys: str | Iterable[str], callback: Callable[[str, Any], None],
+                  owner: Optional[QObject]=None) -> None:
+        """Call *callback* with the key and the new value whenever one of the settings changes.
+
+        Parameters
+        ----------
+        keys : str | Iterable[str]
+            The config keys of the settings.
+
+        callback : Callable[[str, Any], None]
+            Called with the config key and the new value.
+
+        owner : QObject, optional
+            Unsubscribe the callback when this object is destroyed.
+            By default None.
+        """
+        for key in [keys] if isinstance(keys, str) else keys:
+            self._listeners.setdefault(key, []).append((owner, callback))
+        self._watchOwner(owner)
+
+    def subscribeBatch(self, keys: Iterable[str], callback: Callable[[dict[str, Any]], None],
+                       owner: Optional[QObject]=None) -> None:
+        """ Call *callback* once per change, or once per batch of changes, with the changed settings among *keys*.
+        Use this if handling several changes together is cheaper than handling them one by one """
+        self._batch_listeners.append((frozenset(keys), owner, callback))
+        self._watchOwner(owner)
+
+    def registerSetter(self, key: str, setter: Callable[[Any], None], owner: Optional[QObject]=None) -> None:
+        """ Register the setter of a widget which edits the setting, e.g. its `setValue`.
+        The setter is expected to save the value and publish the change """
+        self._setters.setdefault(key, []).append((owner, setter))
+        self._watchOwner(owner)
+
+    def unsubscribe(self, owner: QObject) -> None:
+        """ Remove all callbacks of the owner """
+        for registry in (self._listeners, self._setters):
+            for key, listeners in list(registry.items()):
+                listeners[:] = [listener for listener in listeners if listener[0] is not owner]
+                if not listeners:
+                    del registry[key]
+        self._batch_listeners = [listener for listener in self._batch_listeners if listener[1] is not owner]
+
+    def _watchOwner(self, owner: QObject | None) -> None:
+        if owner is not None and not owner.property("_configSubscribed"):
+            owner.setProperty("_configSubscribed", True)
+            owner.destroyed.connect(lambda: self.unsubscribe(owner))
+
+    def publish(self, key: str, value: Any) -> None:
+        """ Notify the listeners of the setting of its new value """
+        if self._batch_depth:
+            self._pending.pop(key, None) # Deliver in the order of the last change
+            self._pending[key] = value
+        else:
+            self._deliver({key: value})
+
+    def set(self, key: str, value: Any) -> None:
+        """ Change a setting through the widgets editing it, which show, save and publish the value """
+        for _, setter in list(self._setters.get(key, ())):
+            self._call(setter, value)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """ Deliver all changes published inside the context when it exits, e.g. when creating many setting widgets """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                changes, self._pending = self._pending, {}
+                self._deliver(changes)
+
+    def _deliver(self, changes: dict[str, Any]) -> None:
+        for key, value in changes.items():
+            for _, callback in self._listeners.get(key, ()):
+                self._call(callback, key, value)
+        for keys, _, callback in self._batch_listeners:
+            if not keys.isdisjoint(changes):
+                self._call(callback, {key: value for key, value in changes.items() if key in keys})
+
+    def _call(self, callback: Callable, *args: Any) -> None:
+        try:
+            callback(*args)
+        except Exception:
+            self._logger.error(f"Config listener '{getattr(callback, "__qualname__", callback)}' failed\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+
+configSubscriptions = ConfigSubscriptions()
\ No newline at end of file
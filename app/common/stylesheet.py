@@ -15,6 +15,7 @@ class StyleSheet(StyleSheetBase, Enum):
     XML_INTERFACE = "xml_interface"
     SETTINGS_INTERFACE = "settings_interface"
     SETTINGS_SUBINTERFACE = "settings_subinterface"
+    DIAGNOSTICS_INTERFACE = "diagnostics_interface"
 
     # Components
     SAMPLE_CARD = f"components{os.sep}sample_card"
@@ -0,0 +1,160 @@
+from qfluentwidgets import PushButton, TableView
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QHeaderView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal, pyqtBoundSignal
+
+from typing import Any, Optional
+
+from app.common.stylesheet import StyleSheet
+
+from module.xml_tools import EntryStore
+
+
+class EntryTableModel(QAbstractTableModel):
+    translationEdited = pyqtSignal(int) # The row of the entry
+
+    ID_COLUMN = 0
+    SOURCE_COLUMN = 1
+    TRANSLATION_COLUMN = 2
+    STATUS_COLUMN = 3
+
+    _headers = ("ID", "Source", "Translation", "Status")
+    _status_names = {
+        EntryStore.EMPTY: "Empty",
+        EntryStore.UNTRANSLATED: "Untranslated",
+        EntryStore.GLOSSARY: "Glossary",
+        EntryStore.MEMORY: "Memory",
+        EntryStore.FUZZY: "Near-match",
+        EntryStore.TRANSLATOR: "Translator",
+        EntryStore.FAILED: "Failed",
+        EntryStore.EDITED: "Edited"
+    }
+
+    def __init__(self, store: EntryStore, parent: Optional[QWidget]=None) -> None:
+        """ A table model over the entry store. The view only queries the rows it displays """
+        super().__init__(parent)
+        self._store = store
+
+    def rowCount(self, parent: QModelIndex=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._store.getSize()
+
+    def columnCount(self, parent: QModelIndex=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int=Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == self.ID_COLUMN:
+                return self._store.getID(row)
+            elif column == self.SOURCE_COLUMN:
+                return self._store.getSource(row)
+            elif column == self.TRANSLATION_COLUMN:
+                return self._store.getTranslation(row)
+            else:
+                return self.tr(self._status_names.get(self._store.getStatus(row), ""))
+        elif role == Qt.ItemDataRole.ToolTipRole and column in (self.SOURCE_COLUMN, self.TRANSLATION_COLUMN):
+            # Rows have a fixed height, so long texts are only visible in full as a tooltip
+            return self.data(index, Qt.ItemDataRole.DisplayRole) or None
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int=Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.tr(self._headers[section])
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.TRANSLATION_COLUMN and self._store.getSource(index.row()):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int=Qt.ItemDataRole.EditRole) -> bool:
+        if (not index.isValid() or role != Qt.ItemDataRole.EditRole
+            or index.column() != self.TRANSLATION_COLUMN or value == self._store.getTranslation(index.row())):
+            return False
+        row = index.row()
+        self._store.setTranslation(row, value, EntryStore.EDITED)
+        self.dataChanged.emit(self.index(row, self.TRANSLATION_COLUMN), self.index(row, self.STATUS_COLUMN))
+        self.translationEdited.emit(row)
+        return True
+
+    def reload(self) -> None:
+        """ Call after the entry store has been (re)loaded """
+        self.beginResetModel()
+        self.endResetModel()
+
+    def updateRows(self, rows: list[int]) -> None:
+        """ Repaint the translation and status of the rows """
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), self.TRANSLATION_COLUMN), self.index(max(rows), self.STATUS_COLUMN))
+
+
+class EntryTableView(QWidget):
+    def __init__(self, label: str, store: EntryStore, parent: Optional[QWidget]=None) -> None:
+        super().__init__(parent)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.tr(label))
+        self.store = store
+        self.model = EntryTableModel(store, self)
+        self.tableView = TableView(self)
+        self.clearButton = None
+        self.vBoxLayout = QVBoxLayout(self)
+        self.buttonLayout = QHBoxLayout()
+
+        self.__initTable()
+
+        self.buttonLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.buttonLayout.setSpacing(20)
+
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.vBoxLayout.addWidget(self.label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.vBoxLayout.addWidget(self.tableView, stretch=2)
+        self.vBoxLayout.addLayout(self.buttonLayout)
+
+        self.label.setObjectName("Label")
+        self.setObjectName("inputView")
+        StyleSheet.INPUT_VIEW.apply(self)
+
+    def __initTable(self) -> None:
+        self.tableView.setModel(self.model)
+        self.tableView.setBorderVisible(True)
+        self.tableView.setBorderRadius(8)
+        self.tableView.setWordWrap(False)
+        self.tableView.setEditTriggers(TableView.EditTrigger.DoubleClicked | TableView.EditTrigger.EditKeyPressed)
+        # Fixed sizes let the view lay out only the visible rows.
+        # Avoid ResizeToContents as it measures every row of the model
+        verticalHeader = self.tableView.verticalHeader()
+        verticalHeader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        verticalHeader.setDefaultSectionSize(32)
+        horizontalHeader = self.tableView.horizontalHeader()
+        horizontalHeader.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        horizontalHeader.setSectionResizeMode(EntryTableModel.SOURCE_COLUMN, QHeaderView.ResizeMode.Stretch)
+        horizontalHeader.setSectionResizeMode(EntryTableModel.TRANSLATION_COLUMN, QHeaderView.ResizeMode.Stretch)
+        horizontalHeader.resizeSection(EntryTableModel.ID_COLUMN, 160)
+        horizontalHeader.resizeSection(EntryTableModel.STATUS_COLUMN, 110)
+
+    def addButton(self, button: QWidget) -> None:
+        self.buttonLayout.addWidget(button)
+
+    def enableClearButton(self) -> None:
+        if self.clearButton is None:
+            self.clearButton = PushButton(self.tr("Clear"), self)
+            self.clearButton.clicked.connect(self.clearTranslations)
+            self.buttonLayout.addWidget(self.clearButton)
+
+    def clearTranslations(self) -> None:
+        self.store.clearTranslations()
+        if self.store.getSize():
+            self.model.updateRows([0, self.store.getSize() - 1])
+
+    def reload(self) -> None:
+        self.model.reload()
+
+    def updateRows(self, rows: list[int]) -> None:
+        self.model.updateRows(rows)
+
+    def translationEdited(self) -> pyqtBoundSignal:
+        return self.model.translationEdited
\ No newline at end of file
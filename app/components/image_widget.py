@@ -1,8 +1,8 @@
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtCore import Qt, QRectF, QSize
 from PyQt6.QtGui import QPixmap, QPainter, QBrush, QPainterPath
-from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtWidgets import QApplication, QWidget
 
 from module.tools.types.general import StrPath
 
@@ -13,16 +13,28 @@ class ImageWidget(QWidget):
             self.image = QPixmap(image)
             self.setMinimumHeight(350)
             self.setMaximumHeight(self.image.height())
+            # Scaling from a smaller copy of the image is cheaper
+            self._downsampledImage = self._downsample(self.image)
+            # The brush and path used to paint the image at the size they were created for
+            self._brush = None # type: QBrush | None
+            self._path = None # type: QPainterPath | None
+            self._cacheSize = QSize()
         except Exception:
             self.deleteLater()
             raise
 
-    def paintEvent(self, e):
-        super().paintEvent(e)
-        painter = QPainter(self)
-        painter.setRenderHints(
-            QPainter.RenderHint.SmoothPixmapTransform | QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
+    def _downsample(self, image: QPixmap) -> QPixmap:
+        """ Downsample the image to the width of the widest screen, which the widget rarely exceeds """
+        max_width = max((screen.availableGeometry().width() for screen in QApplication.screens()), default=0)
+        if max_width and image.width() > max_width:
+            return image.scaledToWidth(max_width, Qt.TransformationMode.SmoothTransformation)
+        return image
+
+    def _updateCache(self) -> None:
+        """ Scale the image and create the rounded path for the current size """
+        if self.size() == self._cacheSize:
+            return
+        self._cacheSize = self.size()
 
         path = QPainterPath()
         path.setFillRule(Qt.FillRule.WindingFill)
@@ -32,15 +44,28 @@ class ImageWidget(QWidget):
         path.addRect(QRectF(w - 50, 0, 50, 50))
         path.addRect(QRectF(w - 50, h - 50, 50, 50))
         path = path.simplified()
+        path.addRect(QRectF(0, h, w, self.height() - h))
+        self._path = path
+
+        # Only scale from the full image if the downsampled image would have to be upscaled
+        image = self._downsampledImage if self.width() <= self._downsampledImage.width() else self.image
 
         # Calculate the required height for maintaining image aspect ratio
-        image_height = self.width() * self.image.height() // self.image.width()
+        image_height = self.width() * image.height() // image.width()
 
         # draw banner image with aspect ratio preservation
-        pixmap = self.image.scaled(
+        pixmap = image.scaled(
             self.width(), image_height,
             aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
             transformMode=Qt.TransformationMode.SmoothTransformation
         )
-        path.addRect(QRectF(0, h, w, self.height() - h))
-        painter.fillPath(path, QBrush(pixmap))
\ No newline at end of file
+        self._brush = QBrush(pixmap)
+
+    def paintEvent(self, e):
+        super().paintEvent(e)
+        self._updateCache()
+        painter = QPainter(self)
+        painter.setRenderHints(
+            QPainter.RenderHint.SmoothPixmapTransform | QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.fillPath(self._path, self._brush)
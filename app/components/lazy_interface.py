@@ -0,0 +1,56 @@
+import traceback
+from typing import Callable, Optional
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QShowEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+
+
+class LazyInterface(QWidget):
+    _logger = logger
+    loadFailed = pyqtSignal(str) # traceback
+
+    def __init__(self, factory: Callable[[], QWidget], name: str, parent: Optional[QWidget]=None) -> None:
+        """A placeholder for an interface in the navigation.
+        The interface is created when the placeholder is first shown or `load` is called.
+
+        Parameters
+        ----------
+        factory : Callable[[], QWidget]
+            Creates the interface.
+
+        name : str
+            The object name of the placeholder, i.e. its route key in the navigation.
+
+        parent : QWidget, optional
+            By default None.
+        """
+        super().__init__(parent)
+        self._factory = factory
+        self._isFailed = False
+        self.interface = None # type: QWidget | None
+        self.vBoxLayout = QVBoxLayout(self)
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.setObjectName(name)
+
+    def load(self) -> QWidget | None:
+        """ Create the interface, if not already created. Returns None if it could not be created """
+        if self.interface is None and not self._isFailed:
+            try:
+                self.interface = self._factory()
+                self.vBoxLayout.addWidget(self.interface)
+                self._logger.debug(f"Created interface '{self.interface.objectName()}'")
+            except Exception:
+                self._isFailed = True
+                self.loadFailed.emit(traceback.format_exc(limit=AppArgs.traceback_limit))
+        return self.interface
+
+    def isLoaded(self) -> bool:
+        return self.interface is not None or self._isFailed
+
+    def showEvent(self, e: QShowEvent) -> None:
+        self.load()
+        super().showEvent(e)
@@ -0,0 +1,77 @@
+from qfluentwidgets import ListView
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from typing import Any, Optional
+
+from app.common.stylesheet import StyleSheet
+
+
+class PreviewModel(QAbstractListModel):
+    def __init__(self, parent: Optional[QWidget]=None) -> None:
+        """ A read-only list model over the lines of an XML file.
+        The text of a line is only produced when the view displays it """
+        super().__init__(parent)
+        self._lines = [] # type: list[str]
+
+    def rowCount(self, parent: QModelIndex=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index: QModelIndex, role: int=Qt.ItemDataRole.DisplayRole) -> Any:
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._lines[index.row()].rstrip("\n")
+        return None
+
+    def setLines(self, lines: list[str]) -> None:
+        """ Display the lines. The list is referenced, not copied """
+        self.beginResetModel()
+        self._lines = lines
+        self.endResetModel()
+
+    def updateLine(self, row: int) -> None:
+        """ Repaint a line after it was changed in the referenced list """
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
+class PreviewView(QWidget):
+    def __init__(self, label: str, parent: Optional[QWidget]=None) -> None:
+        super().__init__(parent)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self.tr(label))
+        self.model = PreviewModel(self)
+        self.listView = ListView(self)
+        self.vBoxLayout = QVBoxLayout(self)
+        self.buttonLayout = QHBoxLayout()
+
+        self.listView.setModel(self.model)
+        self.listView.setSelectionMode(ListView.SelectionMode.NoSelection)
+        self.listView.setEditTriggers(ListView.EditTrigger.NoEditTriggers)
+        # All lines are equally high, so the view only has to measure and lay out the visible lines
+        self.listView.setUniformItemSizes(True)
+        self.listView.setLayoutMode(ListView.LayoutMode.Batched)
+        self.listView.setWordWrap(False)
+
+        self.buttonLayout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.buttonLayout.setSpacing(20)
+
+        self.vBoxLayout.setContentsMargins(0, 0, 0, 0)
+        self.vBoxLayout.addWidget(self.label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.vBoxLayout.addWidget(self.listView, stretch=2)
+        self.vBoxLayout.addLayout(self.buttonLayout)
+
+        self.label.setObjectName("Label")
+        self.setObjectName("inputView")
+        StyleSheet.INPUT_VIEW.apply(self)
+
+    def addButton(self, button: QWidget) -> None:
+        self.buttonLayout.addWidget(button)
+
+    def setLines(self, lines: list[str]) -> None:
+        self.model.setLines(lines)
+
+    def updateLine(self, row: int) -> None:
+        self.model.updateLine(row)
+
+    def isEmpty(self) -> bool:
+        return self.model.rowCount() == 0
\ No newline at end of file
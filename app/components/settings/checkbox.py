@@ -4,7 +4,7 @@ from PyQt6.QtCore import pyqtBoundSignal
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -58,7 +58,7 @@ class CheckBox_(BaseSetting):
             self.buttonlayout.addWidget(self.checkbox)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -66,11 +66,7 @@ class CheckBox_(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.checkbox.stateChanged.connect(self.setValue)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
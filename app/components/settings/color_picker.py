@@ -4,7 +4,7 @@ from PyQt6.QtGui import QColor
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -49,7 +49,7 @@ class ColorPicker(BaseSetting):
             self.buttonlayout.addWidget(self.colorbutton)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -57,11 +57,7 @@ class ColorPicker(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.colorbutton.colorChanged.connect(self.setValue)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import QWidget
 
 from typing import Any, Optional, Union
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -65,7 +65,7 @@ class ComboBox_(BaseSetting):
             self.buttonlayout.addWidget(self.comboBox)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -73,11 +73,7 @@ class ComboBox_(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.comboBox.currentIndexChanged.connect(lambda index: self.setValue(self.comboBox.itemData(index)))
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import QWidget, QFileDialog
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -59,7 +59,7 @@ class FileSelect(BaseSetting):
             self.buttonlayout.addWidget(self.selectButton)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -67,11 +67,7 @@ class FileSelect(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.selectButton.clicked.connect(self.__onSelectClicked)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
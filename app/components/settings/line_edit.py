@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import QWidget
 
 from typing import Any, Optional
 
+from app.common.config_subscriptions import configSubscriptions
 from app.common.signal_bus import signalBus
 from app.components.settings.base_setting import BaseSetting
 
@@ -70,7 +71,7 @@ class LineEdit_(BaseSetting):
             self.buttonlayout.addWidget(self.lineEdit)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -79,11 +80,7 @@ class LineEdit_(BaseSetting):
         self.lineEdit.editingFinished.connect(lambda: self.setValue(self.lineEdit.text()))
         self.lineEdit.textChanged.connect(self.__resizeTextBox)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
@@ -4,7 +4,7 @@ from PyQt6.QtCore import Qt
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.config.internal.app_args import AppArgs
@@ -79,7 +79,7 @@ class Slider_(BaseSetting):
             self.buttonlayout.addSpacing(-10)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -87,11 +87,7 @@ class Slider_(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.slider.valueChanged.connect(self.setValue)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self.__onUpdateConfigSettings)
-
-    def __onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import QWidget
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -67,7 +67,7 @@ class SpinBox_(BaseSetting):
             self.buttonlayout.addWidget(self.spinboxButton)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -75,11 +75,7 @@ class SpinBox_(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.spinboxButton.valueChanged.connect(self.setValue)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self._onUpdateConfigSettings)
-
-    def _onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
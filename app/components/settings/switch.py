@@ -5,7 +5,7 @@ from PyQt6.QtCore import pyqtBoundSignal
 
 from typing import Any, Optional
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.components.settings.base_setting import BaseSetting
 
 from module.tools.types.config import AnyConfig
@@ -60,7 +60,7 @@ class Switch(BaseSetting):
             self.buttonlayout.addWidget(self.switchButton)
 
             self.__connectSignalToSlot()
-            signalBus.configUpdated.emit(self.configkey, (self.currentValue,))
+            configSubscriptions.publish(self.configkey, self.currentValue)
         except Exception:
             self.deleteLater()
             raise
@@ -68,11 +68,7 @@ class Switch(BaseSetting):
     def __connectSignalToSlot(self) -> None:
         self.switchButton.checkedChanged.connect(self.setValue)
         self.notifySetting.connect(self.__onParentNotification)
-        signalBus.updateConfigSettings.connect(self._onUpdateConfigSettings)
-
-    def _onUpdateConfigSettings(self, configkey: str, value: tuple[Any,]) -> None:
-        if self.configkey == configkey:
-            self.setValue(value[0])
+        configSubscriptions.registerSetter(self.configkey, self.setValue, owner=self)
 
     def __onParentNotification(self, values: tuple) -> None:
         type = values[0]
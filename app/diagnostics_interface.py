@@ -0,0 +1,171 @@
+from typing import Any, Optional
+
+from qfluentwidgets import PushButton, ScrollArea, TableWidget
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QHideEvent, QShowEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QHeaderView, QTableWidgetItem
+
+from app.common.stylesheet import StyleSheet
+from app.components.infobar_test import InfoBar, InfoBarPosition
+
+from module.tools.metrics import Metrics
+
+
+class DiagnosticsInterface(ScrollArea):
+    _metrics = Metrics()
+    _refresh_interval = 1000 # ms
+
+    def __init__(self, parent: Optional[QWidget]=None):
+        super().__init__(parent)
+        self.view = QWidget(self)
+        self.vBoxLayout = QVBoxLayout(self.view)
+        self.buttonLayout = QHBoxLayout()
+        self.titleLabel = QLabel(self.tr("Diagnostics"), self.view)
+        self.summaryLabel = QLabel(self.view)
+        self.metricsTable = TableWidget(self.view)
+        self.refreshButton = PushButton(self.tr("Refresh"))
+        self.resetButton = PushButton(self.tr("Reset"))
+        self.exportJSONButton = PushButton(self.tr("Export JSON"))
+        self.exportPrometheusButton = PushButton(self.tr("Export Prometheus"))
+        # Refresh while shown
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setInterval(self._refresh_interval)
+
+        self.__initWidget()
+        self.__initLayout()
+        self.__connectSignalToSlot()
+        self.refresh()
+
+    def __initWidget(self):
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setWidget(self.view)
+        self.setWidgetResizable(True)
+
+        self.summaryLabel.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.metricsTable.setColumnCount(3)
+        self.metricsTable.setHorizontalHeaderLabels([self.tr("Metric"), self.tr("Labels"), self.tr("Value")])
+        self.metricsTable.setEditTriggers(TableWidget.EditTrigger.NoEditTriggers)
+        self.metricsTable.setWordWrap(False)
+        self.metricsTable.verticalHeader().hide()
+        horizontalHeader = self.metricsTable.horizontalHeader()
+        horizontalHeader.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        horizontalHeader.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        horizontalHeader.resizeSection(0, 280)
+        horizontalHeader.resizeSection(1, 220)
+        self.__setQss()
+
+    def __setQss(self):
+        self.setObjectName('diagnosticsInterface')
+        self.view.setObjectName("view")
+        self.titleLabel.setObjectName("Label")
+        StyleSheet.DIAGNOSTICS_INTERFACE.apply(self)
+
+    def __initLayout(self):
+        self.buttonLayout.setSpacing(20)
+        self.buttonLayout.addWidget(self.refreshButton)
+        self.buttonLayout.addWidget(self.resetButton)
+        self.buttonLayout.addStretch(1)
+        self.buttonLayout.addWidget(self.exportJSONButton)
+        self.buttonLayout.addWidget(self.exportPrometheusButton)
+
+        self.vBoxLayout.setContentsMargins(20, 0, 20, 36)
+        self.vBoxLayout.setSpacing(20)
+        self.vBoxLayout.addWidget(self.titleLabel)
+        self.vBoxLayout.addWidget(self.summaryLabel)
+        self.vBoxLayout.addWidget(self.metricsTable, stretch=1)
+        self.vBoxLayout.addLayout(self.buttonLayout)
+
+    def __connectSignalToSlot(self):
+        self.refreshTimer.timeout.connect(self.refresh)
+        self.refreshButton.clicked.connect(self.refresh)
+        self.resetButton.clicked.connect(self._onResetButtonClicked)
+        self.exportJSONButton.clicked.connect(lambda: self._export("json"))
+        self.exportPrometheusButton.clicked.connect(lambda: self._export("prometheus"))
+
+    def showEvent(self, e: QShowEvent) -> None:
+        self.refresh()
+        self.refreshTimer.start()
+        super().showEvent(e)
+
+    def hideEvent(self, e: QHideEvent) -> None:
+        self.refreshTimer.stop()
+        super().hideEvent(e)
+
+    def refresh(self) -> None:
+        rows = [] # type: list[tuple[str, str, str]]
+        for metric in self._metrics:
+            for labels, value in sorted(metric.getSamples(), key=lambda sample: sorted(sample[0].items())):
+                rows.append((
+                    metric.name,
+                    ", ".join(f"{name}={label}" for name, label in labels.items()),
+                    self._formatValue(metric.name, value)
+                ))
+        self.metricsTable.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                item = QTableWidgetItem(text)
+                item.setToolTip(text)
+                self.metricsTable.setItem(i, j, item)
+        self.summaryLabel.setText(self._getSummary())
+
+    def _getSummary(self) -> str:
+        requests = self._getSamples("translator_requests_total")
+        failed_requests = requests.get("unexpected_response", 0) + requests.get("unreachable", 0)
+        latency = self._metrics.get("translator_request_seconds")
+        latency = latency.getSamples()[0][1] if latency and latency.getSamples() else None
+        summary = [
+            self.tr(f"Translator requests: {requests.get("success", 0) + failed_requests:g} ({failed_requests:g} failed)"),
+            self.tr(f"Translator latency: p50 {self._formatSeconds(latency["quantiles"]["0.5"])}, "
+                    f"p99 {self._formatSeconds(latency["quantiles"]["0.99"])}") if latency else "",
+            self.tr(f"Translation memory hit rate: {self._getHitRate("translation_memory_lookups_total")}"),
+            self.tr(f"Config cache hit rate: {self._getHitRate("config_model_cache_lookups_total")}")
+        ]
+        return "\n".join(line for line in summary if line)
+
+    def _getSamples(self, name: str) -> dict[str, Any]:
+        """ The samples of a metric with a single label, by the value of the label """
+        metric = self._metrics.get(name)
+        return {next(iter(labels.values()), ""): value for labels, value in metric.getSamples()} if metric else {}
+
+    def _getHitRate(self, name: str) -> str:
+        lookups = self._getSamples(name)
+        total = sum(lookups.values())
+        return f"{lookups.get("hit", 0) / total:.1%} of {total:g} lookups" if total else "-"
+
+    def _formatSeconds(self, seconds: float) -> str:
+        return f"{seconds * 1000:.3g} ms" if seconds < 1 else f"{seconds:.3g} s"
+
+    def _formatValue(self, name: str, value: Any) -> str:
+        if not isinstance(value, dict):
+            return f"{value:,.6g}" if isinstance(value, float) else f"{value:,}"
+        # Histograms
+        format = self._formatSeconds if name.endswith("_seconds") else lambda number: f"{number:.4g}"
+        quantiles = ", ".join(f"p{float(quantile) * 100:g} {format(number)}" for quantile, number in value["quantiles"].items())
+        return f"count {value["count"]:,}, mean {format(value["mean"])}, {quantiles}, max {format(value["max"])}"
+
+    def _onResetButtonClicked(self) -> None:
+        self._metrics.reset()
+        self.refresh()
+
+    def _export(self, format: str) -> None:
+        path = self._metrics.export(format)
+        if path is None:
+            InfoBar.error(
+                title=self.tr("Failed to export metrics"),
+                content=self.tr("See the log for details"),
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                duration=5000,
+                position=InfoBarPosition.TOP_RIGHT,
+                parent=self
+            )
+        else:
+            InfoBar.success(
+                title=self.tr("Metrics exported"),
+                content=str(path),
+                orient=Qt.Orientation.Vertical,
+                isClosable=True,
+                duration=5000,
+                position=InfoBarPosition.TOP_RIGHT,
+                parent=self
+            )
\ No newline at end of file
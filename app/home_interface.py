@@ -2,12 +2,12 @@ import os
 from typing import Any, Optional
 
 from qfluentwidgets import ScrollArea, FluentIcon
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPixmap, QPainter, QBrush, QPainterPath
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QGraphicsDropShadowEffect
 
-from app.common.signal_bus import signalBus
+from app.common.config_subscriptions import configSubscriptions
 from app.common.stylesheet import StyleSheet
+from app.components.image_widget import ImageWidget
 from app.components.infobar_test import InfoBar, InfoBarPosition
 from app.components.link_card import LinkCardView
 
@@ -16,9 +16,9 @@ from module.config.internal.names import ModuleNames
 from module.config.app_config import AppConfig
 
 
-class BannerWidget(QWidget):
+class BannerWidget(ImageWidget):
     def __init__(self, parent=None):
-        super().__init__(parent=parent)
+        super().__init__(f"{AppArgs.asset_images_dir}{os.sep}banner.jpg", parent=parent)
         self.isBackgroundActive = bool(AppConfig().getValue("appBackground"))
         self.showBanner = not self.isBackgroundActive or int(AppConfig().getValue("backgroundOpacity")) == 0
 
@@ -34,8 +34,6 @@ class BannerWidget(QWidget):
         self.galleryLabel.setGraphicsEffect(shadow)
         self.galleryLabel.setObjectName('galleryLabel')
 
-        self.banner = QPixmap(f"{AppArgs.asset_images_dir}{os.sep}banner.jpg")
-
         self.linkCardView = LinkCardView(self)
         self.linkCardView.setContentsMargins(0, 0, 0, 36)
 
@@ -44,9 +42,6 @@ class BannerWidget(QWidget):
         linkCardLayout.addWidget(self.linkCardView)
         linkCardLayout.setAlignment(Qt.AlignmentFlag.AlignBottom)
 
-        self.setMinimumHeight(350)
-        self.setMaximumHeight(self.banner.height())
-
         self.vBoxLayout.setSpacing(0)
         self.vBoxLayout.setContentsMargins(0, 20, 0, 0)
         self.vBoxLayout.addWidget(self.galleryLabel)
@@ -62,43 +57,18 @@ class BannerWidget(QWidget):
         self.__connectSignalToSlot()
 
     def __connectSignalToSlot(self) -> None:
-        signalBus.configUpdated.connect(self.__onAppConfigUpdated)
+        configSubscriptions.subscribeBatch(("appBackground", "backgroundOpacity"), self.__onBackgroundSettingsUpdated, owner=self)
 
-    def __onAppConfigUpdated(self, configkey: str, valuePack: tuple[Any,]) -> None:
-        value = valuePack[0]
-        if configkey == "appBackground":
-            self.showBanner = not bool(value)
-            self.isBackgroundActive = bool(value)
-        elif configkey == "backgroundOpacity":
-            self.showBanner = not self.isBackgroundActive or int(value) == 0
+    def __onBackgroundSettingsUpdated(self, changes: dict[str, Any]) -> None:
+        if "appBackground" in changes:
+            self.isBackgroundActive = bool(changes["appBackground"])
+            self.showBanner = not self.isBackgroundActive
+        if "backgroundOpacity" in changes:
+            self.showBanner = not self.isBackgroundActive or int(changes["backgroundOpacity"]) == 0
 
     def paintEvent(self, e):
-        super().paintEvent(e)
         if self.showBanner:
-            painter = QPainter(self)
-            painter.setRenderHints(QPainter.RenderHint.SmoothPixmapTransform | QPainter.RenderHint.Antialiasing)
-            painter.setPen(Qt.PenStyle.NoPen)
-
-            path = QPainterPath()
-            path.setFillRule(Qt.FillRule.WindingFill)
-            w, h = self.width(), 200
-            path.addRoundedRect(QRectF(0, 0, w, h), 10, 10)
-            path.addRect(QRectF(0, h - 50, 50, 50))
-            path.addRect(QRectF(w - 50, 0, 50, 50))
-            path.addRect(QRectF(w - 50, h - 50, 50, 50))
-            path = path.simplified()
-
-            # Calculate the required height for maintaining image aspect ratio
-            image_height = self.width() * self.banner.height() // self.banner.width()
-
-            # draw banner image with aspect ratio preservation
-            pixmap = self.banner.scaled(
-                self.width(), image_height,
-                aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
-                transformMode=Qt.TransformationMode.SmoothTransformation
-            )
-            path.addRect(QRectF(0, h, w, self.height() - h))
-            painter.fillPath(path, QBrush(pixmap))
+            super().paintEvent(e)
 
 
 class HomeInterface(ScrollArea):
@@ -1,8 +1,7 @@
 from typing import Any
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QPaintEvent
-from PyQt6.QtWidgets import (QApplication, QGraphicsBlurEffect, QGraphicsItem,
-                             QGraphicsPixmapItem, QGraphicsScene, QGraphicsView)
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPainter, QPaintEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QSize, Qt, QThreadPool, QTimer, pyqtSignal
 from contextlib import redirect_stdout
 
 with redirect_stdout(None):
@@ -13,26 +12,38 @@ with redirect_stdout(None):
 import os
 import traceback
 
+from app.common.background import composeBackground
+from app.common.config_subscriptions import configSubscriptions
 from app.common.signal_bus import signalBus
 from app.common.stylesheet import StyleSheet
 from app.components.infobar_test import InfoBar, InfoBarPosition
+from app.components.lazy_interface import LazyInterface
 
 from module.config.internal.app_args import AppArgs
 from module.config.internal.names import ModuleNames
 from module.config.app_config import AppConfig
 from module.logger import logger
+from module.tools.startup_profiler import StartupProfiler
+from module.tools.tracer import Tracer
 
 
 class MainWindow(MSFluentWindow):
     _logger = logger
     _app_config = AppConfig()
+    # Backgrounds composed from images larger than this (in pixels) are composed in a worker thread
+    _async_background_size = 1920 * 1080
+    _backgroundComposed = pyqtSignal(QImage)
 
     def __init__(self):
         super().__init__()
         val = self._app_config.getValue("appBackground")
-        self.background = QPixmap(val) if val else None # type: QPixmap | None
-        self.backgroundOpacity = self._app_config.getValue("backgroundOpacity", 0.0)
-        self.backgroundBlurRadius = self._app_config.getValue("backgroundBlur", 0.0)
+        self.background = QImage(val) if val else None # type: QImage | None
+        self.backgroundOpacity = self._app_config.getValue("backgroundOpacity") / 100
+        self.backgroundBlurRadius = float(self._app_config.getValue("backgroundBlur"))
+        # The composed background and the parameters it was composed with
+        self._backgroundCache = None # type: QPixmap | None
+        self._backgroundKey = None # type: tuple | None
+        self._isComposingBackground = False
         self.errorLog = []
 
         self.setMicaEffectEnabled(False)
@@ -48,19 +59,12 @@ class MainWindow(MSFluentWindow):
                 self.errorLog.append(traceback.format_exc(limit=AppArgs.traceback_limit))
                 self.homeInterface = None
 
-            try:
-                from app.xml_interface import XMLInterface
-                self.processInterface = XMLInterface(self)
-            except Exception:
-                self.errorLog.append(traceback.format_exc(limit=AppArgs.traceback_limit))
-                self.processInterface = None
-
-            try:
-                from app.settings_interface import SettingsInterface
-                self.settingsInterface = SettingsInterface(self)
-            except Exception:
-                self.errorLog.append(traceback.format_exc(limit=AppArgs.traceback_limit))
-                self.settingsInterface = None
+            # The remaining interfaces are created when first shown or when the application is idle
+            self.processInterface = LazyInterface(self.__createProcessInterface, "processInterfaceLoader", self)
+            self.settingsInterface = LazyInterface(self.__createSettingsInterface, "settingsInterfaceLoader", self)
+            self.diagnosticsInterface = LazyInterface(self.__createDiagnosticsInterface, "diagnosticsInterfaceLoader", self)
+            for interface in (self.processInterface, self.settingsInterface, self.diagnosticsInterface):
+                interface.loadFailed.connect(self.__onInterfaceLoadFailed)
 
             self.__initNavigation()
         except Exception:
@@ -73,6 +77,51 @@ class MainWindow(MSFluentWindow):
             self._displayErrors()
         else:
             self._logger.info("Application startup successful!")
+        self._reportStartup()
+        QTimer.singleShot(0, self.__loadNextInterface)
+
+    def _reportStartup(self) -> None:
+        profiler = StartupProfiler()
+        startupTime = profiler.finish()
+        self._logger.info(f"Startup took {startupTime:.2f}s")
+        if profiler.isProfilingImports():
+            content = profiler.formatImportTimes(limit=AppArgs.import_report_size)
+            self._logger.info(f"Slowest imports (cumulative | self | module):\n  {"\n  ".join(content)}")
+            InfoBar.info(
+                title=self.tr(f"Startup took {startupTime:.2f}s"),
+                content="\n".join(content),
+                orient=Qt.Orientation.Vertical,
+                isClosable=True,
+                duration=-1,
+                position=InfoBarPosition.BOTTOM_RIGHT,
+                parent=self
+            )
+
+    def __createProcessInterface(self) -> QWidget:
+        from app.xml_interface import XMLInterface
+        return XMLInterface(self)
+
+    def __createSettingsInterface(self) -> QWidget:
+        from app.settings_interface import SettingsInterface
+        # Each setting widget publishes its value when created. Deliver them together once all are created
+        with configSubscriptions.batch():
+            return SettingsInterface(self)
+
+    def __createDiagnosticsInterface(self) -> QWidget:
+        from app.diagnostics_interface import DiagnosticsInterface
+        return DiagnosticsInterface(self)
+
+    def __loadNextInterface(self) -> None:
+        """ Create one pending interface per event loop iteration to keep the window responsive """
+        for interface in (self.processInterface, self.settingsInterface, self.diagnosticsInterface):
+            if interface and not interface.isLoaded():
+                interface.load()
+                QTimer.singleShot(0, self.__loadNextInterface)
+                return
+
+    def __onInterfaceLoadFailed(self, error: str) -> None:
+        self.errorLog.append(error)
+        self._displayErrors([error])
 
     def __initNavigation(self):
         if self.homeInterface:
@@ -86,6 +135,9 @@ class MainWindow(MSFluentWindow):
             self.toggleTheme,
             NavigationItemPosition.BOTTOM)
 
+        if self.diagnosticsInterface:
+            self.addSubInterface(self.diagnosticsInterface, FIF.SPEED_HIGH, self.tr("Diagnostics"), position=NavigationItemPosition.BOTTOM)
+
         if self.settingsInterface:
             self.addSubInterface(self.settingsInterface, FIF.SETTING, self.tr('Settings'), position=NavigationItemPosition.BOTTOM)
 
@@ -109,33 +161,32 @@ class MainWindow(MSFluentWindow):
         w, h = desktop.width(), desktop.height()
         self.move(w // 2 - self.width() // 2, h // 2 - self.height() // 2)
 
-        # Setup rendering for background image
-        self.scene = QGraphicsScene()
-        self.view = QGraphicsView()
-
         self.show()
         QApplication.processEvents()
 
     def __connectSignalToSlot(self) -> None:
-        signalBus.configUpdated.connect(self.__onAppConfigUpdated)
+        configSubscriptions.subscribeBatch(("appBackground", "backgroundOpacity", "backgroundBlur"),
+                                           self.__onBackgroundSettingsUpdated, owner=self)
+        configSubscriptions.subscribe("appTheme", lambda key, value: self.__onThemeChanged(value), owner=self)
+        configSubscriptions.subscribe("appColor", lambda key, value: setThemeColor(value, lazy=True), owner=self)
+        self._backgroundComposed.connect(self._onBackgroundComposed)
         signalBus.configValidationError.connect(lambda configname, title, content: self.__onConfigValidationFailed(title, content))
         signalBus.configStateChange.connect(self.__onConfigStateChanged)
-
-    def __onAppConfigUpdated(self, configkey: str, valuePack: tuple[Any,]) -> None:
-        value = valuePack[0]
-        if configkey == "appBackground":
-            self.background = QPixmap(value) if value else None
-            self.update()
-        elif configkey == "appTheme":
-            self.__onThemeChanged(value)
-        elif configkey == "appColor":
-            setThemeColor(value, lazy=True)
-        elif configkey == "backgroundOpacity":
-            self.backgroundOpacity = value / 100
-            self.update()
-        elif configkey == "backgroundBlur":
-            self.backgroundBlurRadius = float(value)
-            self.update()
+        # Write any settings changed within the save delay before exiting
+        QApplication.instance().aboutToQuit.connect(self._app_config.flushConfig)
+        if Tracer().isEnabled():
+            QApplication.instance().aboutToQuit.connect(Tracer().export)
+
+    def __onBackgroundSettingsUpdated(self, changes: dict[str, Any]) -> None:
+        if "appBackground" in changes:
+            value = changes["appBackground"]
+            self.background = QImage(value) if value else None
+            self._backgroundCache = None
+        if "backgroundOpacity" in changes:
+            self.backgroundOpacity = changes["backgroundOpacity"] / 100
+        if "backgroundBlur" in changes:
+            self.backgroundBlurRadius = float(changes["backgroundBlur"])
+        self.update()
 
     def __onConfigValidationFailed(self, title: str, content: str):
         InfoBar.warning(
@@ -178,8 +229,8 @@ class MainWindow(MSFluentWindow):
         else:
             setTheme(Theme.AUTO, lazy=True)
 
-    def _displayErrors(self):
-        for error in self.errorLog:
+    def _displayErrors(self, errors: list[str] | None=None):
+        for error in self.errorLog if errors is None else errors:
             self._logger.critical("Encountered a critical error during startup\n" + error)
             InfoBar.error(
                 title=self.tr("Critical Error!"),
@@ -192,42 +243,34 @@ class MainWindow(MSFluentWindow):
 
     def toggleTheme(self):
         toggleTheme(lazy=True)
-        signalBus.updateConfigSettings.emit("appTheme", (theme().value,))
+        configSubscriptions.set("appTheme", theme().value)
+
+    def _updateBackground(self) -> None:
+        """ Compose the background again if the image, window size, opacity or blur radius changed """
+        key = (self.background.cacheKey(), self.size(), self.backgroundOpacity, self.backgroundBlurRadius)
+        # A running composition checks the key again when it finishes
+        if key == self._backgroundKey or self._isComposingBackground:
+            return
+        self._backgroundKey = key
+        image, size, opacity, blur_radius = self.background, self.size(), self.backgroundOpacity, self.backgroundBlurRadius
+        if image.width() * image.height() > self._async_background_size:
+            self._isComposingBackground = True
+            QThreadPool.globalInstance().start(
+                lambda: self._backgroundComposed.emit(composeBackground(image, size, opacity, blur_radius))
+            )
+        else:
+            self._backgroundCache = QPixmap.fromImage(composeBackground(image, size, opacity, blur_radius))
+
+    def _onBackgroundComposed(self, background: QImage) -> None:
+        self._isComposingBackground = False
+        self._backgroundCache = QPixmap.fromImage(background)
+        self.update()
 
     def paintEvent(self, e: QPaintEvent):
         super().paintEvent(e)
         if self.background:
-            # Only set scene once!
-            if not self.view.scene():
-                self.view.setScene(self.scene)
-
-            # Setup painter
-            painter = QPainter(self)
-            painter.setRenderHints(QPainter.RenderHint.SmoothPixmapTransform | QPainter.RenderHint.Antialiasing | QPainter.RenderHint.LosslessImageRendering)
-            painter.setPen(Qt.PenStyle.NoPen)
-
-            # Draw background image with aspect ratio preservation
-            pixmap = self.background.scaled(
-                self.width(), self.height(),
-                aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                transformMode=Qt.TransformationMode.SmoothTransformation
-            )
-
-            # Get new pixmap rect
-            rect = pixmap.rect().toRectF()
-
-            # Add blur effect
-            blur = QGraphicsBlurEffect()
-            blur.setBlurRadius(self.backgroundBlurRadius)
-            blur.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
-
-            # Create pixmap for the graphics scene
-            pixmapItem = QGraphicsPixmapItem(pixmap)
-            pixmapItem.setGraphicsEffect(blur)
-            pixmapItem.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresParentOpacity)
-            pixmapItem.setOpacity(self.backgroundOpacity)
-
-            # Add image with effects to the scene and render image
-            self.scene.clear()
-            self.scene.addItem(pixmapItem)
-            self.view.render(painter, rect, rect.toRect())
\ No newline at end of file
+            self._updateBackground()
+            # The cache is outdated while a new background is being composed in the background
+            if self._backgroundCache:
+                painter = QPainter(self)
+                painter.drawPixmap(self.rect(), self._backgroundCache)
@@ -1,16 +1,18 @@
 import os
 from pathlib import Path
 from qfluentwidgets import ScrollArea, PrimaryPushButton, PushButton
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QSizePolicy
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import traceback
 
+from app.common.config_subscriptions import configSubscriptions
 from app.common.signal_bus import signalBus
 from app.common.stylesheet import StyleSheet
 from app.components.infobar_test import InfoBar, InfoBarPosition
-from app.components.input_view import InputView
+from app.components.entry_table import EntryTableView
+from app.components.preview_view import PreviewView
 from app.components.settings.line_edit import LineEdit_
 from app.components.settings.combobox import ComboBox_
 
@@ -19,15 +21,20 @@ from module.config.internal.app_args import AppArgs
 from module.config.templates.app_template import AppTemplate
 from module.config.tools.config_tools import retrieveDictValue
 from module.logger import logger
-from module.xml_tools import XMLParser, XMLSubstituter, XMLValidator
+from module.tools.perf_debugger import PerfDebugger
+from module.tools.tracer import Tracer
+from module.tools.utilities import LazyString, formatListForDisplay
+from module.xml_tools import EntryStore, ValidationScheduler, XMLParser, XMLSplicer, XMLSubstituter, XMLValidator, XMLWriter
 
-import requests
-import json
+if TYPE_CHECKING:
+    from module.translation_tools import TMImporter, Translator
 
 
 class XMLInterface(ScrollArea):
     _app_config = AppConfig()
     _logger = logger
+    _tracer = Tracer()
+    _tmCollected = pyqtSignal(object, str, tuple, int, object) # importer, folder, (source, target) language tags, file count, pairs | None on failure
 
     def __init__(self, parent: Optional[QWidget]=None):
         try:
@@ -35,12 +42,17 @@ class XMLInterface(ScrollArea):
             self.parser = XMLParser(self._app_config)
             self.substituter = XMLSubstituter(self._app_config, self.parser)
             self.validator = XMLValidator(self._app_config, self.parser, self.substituter)
+            self.validationScheduler = ValidationScheduler(self.validator, self)
+            self.writer = XMLWriter(self._app_config)
+            self.splicer = XMLSplicer()
+            self._translator = None # Created on first use
+            self.perfDebugger = PerfDebugger(self._app_config)
+            self.entryStore = EntryStore()
             self.xmlLocation = self._app_config.getValue("xmlLocation")
             self.extractLangTag = self._app_config.getValue("extractLangTag")
             self.writeLangTag = self._app_config.getValue("writeLangTag")
             self.previewErrorMessages = {} # type: dict[str, InfoBar | None]
             self.previewValid = False
-            self.isReadOnlyViews = True
 
             self.view = QWidget(self)
             self.vBoxLayout = QVBoxLayout(self.view)
@@ -71,6 +83,7 @@ class XMLInterface(ScrollArea):
         self.translateButton = PrimaryPushButton(self.tr("Translate"))
         self.confirmButton = PrimaryPushButton(self.tr("Confirm"))
         self.xmlFileSelectButton = PushButton(self.tr("Select XML file"))
+        self.tmImportButton = PushButton(self.tr("Import translation memory"))
         self.xmlFileLocationSetting = LineEdit_(
             config=self._app_config,
             configkey="xmlLocation",
@@ -79,41 +92,36 @@ class XMLInterface(ScrollArea):
         )
         self.xmlFileLocationSetting.setMaxWidth(self.parentWidget().width() // 2)
 
-        self.extractedTextView = InputView("Extracted Input")
+        self.entryTableView = EntryTableView("Entries", self.entryStore)
         self.extractLangTagSelect = ComboBox_(
             config=self._app_config,
             configkey="extractLangTag",
             configname=self._app_config.getConfigName(),
             texts=AppArgs.template_langTags,
         )
-        self.extractedTextView.setReadOnly(self.isReadOnlyViews)
-        self.extractedTextView.addButton(self.extractLangTagSelect)
-        self.extractedTextView.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-
-        self.translatedTextView = InputView("Translated Input")
         self.translatedLangTag = ComboBox_(
             config=self._app_config,
             configkey="writeLangTag",
             configname=self._app_config.getConfigName(),
             texts=AppArgs.template_langTags,
         )
-        self.translatedTextView.enableClearButton()
-        self.translatedTextView.addButton(self.translatedLangTag)
-        self.translatedTextView.addButton(self.translateButton)
-        self.translatedTextView.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.outputXMLPreview = InputView("XML Output Preview")
+        self.entryTableView.addButton(self.extractLangTagSelect)
+        self.entryTableView.addButton(self.translatedLangTag)
+        self.entryTableView.addButton(self.translateButton)
+        self.entryTableView.enableClearButton()
+        self.entryTableView.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self.outputXMLPreview = PreviewView("XML Output Preview")
         self.outputXMLPreview.addButton(self.confirmButton)
-        self.outputXMLPreview.setReadOnly(self.isReadOnlyViews)
 
         self.hTextViewLayout.setSpacing(20)
-        self.hTextViewLayout.addWidget(self.extractedTextView, stretch=1)
-        self.hTextViewLayout.addWidget(self.translatedTextView, stretch=1)
-        self.hTextViewLayout.addWidget(self.outputXMLPreview, stretch=2)
+        self.hTextViewLayout.addWidget(self.entryTableView, stretch=1)
+        self.hTextViewLayout.addWidget(self.outputXMLPreview, stretch=1)
 
         self.hFileSelectLayout.setSpacing(20)
         self.hFileSelectLayout.addWidget(self.xmlFileSelectButton)
         self.hFileSelectLayout.addWidget(self.xmlFileLocationSetting)
         self.hFileSelectLayout.addStretch(1)
+        self.hFileSelectLayout.addWidget(self.tmImportButton)
 
         self.vBoxLayout.setContentsMargins(20, 0, 20, 36)
         self.vBoxLayout.addLayout(self.hTextViewLayout)
@@ -124,28 +132,29 @@ class XMLInterface(ScrollArea):
         self.translateButton.clicked.connect(self._substituteXML)
         self.confirmButton.clicked.connect(self._onConfirmButtonClicked)
         self.xmlFileSelectButton.clicked.connect(self._onFileSelectButtonClicked)
-        self.translatedTextView.editingDone().connect(self._validateTranslation)
-        if not self.isReadOnlyViews:
-            self.outputXMLPreview.editingDone().connect(self._validatePreview)
-        signalBus.configUpdated.connect(self.__onAppConfigUpdated)
+        self.tmImportButton.clicked.connect(self._onTMImportButtonClicked)
+        self._tmCollected.connect(self._onTMCollected)
+        self.entryTableView.translationEdited().connect(self._onTranslationEdited)
+        configSubscriptions.subscribe("xmlLocation", self.__onXMLLocationUpdated, owner=self)
+        configSubscriptions.subscribe(("extractLangTag", "writeLangTag"), self.__onLangTagUpdated, owner=self)
         signalBus.xmlProcessException.connect(self._infoBarManager)
         signalBus.xmlValidationError.connect(self._infoBarManager)
         signalBus.xmlPreviewInvalid.connect(self._updatePreviewValidity)
 
-    def __onAppConfigUpdated(self, configkey: str, valuePack: tuple[Any,]) -> None:
-        value = valuePack[0]
-        if configkey == "xmlLocation":
-            self.xmlLocation = value
-            self._parseXMLLocation()
-        elif configkey == "extractLangTag":
+    def __onXMLLocationUpdated(self, configkey: str, value: Any) -> None:
+        self.xmlLocation = value
+        self._parseXMLLocation()
+
+    def __onLangTagUpdated(self, configkey: str, value: Any) -> None:
+        if configkey == "extractLangTag":
             self.extractLangTag = value
             self._parseXMLLocation()
-            if self.extractLangTag == self.writeLangTag:
-                self._infoBarManager(f"TAG_Config", "ETAG_Language tags are identical", "", True)
-        elif configkey == "writeLangTag":
+        else:
             self.writeLangTag = value
-            if self.extractLangTag == self.writeLangTag:
-                self._infoBarManager(f"TAG_Config", "WTAG_Language tags are identical", "", True)
+            self._clearPreview()
+        if self.extractLangTag == self.writeLangTag:
+            tag = "ETAG" if configkey == "extractLangTag" else "WTAG"
+            self._infoBarManager(f"TAG_Config", f"{tag}_Language tags are identical", "", True)
 
     def _onFileSelectButtonClicked(self):
         file = QFileDialog.getOpenFileName(
@@ -158,96 +167,178 @@ class XMLInterface(ScrollArea):
         if file[0]:
             self.xmlFileLocationSetting.setValue(file[0])
 
+    def _onTMImportButtonClicked(self):
+        folder = QFileDialog.getExistingDirectory(
+            parent=self,
+            caption=self.tr("Select folder of XML files to harvest translations from"),
+            directory=f"{AppArgs.app_dir}"
+        )
+        if not folder:
+            return
+        from module.translation_tools import TMImporter
+        # Reading the files takes a while. The translation memory itself is only updated on the GUI thread
+        importer = TMImporter(self._app_config)
+        source_lang, target_lang = self.extractLangTag, self.writeLangTag
+        self.tmImportButton.setEnabled(False)
+        QThreadPool.globalInstance().start(lambda: self._collectTM(importer, folder, source_lang, target_lang))
+
+    def _collectTM(self, importer: "TMImporter", folder: str, source_lang: str, target_lang: str) -> None:
+        """ Runs in a worker thread """
+        try:
+            file_count, pairs = importer.collect(folder, source_lang, target_lang)
+            self._tmCollected.emit(importer, folder, (source_lang, target_lang), file_count, pairs)
+        except Exception:
+            msg = "An unexpected exception occurred while importing translation memory"
+            trace = traceback.format_exc(limit=AppArgs.traceback_limit)
+            self._logger.error(msg + "\n" + trace)
+            signalBus.xmlProcessException.emit("PE_TMImport", msg, trace)
+            self._tmCollected.emit(importer, folder, (source_lang, target_lang), 0, None)
+
+    def _onTMCollected(self, importer: "TMImporter", folder: str, lang_tags: tuple[str, str], file_count: int,
+                       pairs: list[tuple[str, str]] | None) -> None:
+        self.tmImportButton.setEnabled(True)
+        if pairs is None:
+            return
+        try:
+            added = importer.add(folder, *lang_tags, file_count, pairs)
+            InfoBar.success(
+                title=self.tr("Translation memory imported"),
+                content=self.tr(f"Added {added} {"translations" if added != 1 else "translation"} from {file_count} XML {"files" if file_count != 1 else "file"}"),
+                orient=Qt.Orientation.Vertical,
+                isClosable=False,
+                duration=5000,
+                position=InfoBarPosition.TOP_RIGHT,
+                parent=self
+            )
+        except Exception:
+            msg = "An unexpected exception occurred while importing translation memory"
+            trace = traceback.format_exc(limit=AppArgs.traceback_limit)
+            self._logger.error(msg + "\n" + trace)
+            self._infoBarManager("PE_TMImport", msg, trace)
+
     def _parseXMLLocation(self):
+        # The preview belongs to the previous parse
+        self._clearPreview()
         if self.xmlLocation:
-            self.parser.parse(self.xmlLocation, self.extractLangTag)
-            extractedText = self.parser.getExtractedText()
-            self.extractedTextView.setText("\n".join(self.cleanTranslation(extractedText)))
-
-    def _validateTranslation(self, translation: str) -> None:
-        if not translation: return
-        cleanTranslation = self.cleanTranslation(translation.splitlines())
-        self.translatedTextView.setText("\n".join(cleanTranslation))
-
-        extractSize = len(self.cleanTranslation(self.parser.getExtractedText()))
-        translateSize = len(cleanTranslation)
-        if extractSize == translateSize:
-            # All good
-            self._infoBarManager("LOCOK_InputLoc", "Translation and extraction length are matching", "")
-        elif extractSize > translateSize:
-            # Missing translations
-            amount = extractSize-translateSize
-            self._infoBarManager("LOCMIS_InputLoc", f"Missing {amount} {"translations" if amount != 1 else "translation"}",
-                                 "Please check the translation to avoid missing localization entries in the output")
-        else:
-            # Too many translations
-            self._infoBarManager("LOCEXC_InputLoc", f"Too many translations!",
-                                 f"Excess translations: {translateSize-extractSize}\nThis will cause trouble for the XML engine")
+            with self.perfDebugger.run("parse"):
+                with self.perfDebugger.stage("parse"):
+                    self.parser.parse(self.xmlLocation, self.extractLangTag)
+                with self.perfDebugger.stage("loadEntries"):
+                    self.entryStore.load(self.parser)
+                with self.perfDebugger.stage("updateEntryTable"), \
+                     self._tracer.span("reloadEntryTable", "widgets", rows=self.entryStore.getSize()):
+                    self.entryTableView.reload()
+
+    def _clearPreview(self) -> None:
+        """ Discard the preview, e.g. because it was substituted from another file or language """
+        self.validationScheduler.cancel()
+        self.substituter.clear()
+        self.outputXMLPreview.setLines(self.substituter.getPreviewXML())
+        # Close the validation messages of the discarded preview
+        self._updatePreviewValidity(isValid=False, showErrors=False)
+
+    def _getTranslator(self) -> "Translator":
+        """ The translation stack is imported on first use to keep startup fast """
+        if self._translator is None:
+            from module.translation_tools import Translator
+            self._translator = Translator(self._app_config)
+        return self._translator
 
     def _substituteXML(self) -> None:
-        translation = []
-        to_trans = self.parser.getExtractedText()
-        for v in to_trans:
-            url = "http://localhost:5000/translate"
-            payload = {
-                "q": v,
-                "source": "zh-Hans",
-                "target": "en",
-                "format": "text",
-                "api_key": ""
-            }
-            headers = {
-                "Content-Type": "application/json"
-            }
-
-            response = requests.post(url, headers=headers, data=json.dumps(payload))
-
-            try:
-                translation.append(response.json()["translatedText"])
-            except KeyError:
-                translation.append(v) #can be changed to any message like "???" or "No translation avaliable"
-                print("WARNING: No translation available for: ", v)
-        
-
-        print([translation if translation != "" or None else "No translation!"])
-        if not translation: return
-        self.substituter.substitute(
-            write_lang_tag=self.writeLangTag,
-            parsed_xml_lines=self.parser.getParsedLines(),
-            extracted_text=self.parser.getExtractedText(),
-            sanitized_xml=self.parser.getSanitizedInput(),
-            localized_text=translation
+        with self.perfDebugger.run("translate"):
+            # Entries translated by the user are kept as-is
+            rows = self.entryStore.getTranslatableRows()
+            translator = self._getTranslator()
+            with self.perfDebugger.stage("translate"):
+                translation = translator.translate(
+                    texts=[self.entryStore.getSource(row) for row in rows],
+                    source_lang=self.extractLangTag,
+                    target_lang=self.writeLangTag
+                )
+            self._logger.debug(f"Translation statistics: {translator.getStatistics()}")
+            with self.perfDebugger.stage("updateEntryTable"):
+                for row, localization, status in zip(rows, translation, translator.getStatuses()):
+                    self.entryStore.setTranslation(row, localization, status)
+                with self._tracer.span("updateEntryTable", "widgets", rows=len(rows)):
+                    self.entryTableView.updateRows(rows)
+            self._showFuzzyMatches()
+            self._updatePreview()
+
+    def _onTranslationEdited(self, row: int) -> None:
+        # Only update a preview that already exists
+        if self.outputXMLPreview.isEmpty():
+            return
+        # Re-substitute only the edited entry
+        previewLine = self.substituter.resubstitute(
+            index=row,
+            parsed_line=self.parser.getParsedLines()[row],
+            localization=self.entryStore.getLocalization(row)
+        )
+        if previewLine is None:
+            self._updatePreview()
+        else:
+            self.outputXMLPreview.updateLine(previewLine)
+            self.validationScheduler.schedule(self.extractLangTag, self.writeLangTag, [self.entryStore.getID(row)])
+
+    def _updatePreview(self) -> None:
+        if not self.entryStore.getSize(): return
+        with self.perfDebugger.stage("substitute"):
+            self.substituter.substitute(
+                write_lang_tag=self.writeLangTag,
+                parsed_xml_lines=self.parser.getParsedLines(),
+                extracted_text=self.parser.getExtractedText(),
+                sanitized_xml=self.parser.getSanitizedInput(),
+                localized_text=self.entryStore.getLocalizedText()
+            )
+        with self.perfDebugger.stage("updatePreview"), \
+             self._tracer.span("updatePreview", "widgets", lines=len(self.substituter.getPreviewXML())):
+            self.outputXMLPreview.setLines(self.substituter.getPreviewXML())
+        self._validatePreview()
+
+    def _showFuzzyMatches(self) -> None:
+        fuzzy_matches = self._getTranslator().getFuzzyMatches()
+        if not fuzzy_matches:
+            return
+        message_size = self._app_config.getValue("messageSize")
+        entry_grammar = "entries" if len(fuzzy_matches) != 1 else "entry"
+        msg = f"Translated {len(fuzzy_matches)} {entry_grammar} using near-matches. Please review"
+        content = [f"{text} ≈ {match} ({score:.0%})" for text, match, score in fuzzy_matches]
+        self._logger.info("%s:\n  %s", msg, LazyString(formatListForDisplay, content, message_size, join_string="\n  "))
+        InfoBar.info(
+            title=self.tr(msg),
+            content=formatListForDisplay(content, message_size),
+            orient=Qt.Orientation.Vertical,
+            isClosable=True,
+            duration=-1,
+            position=InfoBarPosition.BOTTOM_RIGHT,
+            parent=self
         )
-        previewXML = "".join(self.substituter.getPreviewXML())
-        self.outputXMLPreview.setText(previewXML)
-        self._validatePreview(previewXML)
-
-    def cleanTranslation(self, translation: list[str]) -> list[str]:
-        cleanTranslation = []
-        for line in translation:
-            if line != "":
-                cleanTranslation.append(line)
-        return cleanTranslation
-
-    def _validatePreview(self, preview: str) -> None:
-        self.validator.validatePreview(
-            preview=preview.splitlines(),
+
+    def _validatePreview(self) -> None:
+        self.validationScheduler.schedule(
             extract_lang_tag=self.extractLangTag,
             write_lang_tag=self.writeLangTag
         )
 
     def _onConfirmButtonClicked(self) -> None:
         try:
-            xmlData = self.outputXMLPreview.text()
+            xmlData = self.substituter.getPreviewXML()
             if xmlData:
-                if not AppArgs.data_dir.exists():
-                    os.mkdir(AppArgs.data_dir.resolve())
-                prefix = self._app_config.getValue("outFilePrefix")
-                file_name = f"{prefix}{os.path.split(self.xmlLocation)[1]}"
-                dstPath = Path(AppArgs.data_dir, file_name).resolve()
-                with open(dstPath, "w", encoding="utf-8") as file:
-                    file.writelines(xmlData)
-                    self._logger.debug(f"Saving XML to {dstPath}")
+                with self.perfDebugger.run("save"):
+                    # Ensure the validity of the preview is up to date
+                    with self.perfDebugger.stage("validate"):
+                        self.validationScheduler.flush()
+                    if not AppArgs.data_dir.exists():
+                        os.mkdir(AppArgs.data_dir.resolve())
+                    prefix = self._app_config.getValue("outFilePrefix")
+                    file_name = f"{prefix}{os.path.split(self.xmlLocation)[1]}"
+                    dstPath = Path(AppArgs.data_dir, file_name).resolve()
+                    with self.perfDebugger.stage("write"):
+                        if (self._app_config.getValue("spliceOutput")
+                            and self.splicer.prepare(self.xmlLocation, self.writeLangTag, self.substituter.getSubstitutedPayloads())):
+                            self.writer.writeBytes(self.splicer.splice(), dstPath)
+                        else:
+                            self.writer.write(xmlData, dstPath)
 
                 # No errors are present
                 if self.previewValid:
@@ -357,38 +448,8 @@ class XMLInterface(ScrollArea):
                 orient=Qt.Orientation.Horizontal,
                 isClosable=False,
                 duration=5000,
-                position=InfoBarPosition.BOTTOM_RIGHT,
-                parent=self.extractedTextView if changedTag == "ETAG" else self.translatedTextView
-            )
-        elif errorType.find("LOCOK_") != -1:
-            bar = InfoBar.success(
-                title=msg,
-                content=content,
-                orient=Qt.Orientation.Vertical if content else Qt.Orientation.Horizontal,
-                isClosable=True,
-                duration=4000,
-                position=InfoBarPosition.TOP,
-                parent=self.translatedTextView
-            )
-        elif errorType.find("LOCMIS_") != -1:
-            bar = InfoBar.warning(
-                title=msg,
-                content=content,
-                orient=Qt.Orientation.Vertical if content else Qt.Orientation.Horizontal,
-                isClosable=True,
-                duration=6000,
-                position=InfoBarPosition.TOP,
-                parent=self.translatedTextView
-            )
-        elif errorType.find("LOCEXC_") != -1:
-            bar = InfoBar.error(
-                title=msg,
-                content=content,
-                orient=Qt.Orientation.Vertical if content else Qt.Orientation.Horizontal,
-                isClosable=True,
-                duration=6000,
-                position=InfoBarPosition.TOP,
-                parent=self.translatedTextView
+                position=InfoBarPosition.BOTTOM_LEFT if changedTag == "ETAG" else InfoBarPosition.BOTTOM_RIGHT,
+                parent=self.entryTableView
             )
         else:
             bar = InfoBar.error(
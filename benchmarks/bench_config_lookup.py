@@ -0,0 +1,43 @@
+"""Compare looking up config values by traversing the nested config with using the flat key index.
+
+Usage:
+    python -m benchmarks.bench_config_lookup [--number N]
+"""
+import argparse
+import timeit
+
+from module.config.app_config import AppConfig
+from module.config.tools.config_tools import buildKeyIndex, retrieveDictValue, retrieveIndexedValue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10_000, help="Number of lookups of each key (default: 10000)")
+    args = parser.parse_args()
+
+    config = AppConfig().getConfig()
+    keys = [key for section in config.values() for key in section]
+    index = buildKeyIndex(config)
+    for key in keys:
+        assert retrieveDictValue(config, key) == retrieveIndexedValue(index, key)
+
+    def traverse() -> None:
+        for key in keys:
+            retrieveDictValue(config, key)
+
+    def lookup() -> None:
+        for key in keys:
+            retrieveIndexedValue(index, key)
+
+    lookups = args.number * len(keys)
+    traverse_time = timeit.timeit(traverse, number=args.number)
+    lookup_time = timeit.timeit(lookup, number=args.number)
+    build_time = timeit.timeit(lambda: buildKeyIndex(config), number=1000) / 1000
+    print(f"{len(keys)} keys in {len(config)} sections, {lookups} lookups")
+    print(f"Traversal:   {traverse_time / lookups * 1e9:8.1f} ns/lookup")
+    print(f"Flat index:  {lookup_time / lookups * 1e9:8.1f} ns/lookup ({traverse_time / lookup_time:.1f}x faster)")
+    print(f"Index build: {build_time * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
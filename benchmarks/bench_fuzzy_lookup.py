@@ -0,0 +1,153 @@
+"""Benchmark fuzzy translation memory lookups on a memory filled with synthetic string table texts.
+
+The memory holds distinct generated texts, masked as the translator masks them before they are stored and looked up.
+Half of the queries are texts of the memory with a small edit, which should be found, and half are texts of
+another corpus, which mostly should not. The latency of each lookup is checked against the target of 1ms per lookup,
+and its results are compared with those of an exact search to report the recall of the index.
+
+Usage:
+    python -m benchmarks.bench_fuzzy_lookup [--segments N] [--queries N] [--language TAG] [--threshold T] [--no-mask] [--record FILE]
+"""
+import argparse
+import json
+import logging
+import math
+import random
+import statistics
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from benchmarks.corpus_generator import LANGUAGES, generateTexts
+from module.config.app_config import AppConfig
+from module.logger import logger
+from module.translation_tools.fuzzy_index import NGramIndex
+from module.translation_tools.masking import Masker
+
+# The latency a lookup must stay under on a memory of a million segments
+TARGET_MS = 1.0
+
+
+class ExactSearch():
+    def __init__(self, index: NGramIndex) -> None:
+        """ Find the most similar segment of the index by verifying every segment sharing one of the rarest n-grams
+        of the query which a match must share. Exact, but its cost grows with the size of the index """
+        self._index = index
+        self._postings = {} # type: dict[int, array]
+        for segment_id, grams in enumerate(index._grams):
+            for gram_id in grams:
+                self._postings.setdefault(gram_id, array("I")).append(segment_id)
+
+    def search(self, text: str, threshold: float) -> tuple[str, float] | None:
+        grams = self._index._gramSet(text)
+        size = len(grams)
+        gram_ids = self._index._gram_ids
+        query = {gram_ids[gram] for gram in grams if gram in gram_ids}
+        prefix = sorted(query, key=lambda gram_id: len(self._postings[gram_id]))[:len(query) - math.ceil(threshold * size) + 1]
+        candidates = set()
+        for gram_id in prefix:
+            candidates.update(self._postings[gram_id])
+        best_match, best_score = None, threshold
+        for segment_id in candidates:
+            segment_grams = self._index._grams[segment_id]
+            overlap = len(query.intersection(segment_grams))
+            score = overlap / (size + len(segment_grams) - overlap)
+            if score >= best_score:
+                best_match, best_score = segment_id, score
+        return None if best_match is None else (self._index._segments[best_match], best_score)
+
+
+def editText(text: str, rng: random.Random) -> str:
+    """ Replace a few characters of the text with other characters of the text, like a small revision """
+    characters = list(text)
+    for _ in range(1 + len(characters) // 40):
+        characters[rng.randrange(len(characters))] = rng.choice(characters)
+    return "".join(characters)
+
+
+def distinctTexts(texts: Iterable[str], count: int) -> list[str]:
+    """ The first *count* distinct texts """
+    distinct = {}
+    for text in texts:
+        distinct[text] = None
+        if len(distinct) == count:
+            break
+    return list(distinct)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=1_000_000, help="Segments of the memory (default: 1000000)")
+    parser.add_argument("--queries", type=int, default=1_000, help="Number of lookups (default: 1000)")
+    parser.add_argument("--language", choices=LANGUAGES, default="schinese", help="Language of the texts (default: schinese)")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Minimum similarity of a match (default: 0.8)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated texts (default: 0)")
+    parser.add_argument("--no-mask", action="store_true", help="Do not mask the texts, e.g. to measure the color codes")
+    parser.add_argument("--record", type=Path, help="Append the result as a JSON line to this file, to track it over time")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.ERROR)
+    masker = Masker(AppConfig())
+    prepare = (lambda text: text) if args.no_mask else (lambda text: masker.mask(text)[0])
+    # Unmasked texts may be masked to the same text, so generate more than needed
+    segments = distinctTexts(map(prepare, generateTexts(2 * args.segments, args.language, args.seed, duplicate_ratio=0)),
+                             args.segments)
+    rng = random.Random(args.seed)
+    misses = generateTexts(args.queries - args.queries // 2, args.language, args.seed + 1)
+    queries = [editText(rng.choice(segments), rng) for _ in range(args.queries // 2)] + list(map(prepare, misses))
+    rng.shuffle(queries)
+
+    start = time.perf_counter()
+    index = NGramIndex()
+    for segment in segments:
+        index.add(segment)
+    build_time = time.perf_counter() - start
+
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(index.search(query, args.threshold))
+        latencies.append(time.perf_counter() - start)
+
+    exact_search, matches, found = ExactSearch(index), 0, 0
+    for query, match in zip(queries, results):
+        exact_match = exact_search.search(query, args.threshold)
+        if exact_match is not None:
+            matches += 1
+            # Another segment of the same similarity is as good
+            found += match is not None and match[1] == exact_match[1]
+
+    latencies.sort()
+    summary = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "segments": len(segments),
+        "language": args.language,
+        "masked": not args.no_mask,
+        "threshold": args.threshold,
+        "queries": len(queries),
+        "build_s": round(build_time, 3),
+        "lookup_median_ms": round(statistics.median(latencies) * 1000, 4),
+        "lookup_mean_ms": round(statistics.mean(latencies) * 1000, 4),
+        "lookup_p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 4),
+        "lookup_max_ms": round(latencies[-1] * 1000, 4),
+        "recall": round(found / matches, 4) if matches else None
+    }
+    print(f"{summary["segments"]:,} {"masked" if summary["masked"] else "unmasked"} {args.language} segments "
+          f"indexed in {summary["build_s"]:.2f}s")
+    print(f"Lookup:  median {summary["lookup_median_ms"]:.3f}ms, mean {summary["lookup_mean_ms"]:.3f}ms, "
+          f"p99 {summary["lookup_p99_ms"]:.3f}ms, max {summary["lookup_max_ms"]:.3f}ms")
+    for statistic in ("median", "mean", "p99"):
+        latency = summary[f"lookup_{statistic}_ms"]
+        if latency >= TARGET_MS:
+            print(f"Target:  the {statistic} lookup misses the {TARGET_MS:g}ms target by {latency - TARGET_MS:.3f}ms")
+    if all(summary[f"lookup_{statistic}_ms"] < TARGET_MS for statistic in ("median", "mean", "p99")):
+        print(f"Target:  the median, mean and p99 lookups meet the {TARGET_MS:g}ms target")
+    print(f"Recall:  {found}/{matches} of the matches of an exact search found")
+    if args.record:
+        with open(args.record, "a", encoding="utf-8") as file:
+            file.write(json.dumps(summary) + "\n")
+
+
+if __name__ == "__main__":
+    main()
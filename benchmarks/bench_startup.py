@@ -0,0 +1,70 @@
+"""Benchmark the cold start time of the application.
+
+Each run starts a fresh Python process which creates the main window on the offscreen platform
+and reports the time until the window was ready, as measured by the StartupProfiler.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--record FILE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RUN_SCRIPT = """
+import sys, time
+from module.tools.startup_profiler import StartupProfiler
+StartupProfiler()
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import_start = time.perf_counter()
+from app.main_window import MainWindow
+import_time = time.perf_counter() - import_start
+window = MainWindow()
+print(f"RESULT {StartupProfiler().getStartupTime()} {import_time}")
+"""
+
+
+def runOnce() -> tuple[float, float]:
+    """ Returns the startup time and the time spent importing the main window in seconds """
+    env = os.environ | {"QT_QPA_PLATFORM": "offscreen", "PYTHONPATH": str(ROOT)}
+    output = subprocess.run([sys.executable, "-c", RUN_SCRIPT], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    line = next(line for line in output.splitlines() if line.startswith("RESULT "))
+    startup_time, import_time = map(float, line.split()[1:])
+    return startup_time, import_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure (default: 5)")
+    parser.add_argument("--record", type=Path, help="Append the result as a JSON line to this file, to track it over time")
+    args = parser.parse_args()
+
+    runOnce() # Warm up the file system cache and write the bytecode cache
+    results = [runOnce() for _ in range(args.runs)]
+    startup_times = [startup for startup, _ in results]
+    import_times = [imports for _, imports in results]
+
+    summary = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "runs": args.runs,
+        "startup_median_s": round(statistics.median(startup_times), 4),
+        "startup_min_s": round(min(startup_times), 4),
+        "import_main_window_median_s": round(statistics.median(import_times), 4),
+    }
+    print(f"Startup:             median {summary["startup_median_s"]:.3f}s, min {summary["startup_min_s"]:.3f}s")
+    print(f"Import main window:  median {summary["import_main_window_median_s"]:.3f}s")
+    if args.record:
+        with open(args.record, "a", encoding="utf-8") as file:
+            file.write(json.dumps(summary) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark the XML pipeline on synthetic string tables of increasing size.
+
+Each size is generated once by the corpus generator and kept in the corpus directory, so runs with the same
+parameters measure the same files. The stages are timed as the application runs them: parsing, substituting
+the source text as the translation, re-substituting single entries, finding missing entries and validating
+single entries. The number of malformed entries found by the parser is checked against the generated file.
+
+Usage:
+    python -m benchmarks.bench_xml_pipeline [--entries N [N ...]] [--languages N] [--seed N] [--repeat N] [--record FILE]
+"""
+import argparse
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.corpus_generator import LANGUAGES, generateCorpus
+from module.config.app_config import AppConfig
+from module.logger import logger
+from module.xml_tools import XMLParser, XMLSubstituter, XMLValidator
+
+# The number of entries re-substituted and validated one by one, as when editing translations
+EDITED_ENTRIES = 100
+
+
+def getCorpus(directory: Path, entries: int, languages: int, seed: int) -> tuple[Path, dict[str, Any]]:
+    """ The path and the statistics of the corpus of the parameters, which is generated if it does not exist """
+    path = Path(directory, f"corpus_{entries}_{languages}_{seed}.xml")
+    stats_path = path.with_suffix(".json")
+    if path.exists() and stats_path.exists():
+        return path, json.loads(stats_path.read_text(encoding="utf-8"))
+    directory.mkdir(parents=True, exist_ok=True)
+    stats = generateCorpus(path, entries=entries, languages=languages, seed=seed)
+    stats_path.write_text(json.dumps(stats), encoding="utf-8")
+    return path, stats
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """ The median duration of the function in seconds """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def benchmark(path: Path, stats: dict[str, Any], repeat: int) -> dict[str, float]:
+    config = AppConfig()
+    parser = XMLParser(config)
+    substituter = XMLSubstituter(config, parser)
+    validator = XMLValidator(config, parser, substituter)
+    extract_lang_tag = stats["languages"][0]
+    write_lang_tag = stats["languages"][-1]
+
+    results = {"parse": measure(lambda: parser.parse(path, extract_lang_tag), repeat)}
+    fixed, failed = len(parser._malformed_entries["fixed"]), len(parser._malformed_entries["failed"])
+    assert fixed == sum(stats["fixable"].values()), f"Fixed {fixed} malformed entries, expected {stats["fixable"]}"
+    assert failed == sum(stats["unfixable"].values()), f"Failed to fix {failed} malformed entries, expected {stats["unfixable"]}"
+
+    # Use the source text as the translation, which keeps the color codes intact
+    parsed_lines = parser.getParsedLines()
+    extracted_text = parser.getExtractedText()
+    localized_text = [text for text in extracted_text if text]
+    results["substitute"] = measure(lambda: substituter.substitute(
+        write_lang_tag=write_lang_tag,
+        parsed_xml_lines=parsed_lines,
+        extracted_text=extracted_text,
+        sanitized_xml=parser.getSanitizedInput(),
+        localized_text=localized_text
+    ), repeat)
+    assert not substituter.getFailedTranslations(), f"Failed to substitute {len(substituter.getFailedTranslations())} entries"
+
+    step = max(len(parsed_lines) // EDITED_ENTRIES, 1)
+    edited_rows = range(0, len(parsed_lines), step)
+    edited_ids = [parser.formatEntryID(parsed_lines[row], "") for row in edited_rows]
+    results["resubstitute"] = measure(lambda: [substituter.resubstitute(row, parsed_lines[row], extracted_text[row])
+                                               for row in edited_rows], repeat) / len(edited_rows)
+
+    missing_entries = validator.findMissingEntries(*validator.snapshot())
+    assert missing_entries is not None and not missing_entries[0], f"Missing entries after substituting: {missing_entries}"
+    results["findMissingEntries"] = measure(lambda: validator.findMissingEntries(*validator.snapshot()), repeat)
+    results["validateEntries"] = measure(lambda: [validator.validateEntries([entry_id], extract_lang_tag, write_lang_tag)
+                                                  for entry_id in edited_ids], repeat) / len(edited_ids)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Entries per language of each corpus (default: 1000 10000 100000)")
+    parser.add_argument("--languages", type=int, default=2, help=f"Number of languages, 1-{len(LANGUAGES)} (default: 2)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated corpora (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each stage, of which the median is reported (default: 3)")
+    parser.add_argument("--corpus-dir", type=Path, default=Path(tempfile.gettempdir(), "dd_xml_corpora"),
+                        help="Directory of the generated corpora (default: a directory in the temporary directory)")
+    parser.add_argument("--record", type=Path, help="Append the results as JSON lines to this file, to track them over time")
+    args = parser.parse_args()
+
+    # The parser reports the malformed entries of each run
+    logger.setLevel(logging.ERROR)
+    print(f"{"Entries":>9} | {"Size":>9} | {"Parse":>9} | {"Substitute":>10} | {"Resubst./entry":>14} | "
+          f"{"Find missing":>12} | {"Validate/entry":>14} | {"Entries/s":>9}")
+    for entries in args.entries:
+        path, stats = getCorpus(args.corpus_dir, entries, args.languages, args.seed)
+        results = benchmark(path, stats, args.repeat)
+        print(f"{entries:>9,} | {stats["bytes"] / 2**20:>7.1f}MB | {results["parse"]:>8.3f}s | {results["substitute"]:>9.3f}s | "
+              f"{results["resubstitute"] * 1e6:>12.1f}us | {results["findMissingEntries"]:>11.3f}s | "
+              f"{results["validateEntries"] * 1e6:>12.1f}us | {entries / results["parse"]:>9,.0f}")
+        if args.record:
+            summary = {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "entries": entries,
+                "languages": args.languages,
+                "seed": args.seed,
+                "bytes": stats["bytes"],
+                "repeat": args.repeat
+            } | {f"{stage}_s": round(seconds, 6) for stage, seconds in results.items()}
+            with open(args.record, "a", encoding="utf-8") as file:
+                file.write(json.dumps(summary) + "\n")
+
+
+if __name__ == "__main__":
+    main()
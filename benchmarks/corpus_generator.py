@@ -0,0 +1,318 @@
+"""Generate a synthetic Darkest Dungeon string table for benchmarks and stress tests.
+
+The file has the layout of the game's localization XML: a language block per language, each containing
+the same entries. The content is deterministic for a seed and the other parameters, so results of
+benchmarks using the same parameters are comparable. Each property of the entries is drawn independently:
+- multi-line entries, which span several lines of the file
+- malformed entries which the parser can fix, i.e. "<![CDATA text]]>"
+- malformed entries which the parser can not fix, i.e. "<![text]]>"
+- color codes, e.g. "{colour_start|notable}Torch{colour_end}"
+- duplicates, i.e. entries with the same text as an earlier entry, as in real string tables
+
+Usage:
+    python -m benchmarks.corpus_generator OUTPUT [--entries N | --size BYTES] [--languages N] [--seed N] ...
+"""
+import argparse
+import random
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# Language tags of the game, the first of which is the source language
+LANGUAGES = ("english", "schinese", "russian", "french", "german", "spanish", "brazilian", "polish", "czech",
+             "tchinese", "japanese", "koreana")
+
+_ID_PREFIXES = ("str", "hero_class_name", "skill_name", "combat_skill", "trinket_name", "trinket_desc", "town_event",
+                "str_bark", "curio_name", "quest_goal", "monster_name", "str_tooltip", "building_upgrade")
+_COLORS = ("notable", "harvest", "huixiang", "stress_heal", "stress_dmg", "blight", "bleed", "buff", "debuff")
+_NUMBERS = ("+10%", "-25%", "%d", "3", "12", "+1", "100%", "%s")
+_ENGLISH_WORDS = (
+    "the", "of", "a", "and", "to", "in", "torch", "hamlet", "darkness", "estate", "ruins", "weald", "warrens",
+    "cove", "crusader", "vestal", "highwayman", "plague", "doctor", "stress", "heirloom", "trinket", "curio",
+    "ancestor", "madness", "light", "damage", "bleed", "blight", "stun", "heal", "party", "expedition", "provisions",
+    "gold", "bust", "portrait", "deed", "crest", "abomination", "flagellant", "jester", "leper", "occultist",
+    "reveals", "strikes", "endures", "falters", "resolve", "tested", "virtue", "affliction", "remember", "ruin"
+)
+# English words are mostly drawn from a long tail of rarer words, as in real text. A word of the tail is made of the
+# syllables of its rank, and ranks are drawn log-uniformly, so their frequency falls with their rank like Zipf's law
+_ENGLISH_COMMON_RATIO = 0.4
+_ENGLISH_VOCABULARY_SIZE = 20_000
+_ENGLISH_SYLLABLES = ("ar", "ban", "cor", "del", "en", "fal", "gor", "hel", "is", "kin", "lor", "mar", "nes", "or",
+                      "pen", "quel", "ran", "sol", "ter", "un", "ver", "wen", "yr", "zan")
+# Characters of each script, from which the words of the other languages are drawn
+_SCRIPTS = {
+    "latin": "abcdefghijklmnopqrstuvwxyzéèàçüöäßñãõąęłśźżčřšž",
+    "cyrillic": "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+    "han": "十字军伤害检测到程序错误第一句二火炬村庄黑暗遗产废墟森林老鼠巢海湾圣女强盗瘟疫医生压力传家宝饰品先祖疯狂光明流血枯萎眩晕治疗队伍远征补给金币",
+    "kana": "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをんアイウエオカキクケコ",
+    "hangul": "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후",
+}
+_LANGUAGE_SCRIPTS = {"russian": "cyrillic", "schinese": "han", "tchinese": "han", "japanese": "kana", "koreana": "hangul"}
+_SENTENCE_ENDS = {"latin": ".!?", "cyrillic": ".!?", "han": "。！？", "kana": "。！？", "hangul": ".!?"}
+
+
+_MASK64 = 2**64 - 1
+
+def _mix(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _getEnglishWord(rank: int) -> str:
+    syllables = []
+    while True:
+        rank, syllable = divmod(rank, len(_ENGLISH_SYLLABLES))
+        syllables.append(_ENGLISH_SYLLABLES[syllable])
+        if not rank:
+            return "".join(syllables)
+
+
+# Purposes of the random values of an entry, which keep their streams independent
+_DUPLICATE, _DUPLICATE_SOURCE, _ID, _FORMAT, _SHAPE, _TEXT = range(6)
+
+
+class _EntryGenerator():
+    def __init__(self, seed: int, multiline_ratio: float, fixable_ratio: float, unfixable_ratio: float,
+                 color_code_density: float, duplicate_ratio: float) -> None:
+        self._seed = seed
+        self._multiline_ratio = multiline_ratio
+        self._fixable_ratio = fixable_ratio
+        self._unfixable_ratio = unfixable_ratio
+        self._color_code_density = color_code_density
+        self._duplicate_ratio = duplicate_ratio
+        self._rng = random.Random()
+        self._seed_hash = _mix(seed & _MASK64)
+
+    def _hash(self, index: int, purpose: int, language: int=0) -> int:
+        """ A 64-bit hash of the seed and the keys, chaining the SplitMix64 finalizer.
+        Each entry draws from its own values, so any entry can be generated without generating the ones before it """
+        value = self._seed_hash
+        for key in (index, language * 8 + purpose):
+            value = _mix(value ^ key)
+        return value
+
+    def _uniform(self, index: int, purpose: int, language: int=0) -> float:
+        return self._hash(index, purpose, language) / 2**64
+
+    def _seedFor(self, index: int, purpose: int, language: int=0) -> random.Random:
+        """ A random stream of the entry, for drawing many values """
+        self._rng.seed(self._hash(index, purpose, language))
+        return self._rng
+
+    def getSource(self, index: int) -> int:
+        """ The index of the entry whose text the entry has. Differs from *index* for duplicates """
+        while index > 0 and self._uniform(index, _DUPLICATE) < self._duplicate_ratio:
+            index = self._hash(index, _DUPLICATE_SOURCE) % index
+        return index
+
+    def getID(self, index: int) -> str:
+        value = self._hash(index, _ID)
+        return f"{_ID_PREFIXES[value % len(_ID_PREFIXES)]}_{_ENGLISH_WORDS[(value >> 32) % len(_ENGLISH_WORDS)]}_{index}"
+
+    def getFormat(self, index: int, language: int) -> str:
+        """ Whether the entry is "wellformed", "fixable" or "unfixable" in the language """
+        value = self._uniform(index, _FORMAT, language)
+        if value < self._unfixable_ratio:
+            return "unfixable"
+        if value < self._unfixable_ratio + self._fixable_ratio:
+            return "fixable"
+        return "wellformed"
+
+    def getShape(self, source: int) -> dict[str, Any]:
+        """ The properties of the text of a source entry which are shared by all languages """
+        rng = self._seedFor(source, _SHAPE)
+        random_ = rng.random
+        multiline = random_() < self._multiline_ratio
+        # Sentences per entry are weighted 50:30:15:5. Multi-line entries have a sentence per line
+        value = random_()
+        count = (1 if value < 0.5 else 2 if value < 0.8 else 3 if value < 0.95 else 4) if not multiline else \
+                (2 if value < 0.6 else 3 if value < 0.9 else 4)
+        return {
+            # The number of words and the color code of each sentence
+            "sentences": [(1 + int(random_() * 10), _COLORS[int(random_() * len(_COLORS))]
+                           if random_() < self._color_code_density else None) for _ in range(count)],
+            "number": _NUMBERS[int(random_() * len(_NUMBERS))] if random_() < 0.15 else None,
+            "multiline": multiline
+        }
+
+    def getText(self, source: int, shape: dict[str, Any], language: int) -> list[str]:
+        """ The lines of the text of a source entry in the language """
+        rng = self._seedFor(source, _TEXT, language)
+        random_ = rng.random
+        script = _LANGUAGE_SCRIPTS.get(LANGUAGES[language], "latin")
+        separator = "" if script in ("han", "kana") else " "
+        alphabet = _SCRIPTS[script]
+        max_length = 3 if script in ("han", "kana") else 8
+        sentence_ends = _SENTENCE_ENDS[script]
+        sentences = []
+        for word_count, color in shape["sentences"]:
+            if language == 0:
+                words = [rng.choice(_ENGLISH_WORDS) if random_() < _ENGLISH_COMMON_RATIO
+                         else _getEnglishWord(int(_ENGLISH_VOCABULARY_SIZE ** random_())) for _ in range(word_count)]
+            else:
+                words = ["".join(rng.choices(alphabet, k=1 + int(random_() * max_length))) for _ in range(word_count)]
+            sentence = separator.join(words)
+            sentence = sentence[:1].upper() + sentence[1:] + sentence_ends[int(random_() * len(sentence_ends))]
+            if color:
+                sentence = f"{{colour_start|{color}}}{sentence}{{colour_end}}"
+            sentences.append(sentence)
+        if shape["number"]:
+            sentences[0] = f"{shape["number"]} {sentences[0]}"
+        return sentences if shape["multiline"] else [" ".join(sentences)]
+
+    def getEntry(self, index: int, language: int) -> tuple[str, int, dict[str, Any], str]:
+        """ The line(s) of the entry in the language, its source entry, the shape of its text, and its format """
+        source = self.getSource(index)
+        shape = self.getShape(source)
+        text = "\n    ".join(self.getText(source, shape, language)) # Continuation lines are indented, as in the game files
+        entry_format = self.getFormat(index, language)
+        match entry_format:
+            case "unfixable":
+                payload = f"<![{text}]]>"
+            case "fixable":
+                payload = f"<![CDATA{text}]]>"
+            case _:
+                payload = f"<![CDATA[{text}]]>"
+        return f"    <entry id=\"{self.getID(index)}\">{payload}</entry>\n", source, shape, entry_format
+
+
+def generateTexts(count: int, language: str="english", seed: int=0, multiline_ratio: float=0.05,
+                  color_code_density: float=0.1, duplicate_ratio: float=0.2) -> Iterator[str]:
+    """ The texts of the entries of a corpus in the language, as extracted by the parser, e.g. to fill a
+    translation memory. Uses the same parameters as `generateCorpus` """
+    generator = _EntryGenerator(seed, multiline_ratio, 0, 0, color_code_density, duplicate_ratio)
+    language_index = LANGUAGES.index(language)
+    for index in range(count):
+        source = generator.getSource(index)
+        yield "".join(generator.getText(source, generator.getShape(source), language_index))
+
+
+def generateCorpus(path: str | Path, entries: Optional[int]=10_000, size: Optional[int]=None, languages: int=2,
+                   seed: int=0, multiline_ratio: float=0.05, fixable_ratio: float=0.002, unfixable_ratio: float=0.001,
+                   color_code_density: float=0.1, duplicate_ratio: float=0.2) -> dict[str, Any]:
+    """Write a synthetic string table.
+
+    Parameters
+    ----------
+    path : str | Path
+        The file to write.
+
+    entries : int, optional
+        The number of entries per language. By default 10000.
+
+    size : int, optional
+        The approximate size of the file in bytes. Overrides *entries* if given. By default None.
+
+    languages : int, optional
+        The number of language blocks, starting with "english". By default 2.
+
+    seed : int, optional
+        The same seed and parameters always produce the same file. By default 0.
+
+    multiline_ratio : float, optional
+        The share of entries with a sentence per line, which span several lines. By default 0.05.
+
+    fixable_ratio : float, optional
+        The share of entries per language with a malformed CDATA section the parser can fix, e.g. "<![CDATA text]]>".
+        By default 0.002.
+
+    unfixable_ratio : float, optional
+        The share of entries per language with a malformed CDATA section the parser can not fix, e.g. "<![text]]>".
+        By default 0.001.
+
+    color_code_density : float, optional
+        The share of sentences wrapped in color codes. By default 0.1.
+
+    duplicate_ratio : float, optional
+        The share of entries with the same text as an earlier entry. By default 0.2.
+
+    Returns
+    -------
+    dict[str, Any]
+        The parameters and the resulting properties of the file, e.g. the number of malformed entries per language.
+    """
+    if not 1 <= languages <= len(LANGUAGES):
+        raise ValueError(f"languages must be between 1 and {len(LANGUAGES)}")
+    if entries is None and size is None:
+        raise ValueError("Either entries or size must be given")
+    generator = _EntryGenerator(seed, multiline_ratio, fixable_ratio, unfixable_ratio, color_code_density, duplicate_ratio)
+    language_tags = LANGUAGES[:languages]
+    header = "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\n<root>\n"
+    footer = "</root>\n"
+    stats = {
+        "seed": seed,
+        "languages": list(language_tags),
+        "entries": 0,
+        "bytes": 0,
+        "multiline": 0,
+        "color_coded": 0,
+        "duplicates": 0,
+        "fixable": {},
+        "unfixable": {}
+    } # type: dict[str, Any]
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        file.write(header)
+        for language_index, language in enumerate(language_tags):
+            file.write(f"  <language id=\"{language}\">\n")
+            fixable = unfixable = 0
+            # With a target size, the first language block determines the number of entries
+            block_size = None if size is None or language_index else (size - len(header) - len(footer)) // languages
+            index = 0
+            block_written = 0
+            while (index < entries) if block_size is None else (block_written < block_size):
+                entry, source, shape, entry_format = generator.getEntry(index, language_index)
+                if block_size is not None:
+                    block_written += len(entry.encode("utf-8"))
+                file.write(entry)
+                fixable += entry_format == "fixable"
+                unfixable += entry_format == "unfixable"
+                if language_index == 0:
+                    stats["multiline"] += shape["multiline"]
+                    stats["color_coded"] += any(color for _, color in shape["sentences"])
+                    stats["duplicates"] += source != index
+                index += 1
+            file.write("  </language>\n")
+            entries = index
+            stats["fixable"][language] = fixable
+            stats["unfixable"][language] = unfixable
+        file.write(footer)
+    stats["entries"] = entries
+    stats["bytes"] = Path(path).stat().st_size
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", type=Path, help="The XML file to write")
+    parser.add_argument("--entries", type=int, default=10_000, help="Entries per language (default: 10000)")
+    parser.add_argument("--size", type=int, help="Approximate file size in bytes, instead of --entries")
+    parser.add_argument("--languages", type=int, default=2, help=f"Number of languages, 1-{len(LANGUAGES)} (default: 2)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated content (default: 0)")
+    parser.add_argument("--multiline-ratio", type=float, default=0.05, help="Share of multi-line entries (default: 0.05)")
+    parser.add_argument("--fixable-ratio", type=float, default=0.002, help="Share of fixable malformed entries (default: 0.002)")
+    parser.add_argument("--unfixable-ratio", type=float, default=0.001, help="Share of unfixable malformed entries (default: 0.001)")
+    parser.add_argument("--color-code-density", type=float, default=0.1, help="Share of sentences in color codes (default: 0.1)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2, help="Share of duplicated texts (default: 0.2)")
+    args = parser.parse_args()
+
+    stats = generateCorpus(
+        path=args.output,
+        entries=args.entries,
+        size=args.size,
+        languages=args.languages,
+        seed=args.seed,
+        multiline_ratio=args.multiline_ratio,
+        fixable_ratio=args.fixable_ratio,
+        unfixable_ratio=args.unfixable_ratio,
+        color_code_density=args.color_code_density,
+        duplicate_ratio=args.duplicate_ratio
+    )
+    print(f"Wrote {stats["entries"]} entries in {len(stats["languages"])} languages ({stats["bytes"]:,} bytes) to '{args.output}'")
+    print(f"Multi-line: {stats["multiline"]}, color-coded: {stats["color_coded"]}, duplicates: {stats["duplicates"]}")
+    print(f"Malformed (fixable/unfixable): " + ", ".join(f"{language} {stats["fixable"][language]}/{stats["unfixable"][language]}"
+                                                        for language in stats["languages"]))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
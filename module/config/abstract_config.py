@@ -10,9 +10,6 @@ class BaseConfig(ABC):
     @abstractmethod
     def _validateLoad(self, raw_config: dict) -> dict[str, Any]: ...
 
-    @abstractmethod
-    def _validate(self, save_config: dict, config_name: str) -> dict[str, Any]: ...
-
     @abstractmethod
     def getConfig(self) -> dict[str, Any]: ...
 
@@ -29,4 +26,7 @@ class BaseConfig(ABC):
     def setValue(self, key: str, value: Any, config_name: str) -> Literal[1] | None: ...
 
     @abstractmethod
-    def saveConfig(self) -> None: ...
\ No newline at end of file
+    def saveConfig(self) -> None: ...
+
+    @abstractmethod
+    def flushConfig(self) -> None: ...
\ No newline at end of file
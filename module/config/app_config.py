@@ -1,37 +1,59 @@
-import traceback
+from copy import deepcopy
 from typing import Any, Mapping, Optional, Self, override
-from time import time
 
+from app.common.config_subscriptions import configSubscriptions
 from app.common.signal_bus import signalBus
 
 from module.config.abstract_config import BaseConfig
 from module.config.internal.app_args import AppArgs
-from module.config.tools.config_tools import checkMissingFields, loadConfig, validateValue, retrieveDictValue, writeConfig
-from module.config.tools.validation_model_gen import ValidationModelGenerator
+from module.config.tools.config_tools import (checkMissingFields, loadConfig, validateFieldValue,
+                                             buildKeyIndex, retrieveIndexedValue)
+from module.config.tools.config_writer import ConfigWriter
+from module.config.tools.model_cache import ModelCache
 from module.config.templates.app_template import AppTemplate
 from module.logger import logger
+from module.tools.types.general import Model
 
 
 class AppConfig(BaseConfig):
     _instance = None
     _logger = logger
-    _validation_model = ValidationModelGenerator().getGenericModel(
-        model_name=AppTemplate().getTemplateName(),
-        template=AppTemplate().getTemplate()
-    )
+    _validation_model = None # Generated on first validation as it is slow to generate
 
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._config_name = AppTemplate().getTemplateName()
+            cls._model_cache = ModelCache(cls._config_name, AppTemplate().getTemplate())
             cls._load_failure = False # The config failed to load
             cls._is_modified = False # A modified config needs to be written to disk
-            cls._lastSaveTime = time()
             cls._config_path = AppArgs.app_config_path
-            cls._internal_config = cls._validation_model.model_construct().model_dump()
+            cls._writer = ConfigWriter(
+                config_name=cls._config_name,
+                config_path=cls._config_path,
+                delay=AppArgs.config_save_debounce_ms / 1000,
+                on_failure=lambda: signalBus.configStateChange.emit(False, "Failed to save the config", "Check the log for details"),
+                # A written config is valid, so it need not be validated when it is loaded on the next launch
+                on_written=lambda config: cls._model_cache.setValidatedConfig(config, config)
+            )
+            cls._internal_config = cls._model_cache.getInternalConfig()
+            if cls._internal_config is None:
+                cls._internal_config = cls._instance._getValidationModel().model_construct().model_dump()
+                cls._model_cache.setInternalConfig(cls._internal_config)
+            cls._internal_config_index = buildKeyIndex(cls._internal_config)
             cls._config = cls._instance._initConfig()
+            cls._config_index = buildKeyIndex(cls._config)
         return cls._instance
 
+    def _getValidationModel(self) -> type[Model]:
+        if self._validation_model is None:
+            from module.config.tools.validation_model_gen import ValidationModelGenerator
+            AppConfig._validation_model = ValidationModelGenerator().getGenericModel(
+                model_name=self._config_name,
+                template=AppTemplate().getTemplate()
+            )
+        return self._validation_model
+
     @override
     def _initConfig(self) -> dict[str, Any] | None:
         """Load the App's main config file.
@@ -42,24 +64,26 @@ class AppConfig(BaseConfig):
             The config file as a Python object
         """
         config, self._load_failure = loadConfig(
-            config_name=self._validation_model.__name__,
+            config_name=self._config_name,
             config_path=self._config_path,
             validator=self._validateLoad,
             internal_config=self._internal_config
         )
+        if config is self._internal_config:
+            # Settings are updated in-place, which must not change the defaults
+            config = deepcopy(config)
         return config
 
     @override
     def _validateLoad(self, raw_config: Mapping) -> dict[str, Any]:
-        validated_config = self._validation_model.model_validate(raw_config)
-        config = validated_config.model_dump()
-        checkMissingFields(raw_config, config)
+        config = self._model_cache.getValidatedConfig(raw_config)
+        if config is None:
+            validated_config = self._getValidationModel().model_validate(raw_config)
+            config = validated_config.model_dump()
+            checkMissingFields(raw_config, config)
+            self._model_cache.setValidatedConfig(raw_config, config)
         return config
 
-    @override
-    def _validate(self, save_config: dict, config_name: str) -> dict[str, Any]:
-        self._config = self._validation_model.model_validate(save_config).model_dump()
-
     @override
     def getConfig(self) -> dict[str, Any] | None:
         return self._config
@@ -78,11 +102,18 @@ class AppConfig(BaseConfig):
         """
         Return first value found. If there is no item with that key, return
         default.
+
+        Has support for defining search scope with the parent key.
+        A value will only be returned if it is within parent key's scope.
+        The name of the config is the root scope, i.e. it does not limit the search.
         """
-        config = self._internal_config if use_internal_config else self._config
-        value = retrieveDictValue(
-            d=config,
+        if parent_key == self._config_name:
+            parent_key = None
+        index = self._internal_config_index if use_internal_config else self._config_index
+        value = retrieveIndexedValue(
+            index=index,
             key=key,
+            parent_key=parent_key,
             default=default
         )
         if value is None:
@@ -92,30 +123,30 @@ class AppConfig(BaseConfig):
 
     @override
     def setValue(self, key: str, value: Any, config_name: str) -> None:
-        """ Update config with value """
-        isError, isInvalid = validateValue(
+        """ Update config with value. Only the setting is validated, not the entire config """
+        isError, isInvalid = validateFieldValue(
             config_name=config_name,
-            config=self._config,
-            validator=self._validate,
+            index=self._config_index,
+            model=self._getValidationModel(),
             setting=key,
             value=value
         )
         if isError:
             signalBus.configStateChange.emit(False, "Failed to save setting", "")
         else:
-            signalBus.configUpdated.emit(key, (value,))
+            configSubscriptions.publish(key, value)
             self._is_modified = True
+            self.saveConfig()
         return isInvalid
 
     @override
     def saveConfig(self) -> None:
-        """ Write config to disk """
-        try:
-            if self._is_modified and (self._lastSaveTime + 1) < time():
-                self._lastSaveTime = time()
-                writeConfig(self.getConfig(), self._config_path)
-                self._is_modified = False
-        except Exception:
-            msg = "Failed to save the config"
-            self._logger.error(f"{msg}\n" + traceback.format_exc(limit=AppArgs.traceback_limit))
-            signalBus.configStateChange.emit(False, msg, "Check the log for details")
\ No newline at end of file
+        """ Write config to disk in the background once it has not changed for a while """
+        if self._is_modified:
+            self._is_modified = False
+            self._writer.schedule(self.getConfig())
+
+    def flushConfig(self) -> None:
+        """ Write any pending changes to disk now. Call before exiting """
+        self.saveConfig()
+        self._writer.flush()
\ No newline at end of file
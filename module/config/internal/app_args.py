@@ -55,6 +55,16 @@ class AppArgs():
     log_dir = Path(app_dir, "logs")
     log_format = "%(asctime)s - %(module)s - %(lineno)s - %(levelname)s - %(message)s" # %(asctime)s - %(name)s - %(levelname)s - %(message)s'
     log_format_color = "%(asctime)s - %(module)s - %(lineno)s - %(levelname)s - %(message)s" # %(asctime)s - %(module)s - %(lineno)s - %(levelname)s - %(message)s'
+    log_max_bytes = 5 << 20 # Rotate the log file when it grows larger than this
+    log_backup_count = 3 # The number of rotated log files kept
+
+    # Config
+    config_save_debounce_ms = 1000 # Wait for changes to settle before writing the config to disk
+
+    # Profiling
+    import_report_size = 15 # The number of slowest imports reported when profiling imports
+    trace_max_events = 1_000_000 # Spans recorded after this many are dropped to bound memory use
+    perf_report_size = 25 # The number of functions and allocation sites reported per stage in performance debug mode
 
     # Template Settings
     config_units = {
@@ -75,6 +85,14 @@ class AppArgs():
 
     # Data
     data_dir = Path(app_dir, "data")
+    model_cache_dir = Path(data_dir, "cache") # Validation info of templates, reused across launches
+    xml_write_chunk_size = 1 << 20 # Characters written to the output XML file at a time
+    validation_debounce_ms = 250 # Wait for edits to settle before validating the preview
+
+    # Translation
+    translator_url = "http://localhost:5000/translate"
+    translator_batch_size = 32
+    translation_memory_path = Path(data_dir, "translation_memory.json")
 
     # Template values - these are present to decouple several modules (logger, validators) from
     # the app template to prevent circular imports. NOT ideal, but a workaround for now
@@ -91,4 +109,9 @@ class AppArgs():
     template_langTags = [
         "english",
         "schinese"
-    ]
\ No newline at end of file
+    ]
+    # Maps XML language tags to the language codes used by the translator
+    translator_langCodes = {
+        "english": "en",
+        "schinese": "zh-Hans"
+    }
\ No newline at end of file
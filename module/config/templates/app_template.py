@@ -142,11 +142,44 @@ class AppTemplate(BaseTemplate):
                         validateLangTag
                     ]
                 },
+                "glossaryLocation": {
+                    "ui_type": UITypes.FILE_SELECTION,
+                    "ui_title": "Select glossary term base",
+                    "ui_desc": "Glossary terms are translated locally. One term per line: the source term and its translation separated by a tab (or comma in csv files)",
+                    "ui_file_filter": "Term bases (*.tsv *.csv *.txt *.json)",
+                    "default": "",
+                    "validators": [
+                        validatePath
+                    ]
+                },
+                "maskPlaceholders": {
+                    "ui_title": "Mask placeholders and numbers during translation",
+                    "ui_desc": "Texts which only differ by numbers share translations. Also prevents the translator from mangling placeholders",
+                    "default": True
+                },
+                "segmentSentences": {
+                    "ui_title": "Translate long texts sentence by sentence",
+                    "ui_desc": "Edited texts only retranslate the changed sentences",
+                    "default": True
+                },
+                "fuzzyMatchThreshold": {
+                    "ui_type": UITypes.SLIDER,
+                    "ui_title": "Minimum similarity of translation memory near-matches",
+                    "ui_desc": "Texts similar to a translated text reuse its translation. A value of 0 disables near-matches",
+                    "default": 90,
+                    "min": 0,
+                    "max": 100
+                },
                 "debugXML": {
                     "ui_title": "Enable debug mode",
                     "ui_desc": "Useful for debugging the XML engine",
                     "default": False
                 },
+                "perfDebug": {
+                    "ui_title": "Enable performance debug mode",
+                    "ui_desc": "Profile the time and memory used by each stage of processing XML. Reports are saved in the log folder",
+                    "default": False
+                },
                 "colorCodeSep": {
                     "ui_title": "Exclude color codes from extraction",
                     "ui_desc": "Due to possible loss of text during translation, some color codes might still be included",
@@ -183,6 +216,16 @@ class AppTemplate(BaseTemplate):
                     "ui_title": "Add prefix to output XML file",
                     "ui_desc": "Can make it easier to discern translated files from non-translated",
                     "default": "TR_"
+                },
+                "spliceOutput": {
+                    "ui_title": "Keep the layout of the input XML file",
+                    "ui_desc": "Only the translated text is replaced, leaving whitespace and line endings untouched. Requires the language write tag to have the same entries as the extracted language",
+                    "default": True
+                },
+                "syncOnSave": {
+                    "ui_title": "Flush output XML file to disk when saving",
+                    "ui_desc": "Slower, but a saved file survives a system crash or power loss",
+                    "default": False
                 }
             }
         }
\ No newline at end of file
@@ -1,20 +1,19 @@
 import os
 import shutil
-import tomlkit
-import tomlkit.exceptions
 import json
+import tomllib
 import traceback
 
 from pathlib import Path
 from pydantic import ValidationError
-from typing import Any, Callable, Literal, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
 
 from module.config.internal.app_args import AppArgs
 from module.config.tools.ini_file_parser import IniFileParser
 from module.exceptions import IniParseError, InvalidMasterKeyError, MissingFieldError
 from module.logger import logger
-from module.tools.types.general import Model, StrPath, NestedDict
-from module.tools.utilities import formatValidationError
+from module.tools.types.general import Model, StrPath, NestedDict, KeyIndex
+from module.tools.utilities import formatValidationError, writeFileAtomically
 
 _logger_ = logger
 
@@ -48,7 +47,7 @@ def writeConfig(config: dict | Model, dst_path: StrPath, comments: Optional[Any]
     file = os.path.split(dst_path)[1]
     extension = os.path.splitext(dst_path)[1].strip(".")
     try:
-        if isinstance(config, Model):
+        if hasattr(config, "model_dump"): # A validation model instance
             config = config.model_dump()
         if sort and isinstance(config, dict):
             config = dict(sorted(config.items())) # Sort the dictionary by section, i.e. top-level keys
@@ -84,6 +83,8 @@ def _generateTOMLconfig(config: dict, dstPath: StrPath, comments: Any) -> None:
         Comments associated with the settings in the config.
     """
     fileName = os.path.split(dstPath)[1]
+    import tomlkit # Imported on first use as it is slow to import
+
     doc = tomlkit.document()
     prevWasComment = False
     for section, keys in config.items():
@@ -102,9 +103,8 @@ def _generateTOMLconfig(config: dict, dstPath: StrPath, comments: Any) -> None:
             table.append(key, keys[key])
         doc.append(section, table)
 
-    with open(dstPath, "w", encoding="utf-8") as file:
-        _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
-        tomlkit.dump(doc, file)
+    _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
+    writeFileAtomically(dstPath, [tomlkit.dumps(doc)])
 
 
 def _generateINIconfig(config: dict, dstPath: StrPath) -> None:
@@ -129,9 +129,8 @@ def _generateINIconfig(config: dict, dstPath: StrPath) -> None:
         table += "\n"
         iniConfig += f"[{section}]" + "\n" + table
 
-    with open(dstPath, "w", encoding="utf-8") as file:
-        _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
-        file.write(iniConfig)
+    _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
+    writeFileAtomically(dstPath, [iniConfig])
 
 
 def _generateJSONConfig(config: dict, dstPath: StrPath) -> None:
@@ -146,9 +145,8 @@ def _generateJSONConfig(config: dict, dstPath: StrPath) -> None:
         Note: the file does not have to exist.
     """
     fileName = os.path.split(dstPath)[1]
-    with open(dstPath, "w", encoding="utf-8") as file:
-        _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
-        file.write(json.dumps(config, indent=4))
+    _logger_.debug(f"Writing '{fileName}' to '{dstPath}'")
+    writeFileAtomically(dstPath, [json.dumps(config, indent=4)])
 
 
 def backupConfig(srcPath: StrPath) -> None:
@@ -287,57 +285,72 @@ def retrieveDictValue(d: dict, key: str, parent_key: Optional[str]=None, default
     return (found_value, immediate_parent) if get_parent_key else found_value
 
 
-def insertDictValue(input: dict, key: str, value: Any, parent_key: Optional[str]=None) -> list | None:
-    """
-    Recursively look for key in input.
-    If found, replace the original value with the provided value and return the original value.
+def buildKeyIndex(d: dict) -> KeyIndex:
+    """Map every key of a nested dictionary to the dictionaries containing it.
 
-    Has support for defining search scope with the parent key.
-    Value will only be returned if it is within parent key's scope.
+    The index allows looking up keys in constant time with the same semantics as `retrieveDictValue`.
+    It references the containing dictionaries, so values updated in-place are reflected in lookups.
+    It must be rebuilt if keys are added or removed, or if a containing dictionary is replaced.
 
-    Causes side-effects!
+    Parameters
     ----------
-    Modifies input in-place (i.e. does not return input).
+    d : dict
+        The dictionary to index.
+
+    Returns
+    -------
+    KeyIndex
+        Maps each key to a list of (parent keys, containing dictionary) in depth-first order.
+    """
+    index = {} # type: KeyIndex
+    # Traverse in the same depth-first order as retrieveDictValue
+    stack = [(d, iter(d.items()))]
+    parent_keys = () # type: tuple[str, ...]
+    while stack:
+        container, items = stack[-1]
+        for k, v in items:
+            index.setdefault(k, []).append((parent_keys, container))
+            if isinstance(v, dict):
+                stack.append((v, iter(v.items())))
+                parent_keys += (k,)
+                break
+        else:
+            stack.pop()
+            parent_keys = parent_keys[:-1]
+    return index
+
+
+def retrieveIndexedValue(index: KeyIndex, key: str, parent_key: Optional[str]=None, default: Any=None) -> Any:
+    """Return the first value found using an index created by `buildKeyIndex`.
+    If key does not exists, return default.
+
+    Has support for defining search scope with the parent key.
+    A value will only be returned if it is within parent key's scope
 
     Parameters
     ----------
-    input : dict
-        The dictionary to search in.
+    index : KeyIndex
+        The index of the dictionary to search for key.
 
     key : str
-        The key to look for.
-
-    value : Any
-        The value to insert.
+        The key to search for.
 
     parent_key : str, optional
         Limit the search scope to the children of this key.
-        By default None.
+
+    default : Any, optional
+        The value to return if the key was not found.
+        Defaults to None.
 
     Returns
     -------
-    list | None
-        The replaced old value, if found. Otherwise, None.
+    Any
+        The value mapped to the key, if it exists. Otherwise, default.
     """
-    old_value = []  # Modified in-place by traverseDict
-    parentKeys = []
-    def traverseDict(_input: dict, _key, _value, _parent_key) -> list | None:
-        for k, v in _input.items():
-            if isinstance(v, dict):
-                parentKeys.append(k)
-                traverseDict(v, _key, _value, _parent_key)
-            elif k == _key:
-                if parent_key:
-                    if _parent_key in parentKeys:
-                        _input[k] = _value
-                        old_value.append(v)
-                        break
-                _input[k] = _value
-                old_value.clear()
-                old_value.append(v)
-                break
-    traverseDict(input, key, value, parent_key)
-    return old_value if len(old_value) > 0 else None
+    for parent_keys, container in index.get(key, ()):
+        if not parent_key or parent_key in parent_keys:
+            return container[key]
+    return default
 
 
 def loadConfig(config_name: str, config_path: StrPath, validator: Callable[[Mapping], dict[str, Any]],
@@ -390,7 +403,8 @@ def loadConfig(config_name: str, config_path: StrPath, validator: Callable[[Mapp
     try:
         with open(config_path, "rb") as file:
             if extension.lower() == "toml":
-                raw_config = tomlkit.load(file)
+                # The standard library parser is faster to import and parse with. tomlkit is only used to write
+                raw_config = tomllib.load(file)
             elif extension.lower() == "ini":
                 raw_config = IniFileParser.load(file)
             elif extension.lower() == "json":
@@ -422,7 +436,7 @@ def loadConfig(config_name: str, config_path: StrPath, validator: Callable[[Mapp
         if doWriteConfig:
             backupConfig(config_path)
             writeConfig(internal_config, config_path)
-    except (tomlkit.exceptions.ParseError, IniParseError) as err:
+    except (tomllib.TOMLDecodeError, IniParseError) as err:
         isError, isRecoverable = True, True
         _logger_.warn(f"{config_name}: Failed to parse '{filename}':\n"
                       + f"  {err.args[0]}\n")
@@ -464,42 +478,58 @@ def loadConfig(config_name: str, config_path: StrPath, validator: Callable[[Mapp
         return config, failure
 
 
-def validateValue(config_name: str, config: dict, validator: Callable[[dict], dict],
-              setting: str, value: Any, parent_key: Optional[str]=None) -> tuple[bool, Literal[1] | None]:
-    """Validate a value in the supplied config.
+def validateFieldValue(config_name: str, index: KeyIndex, model: type[Model], setting: str, value: Any,
+                       parent_key: Optional[str]=None) -> tuple[bool, bool]:
+    """Validate a value against the field of its setting only, and update the config in-place if it is valid.
+
+    The rest of the config is not revalidated.
 
     Parameters
     ----------
-    config : dict
-        A Python config object.
+    config_name : str
+        The name of the config.
 
-    validator : Callable[[dict], dict]
-        The validator callable which validates the config.
+    index : KeyIndex
+        The index of the config, created by `buildKeyIndex`.
 
-    key : str
+    model : type[Model]
+        The validation model of the config.
+
+    setting : str
         The key whose value should be updated.
 
     value : Any
-        The value whose should be saved.
+        The value which should be saved.
+
+    parent_key : str, optional
+        Limit the search scope to the children of this key.
+        By default None.
 
     Returns
     -------
-    tuple[bool, Literal[1] | None]
+    tuple[bool, bool]
         Returns a tuple of values:
         * [0]: True if an error occured. Otherwise, False.
-        * [1]: 1 if a validation error occurred. Otherwise, None.
+        * [1]: False if a validation error occurred. Otherwise, True.
     """
     isError, isValid = False, True
     try:
-        old_value = insertDictValue(config, setting, value, parent_key=parent_key)
-        if old_value is None:
+        occurrence = next((occurrence for occurrence in index.get(setting, ())
+                           if not parent_key or parent_key in occurrence[0]), None)
+        if occurrence is None:
             error_msg = f"{config_name}: Could not find setting '{setting}'"
             raise KeyError(error_msg)
 
-        validator(config, config_name)
+        parent_keys, container = occurrence
+        field_model = model
+        for section in parent_keys: # Each section of the config is validated by a submodel
+            field_model = field_model.model_fields[section].annotation
+        # Only the field and its validators are run. The constructed instance is discarded
+        instance = field_model.model_construct()
+        field_model.__pydantic_validator__.validate_assignment(instance, setting, value)
+        container[setting] = getattr(instance, setting)
     except ValidationError as err:
         isError, isValid = True, False
-        insertDictValue(config, setting, old_value[0]) # Restore value
         _logger_.warn(f"{config_name}: Unable to save value '{value}' for setting '{setting}': "
                       + formatValidationError(err))
     except Exception:
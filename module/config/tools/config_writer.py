@@ -0,0 +1,96 @@
+import threading
+import time
+import traceback
+from copy import deepcopy
+from typing import Any, Callable, Optional
+
+from module.config.internal.app_args import AppArgs
+from module.config.tools.config_tools import writeConfig
+from module.logger import logger
+from module.tools.types.general import StrPath
+
+
+class ConfigWriter():
+    _logger = logger
+
+    def __init__(self, config_name: str, config_path: StrPath, delay: float,
+                 on_failure: Optional[Callable[[], None]]=None,
+                 on_written: Optional[Callable[[dict[str, Any]], None]]=None) -> None:
+        """Write a config to disk in a background thread once it has not changed for a while.
+
+        The last scheduled config is always written, either when the delay has passed or when flushed.
+
+        Parameters
+        ----------
+        config_name : str
+            The name of the config.
+
+        config_path : StrPath
+            Path-like object pointing to the config file.
+
+        delay : float
+            Seconds to wait after the last change before writing.
+
+        on_failure : Callable[[], None], optional
+            Called, from the writing thread, if the config could not be written.
+            By default None.
+
+        on_written : Callable[[dict[str, Any]], None], optional
+            Called, from the writing thread, with the config after it was written.
+            By default None.
+        """
+        self._config_name = config_name
+        self._config_path = config_path
+        self._delay = delay
+        self._on_failure = on_failure
+        self._on_written = on_written
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock() # Serializes writes of the thread and flushes
+        self._pending_config = None # type: dict[str, Any] | None
+        self._deadline = 0.0
+        self._thread = None # type: threading.Thread | None
+
+    def schedule(self, config: dict[str, Any]) -> None:
+        """ Write a copy of the config once no other config has been scheduled for the delay """
+        config = deepcopy(config) # The config may be changed while it is written
+        with self._condition:
+            self._pending_config = config
+            self._deadline = time.monotonic() + self._delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"{self._config_name}ConfigWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """ Write the pending config now, on the calling thread. Waits for a write in progress """
+        with self._write_lock:
+            with self._condition:
+                config, self._pending_config = self._pending_config, None
+            if config is not None:
+                self._write(config)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending_config is None or time.monotonic() < self._deadline:
+                    timeout = None if self._pending_config is None else self._deadline - time.monotonic()
+                    self._condition.wait(timeout)
+            with self._write_lock:
+                with self._condition:
+                    # Another change may have arrived, or a flush taken the config, while waiting for the lock
+                    if self._pending_config is None or time.monotonic() < self._deadline:
+                        continue
+                    config, self._pending_config = self._pending_config, None
+                self._write(config)
+
+    def _write(self, config: dict[str, Any]) -> None:
+        try:
+            writeConfig(config, self._config_path)
+        except Exception:
+            self._logger.error(f"{self._config_name}: Failed to save the config\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+            if self._on_failure:
+                self._on_failure()
+        else:
+            if self._on_written:
+                self._on_written(config)
\ No newline at end of file
@@ -0,0 +1,139 @@
+import hashlib
+import importlib
+import json
+import threading
+import traceback
+from copy import deepcopy
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.metrics import Metrics
+from module.tools.types.general import StrPath
+from module.tools.utilities import writeFileAtomically
+
+
+def _describe(obj: Any) -> str:
+    """ A representation of template values which is stable across launches, unlike e.g. the repr of functions """
+    if isinstance(obj, Enum):
+        return f"{type(obj).__qualname__}.{obj.name}"
+    if callable(obj):
+        return f"{obj.__module__}:{obj.__qualname__}"
+    return repr(obj)
+
+
+def _hash(obj: Any) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=_describe).encode("utf-8")).hexdigest()
+
+
+class ModelCache():
+    _logger = logger
+    _version = 1 # Increment whenever the cache format or the way templates are validated changes
+    _lookups = Metrics().counter("config_model_cache_lookups_total", "Lookups of cached validated configs by result")
+
+    def __init__(self, template_name: str, template: dict[str, dict], cache_dir: Optional[StrPath]=None) -> None:
+        """Cache the information derived from a template across launches, so its validation model is only generated when needed.
+
+        The cache stores the internal config of the template, the validators of its settings and the last validated config.
+        It is discarded if the template, the app version or the cache version changes.
+
+        Parameters
+        ----------
+        template_name : str
+            The name of the template.
+
+        template : dict[str, dict]
+            The template.
+
+        cache_dir : StrPath, optional
+            The directory of the cache file.
+            By default None, which uses `AppArgs.model_cache_dir`.
+        """
+        self._template_name = template_name
+        self._path = Path(cache_dir or AppArgs.model_cache_dir, f"{template_name}_model_cache.json")
+        self._template_hash = _hash([self._version, AppArgs.app_version, template])
+        self._validators = {
+            section_name: {setting: [_describe(validator) for validator in options["validators"]]
+                           for setting, options in section.items() if "validators" in options}
+            for section_name, section in template.items()
+        } # type: dict[str, dict[str, list[str]]]
+        self._lock = threading.Lock() # The validated config may be updated from a config writer thread
+        self._entry = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            if entry.get("template_hash") == self._template_hash:
+                self._logger.debug(f"Template '{self._template_name}': Using cached validation info")
+                return entry
+            self._logger.debug(f"Template '{self._template_name}': Template changed. Discarding cached validation info")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self._logger.warn(f"Template '{self._template_name}': Failed to read cached validation info\n"
+                              + traceback.format_exc(limit=AppArgs.traceback_limit))
+        return {"template_hash": self._template_hash}
+
+    def _save(self) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            writeFileAtomically(self._path, [json.dumps(self._entry)])
+        except Exception:
+            self._logger.warn(f"Template '{self._template_name}': Failed to cache validation info\n"
+                              + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+    def getInternalConfig(self) -> dict[str, Any] | None:
+        return self._entry.get("internal_config")
+
+    def setInternalConfig(self, internal_config: dict[str, Any]) -> None:
+        with self._lock:
+            self._entry["internal_config"] = internal_config
+            self._save()
+
+    def getValidatedConfig(self, raw_config: Mapping) -> dict[str, Any] | None:
+        """Return the validated config of the raw config, if it was validated on a previous launch.
+
+        The validators of the settings are run again, as their outcome may depend on the environment, e.g. whether a file exists.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The validated config, or None if the raw config must be validated.
+        """
+        if self._entry.get("config") is None or self._entry.get("raw_config_hash") != _hash(raw_config):
+            self._lookups.inc(result="miss")
+            return None
+        config = deepcopy(self._entry["config"])
+        try:
+            for section_name, settings in self._validators.items():
+                for setting, validator_names in settings.items():
+                    for validator_name in validator_names:
+                        config[section_name][setting] = self._getValidator(validator_name)(config[section_name][setting])
+        except Exception:
+            # Let the validation model report the error
+            self._lookups.inc(result="invalid")
+            return None
+        self._lookups.inc(result="hit")
+        return config
+
+    def setValidatedConfig(self, raw_config: Mapping, config: dict[str, Any]) -> None:
+        """ Remember that the raw config validates to the config """
+        try:
+            raw_config_hash = _hash(raw_config)
+            json.dumps(config) # The config must be serializable to be cached
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            if self._entry.get("raw_config_hash") != raw_config_hash:
+                self._entry |= {"raw_config_hash": raw_config_hash, "config": deepcopy(config)}
+                self._save()
+
+    def _getValidator(self, name: str) -> Callable[[Any], Any]:
+        module_name, qualname = name.split(":")
+        validator = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            validator = getattr(validator, attribute)
+        return validator
\ No newline at end of file
@@ -1,14 +1,12 @@
 import logging
+import re
 
 
 class ColorCodeFilter(logging.Formatter):
+    _color_pattern = re.compile(r'\033\[[0-9;]+m')
+
     def format(self, record) -> str:
-        log_message = record.getMessage()
-        record.msg = self._remove_color_codes(log_message)
-        record.levelname = self._remove_color_codes(record.levelname)
-        return super().format(record)
+        return self._remove_color_codes(super().format(record))
 
     def _remove_color_codes(self, message) -> str:
-        import re
-        color_pattern = re.compile(r'\033\[[0-9;]+m')
-        return color_pattern.sub('', message)
+        return self._color_pattern.sub('', message)
\ No newline at end of file
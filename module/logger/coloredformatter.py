@@ -17,5 +17,9 @@ class ColoredFormatter(logging.Formatter):
         log_level = record.levelname
         color_start = self.COLORS.get(log_level, self.COLORS['RESET'])
         color_end = self.COLORS['RESET']
+        # The record is shared by all handlers, so it is restored once formatted
         record.levelname = f"{color_start}{log_level}{color_end}"
-        return super().format(record)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = log_level
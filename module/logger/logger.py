@@ -1,9 +1,12 @@
+import atexit
 import re
 import logging
 import os
 
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
+from queue import SimpleQueue
 from typing import Self
 
 from module.logger.coloredformatter import ColoredFormatter
@@ -12,12 +15,31 @@ from module.config.internal.app_args import AppArgs
 from module.config.internal.names import ModuleNames
 
 
+class _LazyQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue does not leave the process, so the message is formatted
+        # by the listener thread instead of by the logging thread
+        return record
+
+
+class _LoggerFormatter(logging.Formatter):
+    def __init__(self, default: logging.Formatter, formatters: dict[str, logging.Formatter]) -> None:
+        """ Format the records of some loggers with their own formatter """
+        super().__init__()
+        self._default = default
+        self._formatters = formatters
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self._formatters.get(record.name, self._default).format(record)
+
+
 class Logger():
     _instance = None
 
     def __new__(cls) -> Self:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._create_listener()
             cls._instance._create_logger(cls._instance._getConfigLoglevel(AppArgs.app_config_path))
             cls._instance._create_logger_title()
             cls._instance._writeHeaderToLog()
@@ -27,44 +49,55 @@ class Logger():
         # return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         return datetime.now().strftime("%Y-%m-%d")
 
+    def _create_listener(self) -> None:
+        """ Records are handled in a background thread so logging never waits on the console or the file """
+        if not AppArgs.log_dir.exists():
+            AppArgs.log_dir.mkdir()
+        title_name = f"{ModuleNames.app_name}_title"
+        title_formatter = logging.Formatter('%(message)s')
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_LoggerFormatter(ColoredFormatter(AppArgs.log_format_color), {title_name: title_formatter}))
+
+        file_handler = RotatingFileHandler(
+            f"{AppArgs.log_dir}{os.sep}{self._current_datetime()}.log",
+            maxBytes=AppArgs.log_max_bytes,
+            backupCount=AppArgs.log_backup_count,
+            encoding="utf-8"
+        )
+        file_handler.setFormatter(_LoggerFormatter(ColorCodeFilter(AppArgs.log_format), {title_name: title_formatter}))
+
+        self._handlers = (console_handler, file_handler)
+        self._queue_handler = _LazyQueueHandler(SimpleQueue())
+        self._listener = QueueListener(self._queue_handler.queue, *self._handlers) # type: QueueListener | None
+        self._listener.start()
+        atexit.register(self.flush)
+
     def _create_logger(self, level) -> logging.Logger:
         self.logger = logging.getLogger(ModuleNames.app_name)
         self.logger.propagate = False
         self.logger.setLevel(level)
-
-        console_handler = logging.StreamHandler()
-        console_formatter = ColoredFormatter(AppArgs.log_format_color)
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-
-        if not AppArgs.log_dir.exists():
-            AppArgs.log_dir.mkdir()
-        file_handler = logging.FileHandler(f"{AppArgs.log_dir}{os.sep}{self._current_datetime()}.log", encoding="utf-8")
-        file_formatter = ColorCodeFilter(AppArgs.log_format)
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
-
+        self.logger.addHandler(self._queue_handler)
         return self.logger
 
     def _create_logger_title(self, level="INFO") -> logging.Logger:
         self.logger_title = logging.getLogger(f"{ModuleNames.app_name}_title")
         self.logger_title.propagate = False
         self.logger_title.setLevel(level)
-
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter('%(message)s')
-        console_handler.setFormatter(console_formatter)
-        self.logger_title.addHandler(console_handler)
-
-        if not AppArgs.log_dir.exists():
-            AppArgs.log_dir.mkdir()
-        file_handler = logging.FileHandler(f"{AppArgs.log_dir}{os.sep}{self._current_datetime()}.log", encoding="utf-8")
-        file_formatter = logging.Formatter('%(message)s')
-        file_handler.setFormatter(file_formatter)
-        self.logger_title.addHandler(file_handler)
-
+        self.logger_title.addHandler(self._queue_handler)
         return self.logger_title
 
+    def flush(self) -> None:
+        """ Handle all queued records. Logging continues synchronously afterwards """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            # Records logged after stopping, e.g. during shutdown, are handled directly
+            for logger in (self.logger, self.logger_title):
+                logger.removeHandler(self._queue_handler)
+                for handler in self._handlers:
+                    logger.addHandler(handler)
+
     def _writeHeaderToLog(self) -> None:
         padding = 90
         header = "┌" + "─"*padding + "┐" + "\n" + \
@@ -0,0 +1,309 @@
+import json
+import math
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional, Self
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.general import StrPath
+from module.tools.utilities import writeFileAtomically
+
+
+type Labels = tuple[tuple[str, str], ...]
+
+
+def _labelKey(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _formatLabels(labels: Labels, extra: Labels=()) -> str:
+    labels = labels + extra
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f"{name}=\"{value}\"" for (name, _), value in zip(labels, escaped)) + "}"
+
+
+def _formatNumber(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class _Metric():
+    type = ""
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self._samples = {} # type: dict[Labels, Any]
+        self._lock = threading.Lock()
+
+    def getSamples(self) -> list[tuple[dict[str, str], Any]]:
+        with self._lock:
+            return [(dict(labels), self._snapshot(sample)) for labels, sample in self._samples.items()]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def _snapshot(self, sample: Any) -> Any:
+        return sample
+
+    def toPrometheus(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            for labels, value in self._samples.items():
+                lines.append(f"{self.name}{_formatLabels(labels)} {_formatNumber(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """ A value which only increases, e.g. the number of translator requests """
+    type = "counter"
+
+    def inc(self, amount: float=1, **labels: Any) -> None:
+        key = _labelKey(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+    def getValue(self, **labels: Any) -> float:
+        return self._samples.get(_labelKey(labels), 0)
+
+
+class Gauge(_Metric):
+    """ A value which is set to the latest measurement, e.g. the throughput of the last run """
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = _labelKey(labels)
+        with self._lock:
+            self._samples[key] = value
+
+    def getValue(self, **labels: Any) -> float | None:
+        return self._samples.get(_labelKey(labels))
+
+
+class _HistogramData():
+    __slots__ = ("buckets", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets = {} # type: dict[int, int]
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+
+class _Timer():
+    __slots__ = ("_histogram", "_labels", "_start", "elapsed")
+
+    def __init__(self, histogram: "Histogram", labels: dict[str, Any]) -> None:
+        self._histogram = histogram
+        self._labels = labels
+        self._start = 0.0
+        self.elapsed = 0.0
+
+    def __enter__(self) -> Self:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        self._histogram.observe(self.elapsed, **self._labels)
+
+
+class Histogram(_Metric):
+    """ The distribution of a value, e.g. request latency, with a bounded relative error like an HDR histogram.
+
+    Values are counted in buckets whose width grows with their magnitude, so the number of buckets
+    grows with the logarithm of the recorded range while each bucket stays within the configured precision.
+    Exported to Prometheus as a summary of quantiles """
+    type = "summary"
+    _quantiles = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, name: str, description: str, resolution: float=1e-6, significant_bits: int=7) -> None:
+        """
+        Parameters
+        ----------
+        resolution : float, optional
+            The smallest distinguishable difference between values, e.g. 1e-6 for microseconds
+            when recording seconds. By default 1e-6.
+
+        significant_bits : int, optional
+            The binary precision of each bucket. The relative error of quantiles is at most 2^-(significant_bits - 1),
+            i.e. below 1.6% by default. By default 7.
+        """
+        super().__init__(name, description)
+        self._resolution = resolution
+        self._significant_bits = significant_bits
+
+    def observe(self, value: float, **labels: Any) -> None:
+        units = max(int(value / self._resolution), 0)
+        shift = max(units.bit_length() - self._significant_bits, 0)
+        bucket = (units >> shift) << shift # The lowest value of the bucket
+        key = _labelKey(labels)
+        with self._lock:
+            data = self._samples.get(key)
+            if data is None:
+                data = self._samples[key] = _HistogramData()
+            data.buckets[bucket] = data.buckets.get(bucket, 0) + 1
+            data.count += 1
+            data.sum += value
+            data.min = min(data.min, value)
+            data.max = max(data.max, value)
+
+    def time(self, **labels: Any) -> _Timer:
+        """ Observe the duration of a `with` block in seconds. The duration is available as `elapsed` afterwards """
+        return _Timer(self, labels)
+
+    def _getQuantile(self, data: _HistogramData, buckets: list[tuple[int, int]], quantile: float) -> float:
+        rank = quantile * data.count
+        seen = 0
+        for bucket, count in buckets:
+            seen += count
+            if seen >= rank:
+                width = 1 << max(bucket.bit_length() - self._significant_bits, 0)
+                # The middle of the bucket, clamped to the recorded range
+                return min(max((bucket + width / 2) * self._resolution, data.min), data.max)
+        return data.max
+
+    def _snapshot(self, data: _HistogramData) -> dict[str, Any]:
+        buckets = sorted(data.buckets.items())
+        return {
+            "count": data.count,
+            "sum": data.sum,
+            "min": data.min,
+            "max": data.max,
+            "mean": data.sum / data.count,
+            "quantiles": {str(quantile): self._getQuantile(data, buckets, quantile) for quantile in self._quantiles}
+        }
+
+    def toPrometheus(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type}"]
+        for labels, snapshot in self.getSamples():
+            key = _labelKey(labels)
+            for quantile, value in snapshot["quantiles"].items():
+                lines.append(f"{self.name}{_formatLabels(key, (("quantile", quantile),))} {_formatNumber(value)}")
+            lines.append(f"{self.name}_sum{_formatLabels(key)} {_formatNumber(snapshot["sum"])}")
+            lines.append(f"{self.name}_count{_formatLabels(key)} {snapshot["count"]}")
+        return lines
+
+
+class Metrics():
+    """ The registry of all metrics of the application, e.g. translator throughput and cache hit rates.
+    Metrics are created on first use and shared by name """
+    _instance = None
+    _logger = logger
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._metrics = {} # type: dict[str, _Metric]
+            cls._lock = threading.Lock()
+            cls._start_time = time.time()
+        return cls._instance
+
+    def _getOrCreate[T: _Metric](self, metric_type: type[T], name: str, description: str, **kwargs: Any) -> T:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, description, **kwargs)
+            elif not isinstance(metric, metric_type):
+                raise TypeError(f"Metric '{name}' is a {metric.type}, not a {metric_type.type}")
+            return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._getOrCreate(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        return self._getOrCreate(Gauge, name, description)
+
+    def histogram(self, name: str, description: str, resolution: float=1e-6) -> Histogram:
+        return self._getOrCreate(Histogram, name, description, resolution=resolution)
+
+    def get(self, name: str) -> _Metric | None:
+        """ The metric of the name, if it was created """
+        return self._metrics.get(name)
+
+    def observeStage(self, stage: str, seconds: float, entries: Optional[int]=None) -> None:
+        """Record the duration of a pipeline stage and, if given, its throughput.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage, e.g. "parse".
+
+        seconds : float
+            The duration of the stage.
+
+        entries : int, optional
+            The number of entries the stage processed. By default None.
+        """
+        self.histogram("pipeline_stage_seconds", "Duration of each pipeline stage").observe(seconds, stage=stage)
+        if entries is not None:
+            self.counter("pipeline_entries_total", "Entries processed by each pipeline stage").inc(entries, stage=stage)
+            if seconds > 0:
+                self.gauge("pipeline_entries_per_second", "Throughput of the last run of each pipeline stage"
+                           ).set(entries / seconds, stage=stage)
+
+    def __iter__(self) -> Iterator[_Metric]:
+        with self._lock:
+            return iter(sorted(self._metrics.values(), key=lambda metric: metric.name))
+
+    def reset(self) -> None:
+        """ Clear the recorded values of all metrics """
+        for metric in self:
+            metric.reset()
+
+    def toDict(self) -> dict[str, Any]:
+        return {
+            "timestamp": time.time(),
+            "uptime": time.time() - self._start_time,
+            "metrics": {
+                metric.name: {
+                    "type": metric.type,
+                    "description": metric.description,
+                    "samples": [{"labels": labels, "value": value} for labels, value in metric.getSamples()]
+                } for metric in self
+            }
+        }
+
+    def toJSON(self) -> str:
+        return json.dumps(self.toDict(), indent=2, default=str)
+
+    def toPrometheus(self) -> str:
+        """ The metrics in the Prometheus text exposition format """
+        return "\n".join(line for metric in self for line in metric.toPrometheus()) + "\n"
+
+    def export(self, format: str="json", path: Optional[StrPath]=None) -> Path | None:
+        """Write the metrics to a file.
+
+        Parameters
+        ----------
+        format : str, optional
+            Either "json" or "prometheus". By default "json".
+
+        path : StrPath, optional
+            The file to write. By default None, which writes a timestamped file to `AppArgs.log_dir`.
+
+        Returns
+        -------
+        Path | None
+            The written file, or None if writing failed.
+        """
+        suffix = "json" if format == "json" else "prom"
+        path = Path(path or Path(AppArgs.log_dir, f"metrics_{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.{suffix}"))
+        try:
+            content = self.toJSON() if format == "json" else self.toPrometheus()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writeFileAtomically(path, [content])
+            self._logger.info(f"Wrote metrics to '{path}'")
+            return path
+        except Exception:
+            self._logger.error(f"Failed to write metrics to '{path}'\n" + traceback.format_exc(limit=AppArgs.traceback_limit))
+            return None
\ No newline at end of file
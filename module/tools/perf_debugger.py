@@ -0,0 +1,188 @@
+import cProfile
+import io
+import pstats
+import threading
+import time
+import traceback
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.config import BaseConfig
+from module.tools.utilities import writeFileAtomically
+
+
+class _Stage():
+    __slots__ = ("name", "calls", "seconds", "stats", "allocations", "peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.stats = None # type: pstats.Stats | None
+        # The size and number of blocks allocated by each allocation site
+        self.allocations = {} # type: dict[str, list[int]]
+        self.peak = 0
+
+
+class _Run():
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = time.perf_counter()
+        self.thread = threading.get_ident()
+        self.stages = {} # type: dict[str, _Stage]
+        # The profiler of each active stage. Only the innermost stage is profiled
+        self.profilers = [] # type: list[cProfile.Profile | None]
+        # The peak traced memory of each active stage. Tracemalloc only tracks a single peak, which each stage resets
+        self.peaks = [] # type: list[int]
+        self.peak = 0
+        self.started_tracemalloc = False
+
+
+class PerfDebugger():
+    _logger = logger
+    # Allocations made by the debugger itself. Filtered from the report rather than the snapshots, which is much faster
+    _ignored_files = frozenset((tracemalloc.__file__, __file__))
+
+    def __init__(self, config: BaseConfig) -> None:
+        """Profile runs of the pipeline with cProfile and tracemalloc while the `perfDebug` setting is enabled.
+
+        A run, e.g. translating a file, consists of stages, e.g. substituting. When a run finishes,
+        the profile and the largest allocations of each stage are reported in a file in the log directory,
+        along with the combined profile of the run, which can be opened with e.g. snakeviz.
+
+        Parameters
+        ----------
+        config : BaseConfig
+            The config containing the `perfDebug` setting.
+        """
+        self._config = config
+        self._run = None # type: _Run | None
+
+    def isEnabled(self) -> bool:
+        return bool(self._config.getValue("perfDebug"))
+
+    @contextmanager
+    def run(self, name: str) -> Iterator[None]:
+        """ Profile the stages inside the context as a run. Does nothing if disabled or already inside a run """
+        if self._run is not None or not self.isEnabled():
+            yield
+            return
+        self._run = _Run(name)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._run.started_tracemalloc = True
+        try:
+            yield
+        finally:
+            run, self._run = self._run, None
+            run.peak = max(run.peak, tracemalloc.get_traced_memory()[1])
+            if run.started_tracemalloc:
+                tracemalloc.stop()
+            self._report(run, time.perf_counter() - run.start)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """ Profile the context as a stage of the current run. Does nothing outside a run or on another thread """
+        run = self._run
+        if run is None or run.thread != threading.get_ident():
+            yield
+            return
+        stage = run.stages.get(name)
+        if stage is None:
+            stage = run.stages[name] = _Stage(name)
+        # Only one profiler can be active at a time. Time spent in nested stages is attributed to them alone
+        if run.profilers and run.profilers[-1] is not None:
+            run.profilers[-1].disable()
+        if run.peaks:
+            run.peaks[-1] = max(run.peaks[-1], tracemalloc.get_traced_memory()[1])
+        run.peaks.append(0)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool, e.g. a debugger, is active
+            profiler = None
+        run.profilers.append(profiler)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+            run.profilers.pop()
+            peak = max(run.peaks.pop(), tracemalloc.get_traced_memory()[1])
+            stage.peak = max(stage.peak, peak)
+            run.peak = max(run.peak, peak)
+            if run.peaks:
+                run.peaks[-1] = max(run.peaks[-1], peak)
+            after = tracemalloc.take_snapshot()
+            if run.profilers and run.profilers[-1] is not None:
+                run.profilers[-1].enable()
+            stage.calls += 1
+            stage.seconds += seconds
+            if profiler is not None:
+                if stage.stats is None:
+                    stage.stats = pstats.Stats(profiler)
+                else:
+                    stage.stats.add(profiler)
+            for diff in after.compare_to(before, "lineno"):
+                frame = diff.traceback[0]
+                if diff.size_diff > 0 and frame.filename not in self._ignored_files:
+                    allocation = stage.allocations.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                    allocation[0] += diff.size_diff
+                    allocation[1] += max(diff.count_diff, 0)
+
+    def _report(self, run: _Run, seconds: float) -> None:
+        report_size = AppArgs.perf_report_size
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        report_path = Path(AppArgs.log_dir, f"perf_{run.name}_{timestamp}.txt")
+        profile_path = report_path.with_suffix(".prof")
+        lines = [
+            f"Performance report of '{run.name}' ({timestamp})",
+            f"Total, including profiling overhead: {seconds:.3f}s, peak traced memory: {self._formatSize(run.peak)}",
+            "",
+            "Stages (duration | calls | peak traced memory | stage):"
+        ]
+        lines.extend(f"  {stage.seconds:>9.3f}s | {stage.calls:>5} | {self._formatSize(stage.peak):>10} | {stage.name}"
+                     for stage in sorted(run.stages.values(), key=lambda stage: stage.seconds, reverse=True))
+        combined_stats = pstats.Stats()
+        for stage in run.stages.values():
+            lines += ["", "=" * 100, f"Stage '{stage.name}': {stage.seconds:.3f}s in {stage.calls} "
+                      f"{"calls" if stage.calls != 1 else "call"}", "=" * 100, ""]
+            if stage.stats is None:
+                lines.append("Not profiled, as another profiler was active")
+            else:
+                stream = io.StringIO()
+                stage.stats.stream = stream
+                stage.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(report_size)
+                lines.append(stream.getvalue().strip("\n"))
+                combined_stats.add(stage.stats)
+            allocations = sorted(stage.allocations.items(), key=lambda allocation: allocation[1][0], reverse=True)
+            lines += ["", "Largest allocations still held at the end of the stage (size | blocks | site):"]
+            lines.extend(f"  {self._formatSize(size):>10} | {count:>8} | {site}" for site, (size, count) in allocations[:report_size])
+            if not allocations:
+                lines.append("  None")
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            writeFileAtomically(report_path, ["\n".join(lines) + "\n"])
+            if combined_stats.stats:
+                combined_stats.dump_stats(profile_path)
+            self._logger.info(f"Wrote performance report of '{run.name}' to '{report_path}'")
+        except Exception:
+            self._logger.error(f"Failed to write the performance report of '{run.name}'\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+    def _formatSize(self, size: int) -> str:
+        for unit in ("B", "KiB", "MiB"):
+            if abs(size) < 1024:
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GiB"
\ No newline at end of file
@@ -0,0 +1,74 @@
+import builtins
+import importlib.util
+import sys
+import time
+from typing import Any, Self
+
+
+class StartupProfiler():
+    """ Measures the time until the application is ready and, optionally, the time spent importing each module.
+    Create it as early as possible, i.e. before importing anything heavy """
+    _instance = None
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._start_time = time.perf_counter()
+            cls._startup_time = None # type: float | None
+            cls._original_import = None
+            # Time spent importing each module: [self time, cumulative time] in seconds
+            cls._import_times = {} # type: dict[str, list[float]]
+            # The time spent importing children of the modules currently being imported
+            cls._child_times = [] # type: list[float]
+        return cls._instance
+
+    def profileImports(self) -> None:
+        """ Record the import time of all modules imported from now on, similar to `python -X importtime` """
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timedImport
+
+    def _timedImport(self, name: str, globals: dict | None=None, locals: dict | None=None,
+                     fromlist: tuple=(), level: int=0) -> Any:
+        try:
+            module_name = importlib.util.resolve_name("." * level + name, globals.get("__package__")) if level else name
+        except (AttributeError, ImportError, ValueError):
+            module_name = name
+        if module_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._child_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            child_time = self._child_times.pop()
+            if self._child_times:
+                self._child_times[-1] += cumulative
+            self._import_times[module_name] = [cumulative - child_time, cumulative]
+
+    def finish(self) -> float:
+        """ Mark the application as ready and stop profiling imports. Returns the startup time in seconds """
+        if self._startup_time is None:
+            self._startup_time = time.perf_counter() - self._start_time
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        return self._startup_time
+
+    def isProfilingImports(self) -> bool:
+        return self._original_import is not None or bool(self._import_times)
+
+    def getStartupTime(self) -> float | None:
+        return self._startup_time
+
+    def getImportTimes(self, limit: int=-1) -> list[tuple[str, float, float]]:
+        """ The self and cumulative import time of each module in seconds, slowest (cumulative) first """
+        import_times = sorted(((name, *times) for name, times in self._import_times.items()),
+                              key=lambda item: item[2], reverse=True)
+        return import_times if limit == -1 else import_times[:limit]
+
+    def formatImportTimes(self, limit: int=-1) -> list[str]:
+        return [f"{cumulative*1000:8.1f} ms | {self_time*1000:8.1f} ms | {name}"
+                for name, self_time, cumulative in self.getImportTimes(limit)]
@@ -0,0 +1,185 @@
+import functools
+import json
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Self
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.general import StrPath
+from module.tools.utilities import writeFileAtomically
+
+
+class _Span():
+    __slots__ = ("_tracer", "name", "category", "args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def set(self, **args: Any) -> None:
+        """ Record arguments of the span, e.g. entry counts or bytes """
+        self.args.update(args)
+
+    def __enter__(self) -> Self:
+        self._tracer._getStack().append(self)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = time.perf_counter_ns()
+        self._tracer._getStack().pop()
+        if exc_info[0] is not None:
+            self.args["exception"] = exc_info[0].__name__
+        self._tracer._record(self, self._start, end)
+
+
+class _NullSpan():
+    """ Returned while tracing is disabled. Does nothing """
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_null_span = _NullSpan()
+
+
+class Tracer():
+    """ Records how long each stage of a run takes, as spans which are exported in the Chrome trace event format.
+    Open the exported file in chrome://tracing or https://ui.perfetto.dev.
+    While disabled, creating a span costs a single attribute check """
+    _instance = None
+    _logger = logger
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._enabled = False
+            cls._events = [] # type: list[dict[str, Any]]
+            cls._dropped_events = 0
+            cls._named_threads = set() # type: set[int]
+            cls._local = threading.local()
+            cls._lock = threading.Lock()
+            cls._origin = time.perf_counter_ns()
+        return cls._instance
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def span(self, name: str, category: str="pipeline", **args: Any) -> _Span | _NullSpan:
+        """Measure the duration of a `with` block.
+
+        Parameters
+        ----------
+        name : str
+            The name of the span, e.g. the name of the stage.
+
+        category : str, optional
+            Used to group spans in trace viewers. By default "pipeline".
+
+        **args : Any
+            Arguments of the span, e.g. entry counts or bytes. More can be added with `set` or `annotate`.
+        """
+        if not self._enabled:
+            return _null_span
+        return _Span(self, name, category, args)
+
+    def annotate(self, **args: Any) -> None:
+        """ Record arguments of the innermost span of the calling thread, e.g. the span of a traced function """
+        if self._enabled:
+            stack = self._getStack()
+            if stack:
+                stack[-1].args.update(args)
+
+    def _getStack(self) -> list[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: _Span, start: int, end: int) -> None:
+        tid = threading.get_native_id()
+        with self._lock:
+            if len(self._events) >= AppArgs.trace_max_events:
+                self._dropped_events += 1
+                return
+            if tid not in self._named_threads:
+                self._named_threads.add(tid)
+                self._events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                                     "args": {"name": threading.current_thread().name}})
+            self._events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": span.args
+            })
+
+    def getEvents(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self._events)
+
+    def export(self, path: Optional[StrPath]=None) -> Path | None:
+        """Write the recorded spans to a Chrome trace event file.
+
+        Parameters
+        ----------
+        path : StrPath, optional
+            The file to write. By default None, which writes a timestamped file to `AppArgs.log_dir`.
+
+        Returns
+        -------
+        Path | None
+            The written file, or None if nothing was recorded or writing failed.
+        """
+        events = self.getEvents()
+        if not events:
+            return None
+        path = Path(path or Path(AppArgs.log_dir, f"trace_{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.json"))
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if self._dropped_events:
+            trace["otherData"] = {"droppedEvents": self._dropped_events}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writeFileAtomically(path, [json.dumps(trace, default=str)])
+            self._logger.info(f"Wrote trace of {len(events)} events to '{path}'")
+            return path
+        except Exception:
+            self._logger.error(f"Failed to write trace to '{path}'\n" + traceback.format_exc(limit=AppArgs.traceback_limit))
+            return None
+
+
+def traced(name: Optional[str]=None, category: str="pipeline") -> Callable[[Callable], Callable]:
+    """ Record each call of the decorated function as a span. Defaults to the qualified name of the function """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        tracer = Tracer()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer._enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
\ No newline at end of file
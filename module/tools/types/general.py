@@ -1,8 +1,11 @@
 import os
-from typing import Any, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias
 
-from pydantic import BaseModel
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 StrPath: TypeAlias = str | os.PathLike[str]
-Model: TypeAlias = BaseModel
-type NestedDict = dict[str, dict[str, dict[str, Any]]]
\ No newline at end of file
+type Model = BaseModel # Lazily evaluated, as importing pydantic models is slow
+type NestedDict = dict[str, dict[str, dict[str, Any]]]
+# Maps a key to the parent keys and the containing dictionary of each of its occurrences
+type KeyIndex = dict[str, list[tuple[tuple[str, ...], dict[str, Any]]]]
@@ -1,4 +1,8 @@
-from typing import Any
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
 from pydantic import ValidationError
 from typing_extensions import Iterable
 
@@ -149,3 +153,66 @@ def formatListForDisplay(input: list[str], displayItems: int=15, join_string: st
 
     truncatedMsg = "" if silent else f"\n{join_string}(not showing {inputSize-displayItems} entries)" if doTruncate else ""
     return f"{join_string.join(input[0:displayItems] if doTruncate else input)}{truncatedMsg}"
+
+
+class LazyString():
+    def __init__(self, func: Callable[..., str], *args: Any, **kwargs: Any) -> None:
+        """ Build a string only when it is used, e.g. when a log record is actually formatted """
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return self._func(*self._args, **self._kwargs)
+
+
+# Reading the umask requires setting it, which is not thread-safe, so it is read once
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def writeFileAtomically(path: str | Path, chunks: Iterable[str | bytes], fsync: bool=False,
+                        encoding: str | None="utf-8") -> None:
+    """Write text to a file such that the file either keeps its old content or has the new content in full.
+
+    The text is written to a temporary file in the same directory, which then replaces the file.
+
+    Parameters
+    ----------
+    path : str | Path
+        The file to write.
+
+    chunks : Iterable[str | bytes]
+        The text to write. Each chunk is written as it is produced.
+        Bytes-like chunks require *encoding* to be None.
+
+    fsync : bool, optional
+        Flush the file to disk before replacing, so the new content survives a system crash.
+        By default False.
+
+    encoding : str | None, optional
+        None writes the chunks as bytes. By default "utf-8".
+    """
+    dst_dir, file_name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".tmp", dir=dst_dir)
+    try:
+        # The temporary file is private, so give it the permissions of the file it replaces,
+        # or those of a newly created file
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask
+        os.chmod(tmp_path, mode)
+        with open(fd, "w", encoding=encoding) if encoding else open(fd, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .translation_memory import TranslationMemory
+from .tm_importer import TMImporter
+from .translator import Translator
\ No newline at end of file
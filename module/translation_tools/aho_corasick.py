@@ -0,0 +1,81 @@
+from collections import deque
+from typing import Callable, Iterable, Iterator
+
+
+class AhoCorasick():
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Multi-pattern string matcher.
+        The automaton is built once and finds all patterns in a single pass over the text,
+        regardless of the number of patterns.
+
+        Parameters
+        ----------
+        patterns : Iterable[str]
+            The patterns to search for.
+        """
+        self._goto = [{}]  # type: list[dict[str, int]]  # Trie transitions of each node
+        self._fail = [0]   # type: list[int]             # Longest proper suffix of each node which is also in the trie
+        self._output = [()] # type: list[tuple[int, ...]] # Length of all patterns ending at each node, longest first
+        for pattern in patterns:
+            self._addPattern(pattern)
+        self._buildFailureLinks()
+
+    def _addPattern(self, pattern: str) -> None:
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] = (len(pattern),)
+
+    def _buildFailureLinks(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_node] = self._goto[fail].get(char, 0)
+                # Patterns ending at the failure node also end here
+                self._output[next_node] += self._output[self._fail[next_node]]
+
+    def iterMatches(self, text: str) -> Iterator[tuple[int, int]]:
+        """ Yield the (start, end) position of every pattern occurrence in text """
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length in output[node]:
+                yield i - length + 1, i + 1
+
+    def findLongest(self, text: str, accept: Callable[[int, int], bool] | None = None) -> list[tuple[int, int]]:
+        """Return the leftmost-longest, non-overlapping pattern occurrences in text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search.
+
+        accept : Callable[[int, int], bool] | None, optional
+            Called with the (start, end) position of an occurrence before selecting it.
+            Rejected occurrences are skipped, so they do not displace shorter or later occurrences.
+            By default all occurrences are accepted.
+        """
+        matches = sorted(self.iterMatches(text), key=lambda match: (match[0], -match[1]))
+        selected, last_end = [], 0
+        for start, end in matches:
+            if start >= last_end and (accept is None or accept(start, end)):
+                selected.append((start, end))
+                last_end = end
+        return selected
@@ -0,0 +1,180 @@
+from array import array
+from operator import eq
+from typing import Iterable
+
+
+class NGramIndex():
+    # MinHash values are kept below 2**30, which keeps them fast to compare.
+    # Each key holds the slot of its value in the signature above the value itself
+    _value_bits = 23
+    _value_mask = (1 << _value_bits) - 1
+
+    def __init__(self, n: int=3, bands: int=24, rows: int=7) -> None:
+        """Character n-gram index for fuzzy (near-match) lookup of segments.
+
+        Similarity is the Jaccard index of the n-gram sets of two segments.
+        Lookups use locality-sensitive hashing: the MinHash signature of each segment is split into bands,
+        and only segments sharing a band with the query are verified. Thus, the cost of a lookup hardly
+        depends on the size of the index. Lookups are approximate, as a segment of similarity s shares a band
+        with the query with probability 1 - (1 - s^rows)^bands. By default, that is 99.6% at 0.8 and 87% at 0.7.
+
+        Parameters
+        ----------
+        n : int, optional
+            The length of the n-grams, by default 3.
+
+        bands : int, optional
+            The number of bands of a signature. More bands find less similar segments,
+            but more dissimilar segments are verified. By default 24.
+
+        rows : int, optional
+            The number of MinHash values in each band. More rows verify fewer dissimilar segments,
+            but miss more similar segments. By default 7.
+        """
+        self._n = n
+        self._bands = bands
+        self._rows = rows
+        self._segments = [] # type: list[str]
+        self._grams = [] # type: list[array] # The n-gram IDs of each segment
+        self._gram_ids = {} # type: dict[str, int]
+        self._gram_keys = [] # type: list[tuple[int, ...]] # The MinHash key of each n-gram ID in each row
+        # The signature of an empty segment. Each value is greater than any key of its slot
+        self._empty_signature = [(slot + 1) << self._value_bits for slot in range(bands * rows)]
+        # A hash table of each band, chaining the segments in each bucket.
+        # The lower 32 bits of each band hash are kept to tell apart the segments of a bucket, and to resize the table
+        self._heads = [array("i", (-1,)) * 1024 for _ in range(bands)]
+        self._next = [array("i") for _ in range(bands)]
+        self._band_hashes = [array("I") for _ in range(bands)]
+
+    def _gramSet(self, text: str) -> set[str]:
+        padded = f" {text} "
+        if len(padded) <= self._n:
+            return {padded}
+        return {padded[i:i+self._n] for i in range(len(padded) - self._n + 1)}
+
+    def _gramKeys(self, gram: str) -> tuple[int, ...]:
+        """ The MinHash key of the n-gram in each row. Each row hashes the n-grams into one slot per band """
+        keys = []
+        for row in range(self._rows):
+            gram_hash = hash((row, gram))
+            slot = row * self._bands + gram_hash % self._bands
+            keys.append(slot << self._value_bits | gram_hash >> 16 & self._value_mask)
+        return tuple(keys)
+
+    def _bandHashes(self, gram_keys: Iterable[tuple[int, ...]]) -> list[int]:
+        """ Hash the bands of the MinHash signature of a segment, given the keys of its n-grams """
+        signature = list(self._empty_signature)
+        for keys in gram_keys:
+            for key in keys:
+                slot = key >> self._value_bits
+                if key < signature[slot]:
+                    signature[slot] = key
+
+        empty_signature = self._empty_signature
+        if any(map(eq, signature, empty_signature)):
+            # Short segments leave slots empty, which would match the empty slots of any other short segment.
+            # An empty slot takes the value of the next filled slot of its row instead, marked by its distance
+            densified = list(signature)
+            for slot in [slot for slot, is_empty in enumerate(map(eq, signature, empty_signature)) if is_empty]:
+                row_start = slot - slot % self._bands
+                for distance in range(1, self._bands):
+                    other = row_start + (slot + distance) % self._bands
+                    if signature[other] != empty_signature[other]:
+                        densified[slot] = signature[other] | distance << 32
+                        break
+            signature = densified
+        return [hash(tuple(signature[band::self._bands])) for band in range(self._bands)]
+
+    def _resize(self, buckets: int) -> None:
+        mask = buckets - 1
+        for band in range(self._bands):
+            heads, next_segments = array("i", (-1,)) * buckets, self._next[band]
+            for segment_id, band_hash in enumerate(self._band_hashes[band]):
+                bucket = band_hash & mask
+                next_segments[segment_id] = heads[bucket]
+                heads[bucket] = segment_id
+            self._heads[band] = heads
+
+    def add(self, text: str) -> None:
+        """ Add a segment to the index. The caller must ensure the segment is not already present """
+        segment_id = len(self._segments)
+        gram_ids, gram_keys = self._gram_ids, self._gram_keys
+        grams = array("I")
+        for gram in self._gramSet(text):
+            gram_id = gram_ids.get(gram)
+            if gram_id is None:
+                gram_id = gram_ids[gram] = len(gram_keys)
+                gram_keys.append(self._gramKeys(gram))
+            grams.append(gram_id)
+        self._segments.append(text)
+        self._grams.append(grams)
+
+        # Up to two segments per bucket keeps the chains short
+        if segment_id >= 2 * len(self._heads[0]):
+            self._resize(4 * len(self._heads[0]))
+        mask = len(self._heads[0]) - 1
+        for band, band_hash in enumerate(self._bandHashes(map(gram_keys.__getitem__, grams))):
+            band_hash &= 0xFFFFFFFF
+            heads, bucket = self._heads[band], band_hash & mask
+            self._band_hashes[band].append(band_hash)
+            self._next[band].append(heads[bucket])
+            heads[bucket] = segment_id
+
+    def search(self, text: str, threshold: float) -> tuple[str, float] | None:
+        """Find the segment most similar to text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+
+        threshold : float
+            The minimum similarity of a match, in the range (0, 1].
+
+        Returns
+        -------
+        tuple[str, float] | None
+            The most similar segment and its similarity, if any segment is at least as similar as the threshold.
+            Otherwise, None.
+        """
+        grams = self._gramSet(text)
+        size = len(grams)
+        gram_ids, gram_keys = self._gram_ids, self._gram_keys
+        query, keys = set(), []
+        for gram in grams:
+            gram_id = gram_ids.get(gram)
+            if gram_id is None:
+                keys.append(self._gramKeys(gram))
+            else:
+                query.add(gram_id)
+                keys.append(gram_keys[gram_id])
+        # N-grams not in the index can never be shared
+        if len(query) < threshold * size:
+            return None
+
+        candidates = set()
+        mask = len(self._heads[0]) - 1
+        for band, band_hash in enumerate(self._bandHashes(keys)):
+            band_hash &= 0xFFFFFFFF
+            band_hashes, next_segments = self._band_hashes[band], self._next[band]
+            segment_id = self._heads[band][band_hash & mask]
+            while segment_id >= 0:
+                if band_hashes[segment_id] == band_hash:
+                    candidates.add(segment_id)
+                segment_id = next_segments[segment_id]
+
+        min_size, max_size = threshold * size, size / threshold
+        best_match, best_score = None, threshold
+        for segment_id in candidates:
+            segment_grams = self._grams[segment_id]
+            segment_size = len(segment_grams)
+            if segment_size < min_size or segment_size > max_size:
+                continue
+            overlap = len(query.intersection(segment_grams))
+            score = overlap / (size + segment_size - overlap)
+            if score >= best_score:
+                best_match, best_score = segment_id, score
+        return None if best_match is None else (self._segments[best_match], best_score)
+
+    def getSize(self) -> int:
+        return len(self._segments)
\ No newline at end of file
@@ -0,0 +1,129 @@
+import csv
+import json
+import os
+import re
+import traceback
+from typing import Self
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.general import StrPath
+from module.translation_tools.aho_corasick import AhoCorasick
+
+
+class Glossary():
+    _instance = None
+    _logger = logger
+
+    # Placeholder for a glossary term while the text is being translated
+    # The translator may add whitespace inside the placeholder, so allow that when restoring
+    _term_token = "[T{index}]"
+    _term_token_pattern = re.compile(r"\[\s*T\s*(\d+)\s*\]")
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._terms = {} # type: dict[str, str]
+            cls._automaton = None # type: AhoCorasick | None
+            cls._signature = None # type: tuple[str, float] | None
+        return cls._instance
+
+    def load(self, path: StrPath) -> None:
+        """Load a term base and build its automaton.
+        Nothing is done if the same, unchanged term base is already loaded.
+
+        Supported term bases:
+        * tsv/txt: One term per line. The source term and the translated term separated by a tab.
+        * csv: One term per line. The source term and the translated term separated by a comma.
+        * json: An object mapping source terms to translated terms.
+
+        Parameters
+        ----------
+        path : StrPath
+            Path-like object pointing to a term base. An empty path unloads the glossary.
+        """
+        try:
+            signature = (f"{path}", os.path.getmtime(path)) if path else None
+        except OSError:
+            signature = None
+        if signature == self._signature:
+            return
+
+        self._signature = signature
+        self._terms = {}
+        self._automaton = None
+        if signature is None:
+            return
+        try:
+            self._terms = self._readTermBase(path)
+            self._automaton = AhoCorasick(self._terms.keys())
+            self._logger.debug(f"Loaded {len(self._terms)} glossary terms from '{path}'")
+        except Exception:
+            self._logger.error(f"Failed to load glossary from '{path}'\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+    def _readTermBase(self, path: StrPath) -> dict[str, str]:
+        extension = os.path.splitext(path)[1].strip(".").lower()
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            if extension == "json":
+                rows = json.load(file).items()
+            else:
+                rows = csv.reader(file, delimiter="," if extension == "csv" else "\t")
+
+            terms = {}
+            for row in rows:
+                if len(row) < 2 or row[0].startswith("#"):
+                    continue
+                source, target = row[0].strip(), row[1].strip()
+                if source and target:
+                    terms[source] = target
+            return terms
+
+    def _isWordBoundary(self, text: str, start: int, end: int) -> bool:
+        """ Terms in languages using spaces must not match parts of a word """
+        if text[start].isascii() and text[start].isalnum() and start > 0 and text[start-1].isascii() and text[start-1].isalnum():
+            return False
+        if text[end-1].isascii() and text[end-1].isalnum() and end < len(text) and text[end].isascii() and text[end].isalnum():
+            return False
+        return True
+
+    def lookup(self, text: str) -> str | None:
+        """ Return the translation of text if the entire text is a glossary term. Else None """
+        return self._terms.get(text.strip())
+
+    def protect(self, text: str) -> tuple[str, list[str]]:
+        """Replace glossary terms in text with placeholders which survive translation.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            Returns a tuple of values:
+            * [0]: The text with placeholders.
+            * [1]: The translated terms in the order of their placeholders.
+        """
+        if self._automaton is None:
+            return text, []
+
+        parts, terms, position = [], [], 0
+        for start, end in self._automaton.findLongest(text, lambda start, end: self._isWordBoundary(text, start, end)):
+            parts.append(text[position:start])
+            parts.append(self._term_token.format(index=len(terms)))
+            terms.append(self._terms[text[start:end]])
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), terms
+
+    def restore(self, translation: str, terms: list[str]) -> str:
+        """ Replace placeholders in the translation with their translated glossary term """
+        if not terms:
+            return translation
+        restored = self._term_token_pattern.sub(
+            lambda match: terms[int(match[1])] if int(match[1]) < len(terms) else match[0],
+            translation
+        )
+        if len(self._term_token_pattern.findall(translation)) != len(terms):
+            self._logger.warning(f"Glossary terms were lost in translation: {translation}")
+        return restored
+
+    def getSize(self) -> int:
+        return len(self._terms)
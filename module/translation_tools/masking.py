@@ -0,0 +1,90 @@
+import re
+
+from module.tools.types.config import BaseConfig
+
+
+class Masker():
+    # Placeholders, e.g. color codes "{colour_start|huixiang}", format tokens "{0}" and "%s", newlines, and numbers
+    _token_pattern = re.compile(r"\{[^{}]*\}|%(?:\d+\$)?[-+ 0#]*\d*(?:\.\d+)?[sdifuxXc]|\\n|\n|\d+(?:[.,]\d+)*")
+
+    # Placeholder for a masked token while the text is being translated
+    # The translator may add whitespace inside the placeholder, so allow that when restoring
+    _mask_token = "[P{index}]"
+    _mask_token_pattern = re.compile(r"\[\s*P\s*(\d+)\s*\]")
+
+    def __init__(self, config: BaseConfig) -> None:
+        """Canonicalize placeholders and numbers in text.
+
+        Texts which only differ by their placeholders and numbers are identical when masked.
+        Thus, they share translation memory entries and the translator cannot mangle the masked tokens.
+        """
+        self._config = config
+        self._delimiter = None # type: str | None
+        self._pattern = self._token_pattern
+
+    def _getPattern(self) -> re.Pattern:
+        """ The color code delimiter is masked as well. Its pattern is rebuilt if the delimiter is changed """
+        delimiter = self._config.getValue("colorCodeDelim") * self._config.getValue("colorCodeDelimSize")
+        if delimiter != self._delimiter:
+            self._delimiter = delimiter
+            self._pattern = re.compile(f"{re.escape(delimiter)}|{self._token_pattern.pattern}") if delimiter else self._token_pattern
+        return self._pattern
+
+    def isEnabled(self) -> bool:
+        return self._config.getValue("maskPlaceholders")
+
+    def mask(self, text: str) -> tuple[str, list[str]]:
+        """Replace placeholders and numbers in text with indexed placeholders.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            Returns a tuple of values:
+            * [0]: The masked text.
+            * [1]: The masked tokens in the order of their placeholders.
+        """
+        tokens = []
+        def repl(match: re.Match) -> str:
+            tokens.append(match[0])
+            return self._mask_token.format(index=len(tokens) - 1)
+        return self._getPattern().sub(repl, text), tokens
+
+    def unmask(self, text: str, tokens: list[str]) -> str | None:
+        """Replace the indexed placeholders in text with their masked tokens.
+
+        Returns
+        -------
+        str | None
+            The unmasked text, if every placeholder is present exactly once. Otherwise, None.
+        """
+        found = [int(index) for index in self._mask_token_pattern.findall(text)]
+        if sorted(found) != list(range(len(tokens))):
+            return None
+        return self._mask_token_pattern.sub(lambda match: tokens[int(match[1])], text)
+
+    def maskPair(self, text: str, translation: str) -> tuple[str, str] | None:
+        """Mask a text and its translation consistently, i.e. identical tokens share placeholders.
+
+        Returns
+        -------
+        tuple[str, str] | None
+            The masked text and translation, if the tokens of both are identical. Otherwise, None.
+        """
+        masked_text, tokens = self.mask(text)
+        unused = {} # type: dict[str, list[int]]
+        for index, token in enumerate(tokens):
+            unused.setdefault(token, []).append(index)
+
+        is_consistent = True
+        def repl(match: re.Match) -> str:
+            nonlocal is_consistent
+            indexes = unused.get(match[0])
+            if not indexes:
+                is_consistent = False
+                return match[0]
+            return self._mask_token.format(index=indexes.pop(0))
+        masked_translation = self._getPattern().sub(repl, translation)
+
+        if not is_consistent or any(unused.values()):
+            return None
+        return masked_text, masked_translation
@@ -0,0 +1,69 @@
+import re
+
+
+class Segmenter():
+    # A sentence ends with CJK punctuation, or with Latin punctuation followed by whitespace.
+    # Closing quotes and brackets after the punctuation belong to the sentence
+    _sentence_pattern = re.compile(r"(?P<sentence>.*?(?:[。！？；…]+[”’」』）)]*|[.!?]+[”’\"')\]]*(?=\s|$)|$))(?P<space>\s*)", re.DOTALL)
+
+    # Latin punctuation only ends a sentence if the next sentence starts with an uppercase letter or a CJK character,
+    # after any opening quotes, brackets or color codes
+    _latin_end_pattern = re.compile(r"[.!?]+[”’\"')\]]*$")
+    _sentence_start_pattern = re.compile(r"(?:[“‘\"'(\[¡¿]|\{[^{}]*\})*(?P<char>.)", re.DOTALL)
+    _cjk_pattern = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
+    # Words followed by a period which do not end a sentence. Single letters, e.g. initials, neither do
+    _abbreviation_pattern = re.compile(r"(?:^|[\s(\[“‘\"'])(?:[A-Za-z]|Mr|Mrs|Ms|Dr|Prof|St|Mt|Jr|Sr|Sgt|Capt|Lt|Col|Gen|"
+                                       r"Rev|vs|approx|e\.g|i\.e)\.$")
+
+    # Languages which do not separate sentences with whitespace
+    _spaceless_lang_tags = ("schinese",)
+
+    def split(self, text: str) -> list[tuple[str, str]]:
+        """Split text into sentences.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The sentences of text, each with the whitespace following it.
+        """
+        segments = []
+        for match in self._sentence_pattern.finditer(text):
+            if match["sentence"] and segments and not self._isSentenceEnd(segments[-1][0], match["sentence"]):
+                segments[-1] = (segments[-1][0] + segments[-1][1] + match["sentence"], match["space"])
+            elif match["sentence"]:
+                segments.append((match["sentence"], match["space"]))
+            elif match["space"] and segments:
+                segments[-1] = (segments[-1][0], segments[-1][1] + match["space"])
+        return segments if segments else [(text, "")]
+
+    def _isSentenceEnd(self, sentence: str, next_sentence: str) -> bool:
+        """ Whether the sentence ends before the next sentence, rather than at an abbreviation or inside a sentence """
+        if not self._latin_end_pattern.search(sentence):
+            return True
+        if self._abbreviation_pattern.search(sentence):
+            return False
+        start = self._sentence_start_pattern.match(next_sentence)
+        return start is not None and (start["char"].isupper() or self._cjk_pattern.match(start["char"]) is not None)
+
+    def join(self, segments: list[tuple[str, str]], target_lang: str) -> str:
+        """Reassemble translated sentences in order.
+
+        Parameters
+        ----------
+        segments : list[tuple[str, str]]
+            The translated sentences, each with the whitespace which followed the source sentence.
+
+        target_lang : str
+            The XML language tag of the translated sentences, e.g. "english".
+        """
+        is_spaceless = target_lang in self._spaceless_lang_tags
+        text = ""
+        for i, (sentence, space) in enumerate(segments):
+            if i < len(segments) - 1:
+                if is_spaceless and space == " ":
+                    space = ""
+                elif not is_spaceless and space == "":
+                    space = " "
+            text += sentence + space
+        return text
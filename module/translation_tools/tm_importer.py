@@ -0,0 +1,138 @@
+import os
+import traceback
+from pathlib import Path
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.config import BaseConfig
+from module.tools.types.general import StrPath
+from module.translation_tools.masking import Masker
+from module.translation_tools.translation_memory import TranslationMemory
+from module.xml_tools import XMLParser
+
+
+class TMImporter():
+    _logger = logger
+
+    def __init__(self, config: BaseConfig) -> None:
+        self._config = config
+        # A separate parser ensures the state of the main parser is left untouched
+        self._parser = XMLParser(config)
+        self._memory = TranslationMemory()
+        self._masker = Masker(config)
+
+    def harvestFile(self, location: StrPath, source_lang: str, target_lang: str) -> list[tuple[str, str]]:
+        """Align the entries of two language blocks in an XML file by their entry ID.
+
+        Parameters
+        ----------
+        location : StrPath
+            Path-like object pointing to an XML file.
+
+        source_lang : str
+            The XML language tag of the source text, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag of the translated text, e.g. "english".
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            Pairs of source text and its translation. Placeholders and numbers are masked, if enabled.
+        """
+        sanitized_input = self._parser.sanitizeXML(location, report=False)
+        if not sanitized_input:
+            return []
+
+        language_blocks = self._parser.indexLanguageBlocks(sanitized_input)
+        if source_lang not in language_blocks or target_lang not in language_blocks:
+            return []
+
+        source_entries = self._parser.extractLanguageBlock(sanitized_input, language_blocks[source_lang])
+        target_entries = self._parser.extractLanguageBlock(sanitized_input, language_blocks[target_lang])
+        is_masking = self._masker.isEnabled()
+        pairs = []
+        for entry_id, text in source_entries.items():
+            translation = target_entries.get(entry_id)
+            if translation and self._isAligned(text, translation):
+                # Store the pair masked, like the translator does. Fall back to the pair as-is
+                masked_pair = self._masker.maskPair(text, translation) if is_masking else None
+                pairs.append(masked_pair if masked_pair else (text, translation))
+        return pairs
+
+    def _isAligned(self, text: str, translation: str) -> bool:
+        """ Color code delimiters must match, otherwise the translation cannot be substituted """
+        delimiter = self._config.getValue("colorCodeDelim") * self._config.getValue("colorCodeDelimSize")
+        return text.count(delimiter) == translation.count(delimiter)
+
+    def collect(self, location: StrPath, source_lang: str, target_lang: str) -> tuple[int, list[tuple[str, str]]]:
+        """Collect the aligned pairs of all XML files in a folder (including subfolders).
+        Leaves the translation memory untouched, so it is safe to run in another thread.
+
+        Parameters
+        ----------
+        location : StrPath
+            Path-like object pointing to a folder of XML files.
+
+        source_lang : str
+            The XML language tag of the source text, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag of the translated text, e.g. "english".
+
+        Returns
+        -------
+        tuple[int, list[tuple[str, str]]]
+            Returns a tuple of values:
+            * [0]: The number of XML files with aligned pairs.
+            * [1]: The pairs of source text and its translation of all files.
+        """
+        file_count, pairs = 0, []
+        for root, _, files in os.walk(location):
+            for file in files:
+                if os.path.splitext(file)[1].lower() != ".xml":
+                    continue
+                path = Path(root, file)
+                try:
+                    file_pairs = self.harvestFile(path, source_lang, target_lang)
+                except Exception:
+                    self._logger.error(f"Failed to harvest translation memory from '{path}'\n"
+                                       + traceback.format_exc(limit=AppArgs.traceback_limit))
+                    continue
+                if file_pairs:
+                    file_count += 1
+                    pairs.extend(file_pairs)
+        return file_count, pairs
+
+    def add(self, location: StrPath, source_lang: str, target_lang: str, file_count: int,
+            pairs: list[tuple[str, str]]) -> int:
+        """ Add the result of `collect` to the translation memory and save it. Returns the number of new pairs """
+        added = self._memory.bulkAdd(pairs, source_lang, target_lang)
+        self._memory.save()
+        self._logger.info(f"Harvested {added} translation memory {"pairs" if added != 1 else "pair"} "
+                          + f"from {file_count} XML {"files" if file_count != 1 else "file"} in '{location}'")
+        return added
+
+    def harvest(self, location: StrPath, source_lang: str, target_lang: str) -> tuple[int, int]:
+        """Harvest a bilingual translation memory from all XML files in a folder (including subfolders).
+
+        Parameters
+        ----------
+        location : StrPath
+            Path-like object pointing to a folder of XML files.
+
+        source_lang : str
+            The XML language tag of the source text, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag of the translated text, e.g. "english".
+
+        Returns
+        -------
+        tuple[int, int]
+            Returns a tuple of values:
+            * [0]: The number of XML files harvested.
+            * [1]: The number of new pairs added to the translation memory.
+        """
+        file_count, pairs = self.collect(location, source_lang, target_lang)
+        return file_count, self.add(location, source_lang, target_lang, file_count, pairs)
\ No newline at end of file
@@ -0,0 +1,174 @@
+import json
+import time
+import traceback
+from pathlib import Path
+from typing import Iterable, Optional, Self
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.general import StrPath
+from module.tools.utilities import writeFileAtomically
+from module.translation_tools.fuzzy_index import NGramIndex
+
+
+class TranslationMemory():
+    _instance = None
+    _logger = logger
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._tm_path = AppArgs.translation_memory_path
+            cls._is_loaded = False
+            cls._is_modified = False
+            # Mapping of language pair to the source text mapped to its translation
+            cls._memory = {} # type: dict[str, dict[str, str]]
+            # Fuzzy lookup indexes of each language pair. Built on first fuzzy lookup
+            cls._fuzzy_indexes = {} # type: dict[str, NGramIndex]
+        return cls._instance
+
+    def _getLanguagePair(self, source_lang: str, target_lang: str) -> dict[str, str]:
+        if not self._is_loaded:
+            self.load()
+        lang_pair = f"{source_lang}:{target_lang}"
+        if lang_pair not in self._memory:
+            self._memory |= {lang_pair: {}}
+        return self._memory[lang_pair]
+
+    def _getFuzzyIndex(self, source_lang: str, target_lang: str) -> NGramIndex:
+        lang_pair = f"{source_lang}:{target_lang}"
+        if lang_pair not in self._fuzzy_indexes:
+            start_time = time.perf_counter()
+            fuzzy_index = NGramIndex()
+            for text in self._getLanguagePair(source_lang, target_lang):
+                fuzzy_index.add(text)
+            self._fuzzy_indexes |= {lang_pair: fuzzy_index}
+            self._logger.debug(f"Indexed {fuzzy_index.getSize()} translation memory segments for fuzzy lookup "
+                               + f"in {time.perf_counter() - start_time:.2f}s")
+        return self._fuzzy_indexes[lang_pair]
+
+    def _updateFuzzyIndex(self, texts: Iterable[str], source_lang: str, target_lang: str) -> None:
+        """ Add new segments to the fuzzy index of the language pair, if it is built """
+        fuzzy_index = self._fuzzy_indexes.get(f"{source_lang}:{target_lang}")
+        if fuzzy_index is not None:
+            for text in texts:
+                fuzzy_index.add(text)
+
+    def load(self, path: Optional[StrPath]=None) -> None:
+        """Load the translation memory from disk.
+
+        Parameters
+        ----------
+        path : StrPath, optional
+            Path-like object pointing to a translation memory file.
+            By default the translation memory path of the app.
+        """
+        path = path if path else self._tm_path
+        self._is_loaded = True
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for lang_pair, segments in json.load(file).items():
+                    self._memory.setdefault(lang_pair, {}).update(segments)
+            self._fuzzy_indexes.clear()
+            self._logger.debug(f"Loaded translation memory from '{path}'")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self._logger.error(f"Failed to load translation memory from '{path}'\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+    def save(self) -> None:
+        """ Write the translation memory to disk, if it has been modified.
+            The file keeps its old content if writing fails
+        """
+        if not self._is_modified:
+            return
+        try:
+            Path(self._tm_path).parent.mkdir(parents=True, exist_ok=True)
+            writeFileAtomically(self._tm_path, json.JSONEncoder(ensure_ascii=False).iterencode(self._memory))
+            self._is_modified = False
+            self._logger.debug(f"Writing translation memory to '{self._tm_path}'")
+        except Exception:
+            self._logger.error(f"Failed to save translation memory to '{self._tm_path}'\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> str | None:
+        """ Return the translation of text if it exists in the translation memory. Else None """
+        return self._getLanguagePair(source_lang, target_lang).get(text)
+
+    def fuzzyLookup(self, text: str, source_lang: str, target_lang: str,
+                    threshold: float) -> tuple[str, str, float] | None:
+        """Find the translation of the segment most similar to text.
+
+        Parameters
+        ----------
+        text : str
+            The text to find a near-match for.
+
+        source_lang : str
+            The XML language tag of the text, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag of the translation, e.g. "english".
+
+        threshold : float
+            The minimum similarity of a near-match, in the range (0, 1].
+
+        Returns
+        -------
+        tuple[str, str, float] | None
+            Returns a tuple of values, if a near-match was found. Otherwise, None.
+            * [0]: The source text of the near-match.
+            * [1]: The translation of the near-match.
+            * [2]: The similarity of the near-match.
+        """
+        match = self._getFuzzyIndex(source_lang, target_lang).search(text, threshold)
+        if match is None:
+            return None
+        return match[0], self._getLanguagePair(source_lang, target_lang)[match[0]], match[1]
+
+    def add(self, text: str, translation: str, source_lang: str, target_lang: str) -> None:
+        if text and translation:
+            segments = self._getLanguagePair(source_lang, target_lang)
+            if text not in segments:
+                self._updateFuzzyIndex((text,), source_lang, target_lang)
+            elif segments[text] == translation:
+                return
+            segments[text] = translation
+            self._is_modified = True
+
+    def bulkAdd(self, pairs: Iterable[tuple[str, str]], source_lang: str, target_lang: str) -> int:
+        """Add many source/translation pairs to the translation memory at once.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[str, str]]
+            Pairs of source text and its translation.
+
+        source_lang : str
+            The XML language tag of the source text, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag of the translation, e.g. "english".
+
+        Returns
+        -------
+        int
+            The number of pairs added.
+        """
+        segments = self._getLanguagePair(source_lang, target_lang)
+        new_texts = []
+        is_modified = False
+        for text, translation in pairs:
+            if text and translation and segments.get(text) != translation:
+                if text not in segments:
+                    new_texts.append(text)
+                segments[text] = translation
+                is_modified = True
+        self._updateFuzzyIndex(new_texts, source_lang, target_lang)
+        added = len(new_texts)
+        self._is_modified = self._is_modified or is_modified
+        return added
+
+    def getSize(self, source_lang: str, target_lang: str) -> int:
+        return len(self._getLanguagePair(source_lang, target_lang))
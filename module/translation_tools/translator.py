@@ -0,0 +1,254 @@
+import json
+import traceback
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.metrics import Metrics
+from module.tools.tracer import Tracer, traced
+from module.tools.types.config import BaseConfig
+from module.translation_tools.glossary import Glossary
+from module.translation_tools.masking import Masker
+from module.translation_tools.segmenter import Segmenter
+from module.translation_tools.translation_memory import TranslationMemory
+
+
+class Translator():
+    _logger = logger
+    _tracer = Tracer()
+    _requests = Metrics().counter("translator_requests_total", "Translator requests by outcome")
+    _request_seconds = Metrics().histogram("translator_request_seconds", "Latency of translator requests")
+    _batch_size = Metrics().histogram("translator_batch_size", "Texts per translator request", resolution=1)
+    _retries = Metrics().counter("translator_retries_total", "Texts sent again as the translator lost their masked placeholders")
+    _memory_lookups = Metrics().counter("translation_memory_lookups_total", "Exact translation memory lookups by result")
+    _segments = Metrics().counter("translation_segments_total", "Translated segments by resolution")
+    # The resolutions of a text from least to most reliable
+    _status_order = ("failed", "fuzzy", "translator", "memory", "glossary")
+
+    def __init__(self, config: BaseConfig) -> None:
+        self._config = config
+        self._memory = TranslationMemory()
+        self._glossary = Glossary()
+        self._masker = Masker(config)
+        self._segmenter = Segmenter()
+        self._is_masking = False
+        self._is_segmenting = False
+        # How the segments of the last run were resolved
+        self._statistics = {} # type: dict[str, int]
+        # Texts translated using a near-match in the last run: text, near-match source text, similarity
+        self._fuzzy_matches = [] # type: list[tuple[str, str, float]]
+        self._fuzzy_threshold = 0.0
+        # How each text of the last run was resolved, i.e. the least reliable resolution of its segments
+        self._statuses = [] # type: list[str]
+
+    @traced("requestTranslations", "translation")
+    def _requestTranslations(self, texts: list[str], source_lang: str, target_lang: str) -> list[str | None]:
+        """ Translate a batch of texts in a single request. Texts without a translation are None """
+        import requests # Imported on first use as it is slow to import
+
+        payload = {
+            "q": texts,
+            "source": AppArgs.translator_langCodes[source_lang],
+            "target": AppArgs.translator_langCodes[target_lang],
+            "format": "text",
+            "api_key": ""
+        }
+        headers = {
+            "Content-Type": "application/json"
+        }
+        data = json.dumps(payload).encode("utf-8")
+        self._tracer.annotate(texts=len(texts), requestBytes=len(data))
+        self._batch_size.observe(len(texts))
+        try:
+            with self._request_seconds.time():
+                response = requests.post(AppArgs.translator_url, headers=headers, data=data)
+            self._tracer.annotate(status=response.status_code, responseBytes=len(response.content))
+            translations = response.json()["translatedText"]
+            if isinstance(translations, list) and len(translations) == len(texts):
+                self._requests.inc(outcome="success")
+                return translations
+            self._requests.inc(outcome="unexpected_response")
+            self._logger.warning(f"Unexpected response from the translator: {response.text}")
+        except (KeyError, ValueError):
+            self._requests.inc(outcome="unexpected_response")
+            self._logger.warning(f"Unexpected response from the translator: {response.text}")
+        except requests.RequestException:
+            self._requests.inc(outcome="unreachable")
+            self._logger.error(f"Failed to reach the translator at '{AppArgs.translator_url}'\n"
+                               + traceback.format_exc(limit=AppArgs.traceback_limit))
+        return [None] * len(texts)
+
+    def _requestBatched(self, texts: list[str], source_lang: str, target_lang: str) -> dict[str, str | None]:
+        """ Translate each distinct text once, in batches """
+        unique_texts = list(dict.fromkeys(texts))
+        translations = {}
+        batch_size = AppArgs.translator_batch_size
+        for i in range(0, len(unique_texts), batch_size):
+            batch = unique_texts[i:i+batch_size]
+            translations |= zip(batch, self._requestTranslations(batch, source_lang, target_lang))
+        return translations
+
+    def _lookupMemory(self, text: str, masked_text: str, tokens: list[str],
+                      source_lang: str, target_lang: str) -> str | None:
+        """ Look up the masked text in the translation memory, falling back to the text itself """
+        localization = self._memory.lookup(masked_text, source_lang, target_lang)
+        if localization is not None:
+            localization = self._masker.unmask(localization, tokens)
+        if localization is None and masked_text != text:
+            localization = self._memory.lookup(text, source_lang, target_lang)
+        return localization
+
+    def _resolveLocally(self, text: str, source_lang: str, target_lang: str,
+                        exact_only: bool=False) -> str | dict | None:
+        """Resolve text using the glossary and the translation memory (in that order).
+
+        Parameters
+        ----------
+        exact_only : bool, optional
+            Only resolve exact matches. Near-matches and translator requests are skipped.
+            By default False.
+
+        Returns
+        -------
+        str | dict | None
+            The translation, if resolved. Otherwise, a pending translation request for the translator
+            (or None if *exact_only* is True).
+        """
+        localization = self._glossary.lookup(text)
+        if localization is not None:
+            self._statistics["glossary"] += 1
+            return localization
+
+        masked_text, tokens = self._masker.mask(text) if self._is_masking else (text, [])
+        localization = self._lookupMemory(text, masked_text, tokens, source_lang, target_lang)
+        self._memory_lookups.inc(result="miss" if localization is None else "hit")
+        if localization is not None:
+            self._statistics["memory"] += 1
+            return localization
+
+        if exact_only:
+            return None
+
+        if self._fuzzy_threshold > 0:
+            match = self._memory.fuzzyLookup(masked_text, source_lang, target_lang, self._fuzzy_threshold)
+            localization = self._masker.unmask(match[1], tokens) if match is not None else None
+            if localization is not None:
+                # Near-matches are not added to the translation memory as they require review
+                self._statistics["fuzzy"] += 1
+                self._fuzzy_matches.append((text, match[0], match[2]))
+                return localization
+
+        protected_text, terms = self._glossary.protect(masked_text)
+        return {"text": text, "masked_text": masked_text, "tokens": tokens, "request": protected_text, "terms": terms}
+
+    def _resolveRequests(self, pending: list[dict], source_lang: str, target_lang: str) -> None:
+        """ Translate all pending requests with the translator. The result is stored in each request """
+        translations = self._requestBatched([request["request"] for request in pending], source_lang, target_lang)
+        retries = []
+        for request in pending:
+            masked_localization = translations[request["request"]]
+            if masked_localization is None:
+                request["result"] = None
+                continue
+            masked_localization = self._glossary.restore(masked_localization, request["terms"])
+            request["result"] = self._masker.unmask(masked_localization, request["tokens"])
+            if request["result"] is None:
+                # The translator mangled the placeholders. Translate the text as-is instead
+                self._logger.debug(f"Masked placeholders were lost in translation: {masked_localization}")
+                request["masked_text"], request["tokens"] = request["text"], []
+                request["request"], request["terms"] = self._glossary.protect(request["text"])
+                retries.append(request)
+            else:
+                self._memory.add(request["masked_text"], masked_localization, source_lang, target_lang)
+        if retries:
+            self._retries.inc(len(retries))
+            self._resolveRequests(retries, source_lang, target_lang)
+
+    @traced("translate", "translation")
+    def translate(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+        """Translate texts, resolving them locally before calling the translator.
+        Long texts are translated sentence by sentence.
+
+        Parameters
+        ----------
+        texts : list[str]
+            The texts to translate.
+
+        source_lang : str
+            The XML language tag of the texts, e.g. "schinese".
+
+        target_lang : str
+            The XML language tag to translate into, e.g. "english".
+
+        Returns
+        -------
+        list[str]
+            The translated texts. Texts without a translation are returned as-is.
+        """
+        self._statistics = {"glossary": 0, "memory": 0, "fuzzy": 0, "translator": 0, "failed": 0}
+        self._fuzzy_matches = []
+        self._statuses = []
+        self._fuzzy_threshold = self._config.getValue("fuzzyMatchThreshold") / 100
+        self._is_masking = self._masker.isEnabled()
+        self._is_segmenting = self._config.getValue("segmentSentences")
+        self._glossary.load(self._config.getValue("glossaryLocation"))
+
+        # Each text is split into segments which are either resolved locally or pending a translator request
+        texts_segments = [] # type: list[list[tuple[str | dict, str]]]
+        texts_resolutions = [] # type: list[set[str]]
+        pending = [] # type: list[dict]
+        for text in texts:
+            segments = []
+            statistics = self._statistics.copy()
+            if text:
+                split = self._segmenter.split(text) if self._is_segmenting else [(text, "")]
+                # A translation of the entire text takes precedence over its segments
+                localization = self._resolveLocally(text, source_lang, target_lang, exact_only=True) if len(split) > 1 else None
+                if localization is not None:
+                    segments.append((localization, ""))
+                else:
+                    for segment, space in split:
+                        localization = self._resolveLocally(segment, source_lang, target_lang)
+                        if isinstance(localization, dict):
+                            pending.append(localization)
+                        segments.append((localization, space))
+            texts_segments.append(segments)
+            texts_resolutions.append({key for key, count in self._statistics.items() if count > statistics[key]})
+
+        self._tracer.annotate(texts=len(texts), pendingSegments=len(pending))
+        if pending:
+            with self._tracer.span("resolveRequests", "translation", segments=len(pending)):
+                self._resolveRequests(pending, source_lang, target_lang)
+
+        translation = []
+        for text, segments, resolutions in zip(texts, texts_segments, texts_resolutions):
+            for i, (localization, space) in enumerate(segments):
+                if isinstance(localization, dict):
+                    if localization["result"] is None:
+                        self._statistics["failed"] += 1
+                        resolutions.add("failed")
+                        self._logger.warning(f"No translation available for: {localization["text"]}")
+                        # Can be changed to any message like "???" or "No translation available"
+                        segments[i] = (localization["text"], space)
+                    else:
+                        self._statistics["translator"] += 1
+                        resolutions.add("translator")
+                        segments[i] = (localization["result"], space)
+            self._statuses.append(next((status for status in self._status_order if status in resolutions), ""))
+            translation.append(self._segmenter.join(segments, target_lang) if segments else text)
+        self._memory.save()
+        for resolution, count in self._statistics.items():
+            if count:
+                self._segments.inc(count, resolution=resolution)
+        return translation
+
+    def getStatistics(self) -> dict[str, int]:
+        """ The number of segments resolved by the glossary, translation memory, and translator in the last run """
+        return self._statistics
+
+    def getStatuses(self) -> list[str]:
+        """ How each text of the last run was resolved, e.g. "memory". Empty texts have an empty status """
+        return self._statuses
+
+    def getFuzzyMatches(self) -> list[tuple[str, str, float]]:
+        """ Texts translated using a near-match in the last run, which should be reviewed """
+        return self._fuzzy_matches
@@ -1,3 +1,7 @@
 from .xml_parser import XMLParser
 from .xml_substituter import XMLSubstituter
-from .xml_validator import XMLValidator
\ No newline at end of file
+from .xml_validator import XMLValidator
+from .entry_store import EntryStore
+from .xml_writer import XMLWriter
+from .xml_splicer import XMLSplicer
+from .validation_scheduler import ValidationScheduler
\ No newline at end of file
@@ -0,0 +1,73 @@
+from module.xml_tools import XMLParser
+
+
+class EntryStore():
+    # The status of an entry's translation
+    EMPTY = "empty"                 # The entry has no source text
+    UNTRANSLATED = "untranslated"
+    GLOSSARY = "glossary"           # Translated by the glossary
+    MEMORY = "memory"               # Translated by the translation memory
+    FUZZY = "fuzzy"                 # Translated by a near-match in the translation memory (should be reviewed)
+    TRANSLATOR = "translator"       # Translated by the translator
+    FAILED = "failed"               # The translator could not translate the entry
+    EDITED = "edited"               # Translated by the user
+
+    def __init__(self) -> None:
+        """ The extracted entries of an XML file and their translation, in the order of the parsed lines """
+        self._ids = []          # type: list[str]
+        self._sources = []      # type: list[str]
+        self._translations = [] # type: list[str]
+        self._statuses = []     # type: list[str]
+        self._id_rows = {}      # type: dict[str, int]
+
+    def load(self, parser: XMLParser) -> None:
+        """ Load the entries extracted by the parser, discarding all translations """
+        self._ids = [parser.formatEntryID(line, "") for line in parser.getParsedLines()]
+        self._sources = list(parser.getExtractedText())
+        self.clearTranslations()
+        self._id_rows = {entry_id: row for row, entry_id in enumerate(self._ids)}
+
+    def getSize(self) -> int:
+        return len(self._ids)
+
+    def getID(self, row: int) -> str:
+        return self._ids[row]
+
+    def getRow(self, entry_id: str) -> int | None:
+        return self._id_rows.get(entry_id)
+
+    def getSource(self, row: int) -> str:
+        return self._sources[row]
+
+    def getSources(self) -> list[str]:
+        return self._sources
+
+    def getTranslation(self, row: int) -> str:
+        return self._translations[row]
+
+    def getTranslations(self) -> list[str]:
+        return self._translations
+
+    def getStatus(self, row: int) -> str:
+        return self._statuses[row]
+
+    def setTranslation(self, row: int, translation: str, status: str) -> None:
+        self._translations[row] = translation
+        self._statuses[row] = status if self._sources[row] else self.EMPTY
+
+    def clearTranslations(self) -> None:
+        self._translations = ["" for _ in self._sources]
+        self._statuses = [self.UNTRANSLATED if source else self.EMPTY for source in self._sources]
+
+    def getLocalization(self, row: int) -> str:
+        """ The text written for the entry by the XML substituter. Entries without a translation keep their source text """
+        return self._translations[row] or self._sources[row]
+
+    def getLocalizedText(self) -> list[str]:
+        """ The translations of all entries with a source text, i.e. the localized text used by the XML substituter.
+        Entries without a translation keep their source text """
+        return [translation or source for source, translation in zip(self._sources, self._translations) if source]
+
+    def getTranslatableRows(self) -> list[int]:
+        """ The rows of all entries with a source text which were not translated by the user """
+        return [row for row, status in enumerate(self._statuses) if status not in (self.EMPTY, self.EDITED)]
@@ -7,6 +7,11 @@ class Pattern():
     # Finds: "<language id="english">"
     language_start = re.compile(r"<language id=.*?(?=>).")
 
+    # Get the value of language id
+    # INPUT: "<language id="english">"
+    # Finds: "english"
+    language_id = re.compile(r"<language id=\"(.*?)\"")
+
     # End language tag "</language"
     language_exit = re.compile(r"<\/language>")
 
@@ -46,4 +51,14 @@ class Pattern():
     # begin_color: "{colour_start|huixiang}"
     # text:        "检测到程序错误！"
     # end_color:   "{colour_end}"
-    color_codes = re.compile(r"(?P<start_color>{.*?})(?P<text>.*?)(?P<end_color>{.*?})")
\ No newline at end of file
+    color_codes = re.compile(r"(?P<start_color>{.*?})(?P<text>.*?)(?P<end_color>{.*?})")
+
+    # Get the entry id and the CDATA payload of well-formed entries in the raw bytes of a file.
+    # Group 2 spans the payload only, which allows replacing it in-place
+    # -- Example --
+    # INPUT: b"<entry id="name"><![CDATA[text[that may look]] like this]]></entry>"
+    # Finds: b"name", b"text[that may look]] like this"
+    raw_entry = re.compile(rb"<entry id=\"([^\"]*)\"><!\[CDATA\[(.*?)\]\]></entry>", re.DOTALL)
+
+    # End language tag in the raw bytes of a file
+    raw_language_exit = re.compile(rb"</language>")
\ No newline at end of file
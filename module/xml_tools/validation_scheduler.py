@@ -0,0 +1,100 @@
+import traceback
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+
+from app.common.signal_bus import signalBus
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.xml_tools import XMLValidator
+
+
+class ValidationScheduler(QObject):
+    _logger = logger
+    _validated = pyqtSignal(int, object) # generation, tuple[missing entry IDs, is empty]
+
+    def __init__(self, validator: XMLValidator, parent: Optional[QObject]=None) -> None:
+        """ Debounce validation requests and run full validations in a worker thread.
+        Each request cancels any validation still waiting or running. Results are reported by the validator,
+        i.e. via `signalBus.xmlPreviewInvalid`, on the GUI thread """
+        super().__init__(parent)
+        self._validator = validator
+        self._generation = 0 # Incremented by each request. Validations of older generations are stale
+        self._running_generation = None # type: int | None
+        self._is_full_pending = False
+        self._pending_entryIDs = set() # type: set[str]
+        self._lang_tags = ("", "")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(AppArgs.validation_debounce_ms)
+        self._timer.timeout.connect(self._run)
+        self._validated.connect(self._onValidated)
+
+    def schedule(self, extract_lang_tag: str, write_lang_tag: str, entry_ids: list[str] | None=None) -> None:
+        """Request a validation, which runs once no request has been made for a short while.
+
+        Parameters
+        ----------
+        entry_ids : list[str] | None, optional
+            Only validate these entries. By default None, which validates everything.
+        """
+        self._generation += 1
+        # A cancelled full validation must run again
+        if entry_ids is None or self._running_generation is not None:
+            self._is_full_pending = True
+            self._running_generation = None
+        else:
+            self._pending_entryIDs.update(entry_ids)
+        self._lang_tags = (extract_lang_tag, write_lang_tag)
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """ Discard all pending and running validations """
+        self._generation += 1
+        self._timer.stop()
+        self._running_generation = None
+        self._is_full_pending = False
+        self._pending_entryIDs.clear()
+
+    def flush(self) -> None:
+        """ Run any pending or running validation now, on the calling thread """
+        is_full = self._is_full_pending or self._running_generation is not None
+        entry_ids = list(self._pending_entryIDs)
+        self.cancel()
+        if is_full:
+            self._validator.validatePreview(*self._lang_tags)
+        elif entry_ids:
+            self._validator.validateEntries(entry_ids, *self._lang_tags)
+
+    def _run(self) -> None:
+        if self._is_full_pending:
+            self._is_full_pending = False
+            self._pending_entryIDs.clear()
+            generation = self._generation
+            self._running_generation = generation
+            snapshot = self._validator.snapshot()
+            QThreadPool.globalInstance().start(lambda: self._work(generation, snapshot))
+        elif self._pending_entryIDs:
+            # Validating a few entries is cheap
+            entry_ids = list(self._pending_entryIDs)
+            self._pending_entryIDs.clear()
+            self._validator.validateEntries(entry_ids, *self._lang_tags)
+
+    def _work(self, generation: int, snapshot: tuple[list[str], list[str]]) -> None:
+        """ Runs in a worker thread """
+        try:
+            result = self._validator.findMissingEntries(*snapshot, is_cancelled=lambda: generation != self._generation)
+            if result is not None:
+                self._validated.emit(generation, result)
+        except Exception:
+            trace = traceback.format_exc(limit=AppArgs.traceback_limit)
+            msg = "An unexpected exception occurred while validating XML"
+            self._logger.error(msg + "\n" + trace)
+            signalBus.xmlProcessException.emit("PE_Validate", msg, trace)
+
+    def _onValidated(self, generation: int, result: tuple[list[str], bool]) -> None:
+        if generation != self._generation:
+            return
+        self._running_generation = None
+        self._validator.applyValidation(*result, *self._lang_tags)
\ No newline at end of file
@@ -1,19 +1,24 @@
 import os
 import re
+import time
 import traceback
 
 from app.common.signal_bus import signalBus
 
 from module.config.internal.app_args import AppArgs
 from module.logger import logger
+from module.tools.metrics import Metrics
 from module.tools.types.general import StrPath
 from module.tools.types.config import BaseConfig
-from module.tools.utilities import formatListForDisplay
+from module.tools.tracer import Tracer, traced
+from module.tools.utilities import LazyString, formatListForDisplay
 from module.xml_tools.regex_patterns import Pattern
 
 
 class XMLParser():
     _logger = logger
+    _tracer = Tracer()
+    _metrics = Metrics()
 
     def __init__(self, config: BaseConfig) -> None:
         self._config = config
@@ -29,8 +34,11 @@ class XMLParser():
         self._input_line_positions = {} # type: dict[str, str]
         # Used to extract color codes from CDATA entries
         self._entry_color_codes = {} # type: dict[str, dict[str: list[str]]]
+        # Incremented by each parse. Used to detect state derived from an older parse
+        self._generation = 0
 
-    def sanitizeXML(self, location: StrPath) -> list[str]:
+    @traced("sanitizeXML")
+    def sanitizeXML(self, location: StrPath, report: bool=True) -> list[str]:
         self._sanitized_input.clear()
         self._extracted_text.clear()
         self._parsed_lines.clear()
@@ -38,8 +46,10 @@ class XMLParser():
         self._input_line_positions.clear()
 
         xml_file = os.path.split(location)[1]
+        start = time.perf_counter()
         try:
             raw_input = open(location, "r", encoding="utf-8").read().splitlines()
+            self._tracer.annotate(lines=len(raw_input), bytes=os.path.getsize(location))
             sanitized_list = [] # type: list[str]
             multiple_line_entry = [] # type: list[str]
             begin_entry_found = False
@@ -93,22 +103,25 @@ class XMLParser():
             ###############
 
             # Show any detected malformed entries
-            if self._malformed_entries["fixed"]:
+            if report and self._malformed_entries["fixed"]:
                 message_size = self._config.getValue("messageSize")
                 entry_grammar = "entries" if len(self._malformed_entries["fixed"]) != 1 else "entry"
                 msg = f"Fixed {len(self._malformed_entries["fixed"])} malformed {entry_grammar} in '{xml_file}'"
                 content = [f"Line {self._input_line_positions[val]}: {re.search(Pattern.entry_id, val)[1]}" for val in self._malformed_entries["fixed"]]
                 signalBus.xmlValidationError.emit("MALFIX_Sanitize", msg, formatListForDisplay(content, message_size))
-                self._logger.info(f"{msg}:\n  {formatListForDisplay(content, message_size, join_string="\n  ")}")
-            elif self._malformed_entries["failed"]:
+                self._logger.info("%s:\n  %s", msg, LazyString(formatListForDisplay, content, message_size, join_string="\n  "))
+            elif report and self._malformed_entries["failed"]:
                 message_size = self._config.getValue("messageSize")
                 entry_grammar = "entries" if len(self._malformed_entries["failed"]) != 1 else "entry"
                 msg = f"Failed to fix {len(self._malformed_entries["failed"])} malformed {entry_grammar} in '{xml_file}'"
                 content = [f"Line {self._input_line_positions[val]}: {re.search(Pattern.entry_id, val)[1]}" for val in self._malformed_entries["failed"]]
                 signalBus.xmlValidationError.emit("MAL_Sanitize", msg, formatListForDisplay(content, message_size))
-                self._logger.warning(f"{msg}:\n  {formatListForDisplay(content, message_size, join_string="\n  ")}")
+                self._logger.warning("%s:\n  %s", msg, LazyString(formatListForDisplay, content, message_size, join_string="\n  "))
 
             self._sanitized_input = sanitized_list
+            self._metrics.observeStage("sanitize", time.perf_counter() - start, len(raw_input))
+            self._tracer.annotate(sanitizedLines=len(sanitized_list),
+                                  malformed=len(self._malformed_entries["fixed"]) + len(self._malformed_entries["failed"]))
             return sanitized_list
         except Exception:
             trace = traceback.format_exc(limit=AppArgs.traceback_limit)
@@ -131,6 +144,38 @@ class XMLParser():
         self._malformed_entries["failed"].append(line)
         return line
 
+    def _splitColorCodes(self, text: str, colorCodeOptions: tuple) -> dict[str, list[str]] | None:
+        """Split text into its color codes and the text between them.
+
+        Only text longer than the minimum length is included, except if only 1 color code pair exists.
+        Smaller sized delimitors (or the values themselves) get lost in translation (literally).
+
+        Returns
+        -------
+        dict[str, list[str]] | None
+            The start colors, texts and end colors of the text, if any text was found. Otherwise, None.
+        """
+        color_codes = {"start_color": [], "text": [], "end_color": []}
+        matches = [val for val in re.finditer(Pattern.color_codes, text)]
+        for match in matches:
+            text_ = match.group("text")
+            if len(matches) == 1 or len(text_) >= colorCodeOptions[1]:
+                color_codes["start_color"].append(match.group("start_color"))
+                color_codes["text"].append(text_)
+                color_codes["end_color"].append(match.group("end_color"))
+        return color_codes if color_codes["text"] else None
+
+    def _joinColorCodeTexts(self, texts: list[str], colorCodeOptions: tuple) -> str:
+        return f" {colorCodeOptions[2] * colorCodeOptions[3]} ".join(texts)
+
+    def _getColorCodeOptions(self) -> tuple:
+        return (
+            self._config.getValue("colorCodeSep"),
+            self._config.getValue("colorCodeSepLength"),
+            self._config.getValue("colorCodeDelim"),
+            self._config.getValue("colorCodeDelimSize")
+        )
+
     def _extract(self, line: str, line_number: int, colorCodeOptions: tuple) -> None:
         """
         Searches for and extracts a valid substring from the XML input line.
@@ -147,26 +192,14 @@ class XMLParser():
                 entry_id = self.formatEntryID(line, line_number)
 
                 # Split text and color code tags
-                matches = [val for val in re.finditer(Pattern.color_codes, text)]
-                for match in matches:
-                    start_color = match.group("start_color")
-                    text_ = match.group("text")
-                    end_color = match.group("end_color")
-
-                    # Only add text longer than this. Except if only 1 tag exists, then add regardless.
-                    # Smaller sized delimitors (or the values themselves) get lost in translation (literally)
-                    if len(matches) == 1 or len(text_) >= colorCodeOptions[1]:
-                        if entry_id not in self._entry_color_codes:
-                            self._entry_color_codes |= {entry_id: {"start_color": [], "text": [], "end_color": []}}
-                        self._entry_color_codes[entry_id]["start_color"].append(start_color)
-                        self._entry_color_codes[entry_id]["text"].append(text_)
-                        self._entry_color_codes[entry_id]["end_color"].append(end_color)
-
-                if entry_id in self._entry_color_codes and self._entry_color_codes[entry_id]["text"]:
-                    text = f" {colorCodeOptions[2] * colorCodeOptions[3]} ".join(self._entry_color_codes[entry_id]["text"])
+                color_codes = self._splitColorCodes(text, colorCodeOptions)
+                if color_codes:
+                    self._entry_color_codes |= {entry_id: color_codes}
+                    text = self._joinColorCodeTexts(color_codes["text"], colorCodeOptions)
             self._parsed_lines.append(line)
             self._extracted_text.append(text)
 
+    @traced("parse")
     def parse(self, location: StrPath, extract_lang_tag: str) -> None:
         """
         NOTE: The file must be specified in the config!
@@ -175,13 +208,10 @@ class XMLParser():
         Each extracted text line is written to the specified output txt file.
         """
         self._entry_color_codes = {}
+        self._generation += 1
+        start = time.perf_counter()
         sanitized_input = self.sanitizeXML(location)
-        colorCodeOptions = (
-            self._config.getValue("colorCodeSep"),
-            self._config.getValue("colorCodeSepLength"),
-            self._config.getValue("colorCodeDelim"),
-            self._config.getValue("colorCodeDelimSize")
-        )
+        colorCodeOptions = self._getColorCodeOptions()
         try:
             is_extracting = False
             for i, line in enumerate(sanitized_input):
@@ -209,6 +239,66 @@ class XMLParser():
             msg = "An unexpected exception occurred while parsing XML"
             self._logger.error(msg + "\n" + trace)
             signalBus.xmlProcessException.emit("PE_Parsing", msg, trace)
+        self._tracer.annotate(entries=len(self._extracted_text))
+        self._metrics.observeStage("parse", time.perf_counter() - start, len(self._extracted_text))
+
+    def indexLanguageBlocks(self, sanitized_input: list[str]) -> dict[str, tuple[int, int]]:
+        """Index the language blocks of the sanitized input.
+
+        Parameters
+        ----------
+        sanitized_input : list[str]
+            The sanitized lines of an XML file.
+
+        Returns
+        -------
+        dict[str, tuple[int, int]]
+            Mapping of language tag to the line range [start, end) of the entries in its block.
+        """
+        language_blocks = {} # type: dict[str, tuple[int, int]]
+        lang_tag, block_start = None, 0
+        for i, line in enumerate(sanitized_input):
+            # Found language start tag "<language id="
+            if re.search(Pattern.language_start, line):
+                match = re.search(Pattern.language_id, line)
+                lang_tag, block_start = match[1] if match else None, i + 1
+            # Found language exit tag "</language"
+            elif lang_tag and re.search(Pattern.language_exit, line):
+                language_blocks |= {lang_tag: (block_start, i)}
+                lang_tag = None
+        return language_blocks
+
+    def extractLanguageBlock(self, sanitized_input: list[str], block: tuple[int, int]) -> dict[str, str]:
+        """Extract the text of all entries in a language block without altering the state of the parser.
+
+        Parameters
+        ----------
+        sanitized_input : list[str]
+            The sanitized lines of an XML file.
+
+        block : tuple[int, int]
+            The line range of the language block, as found by `indexLanguageBlocks`.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of entry ID to the entry's text, prepared the same way as extracted text.
+        """
+        colorCodeOptions = self._getColorCodeOptions()
+        entries = {} # type: dict[str, str]
+        for line in sanitized_input[block[0]:block[1]]:
+            match_obj = re.search(Pattern.cdata, line)
+            entry_id = re.search(Pattern.entry_id, line)
+            if match_obj is None or entry_id is None:
+                continue
+
+            text = match_obj[1]
+            if colorCodeOptions[0]:
+                color_codes = self._splitColorCodes(text, colorCodeOptions)
+                if color_codes:
+                    text = self._joinColorCodeTexts(color_codes["text"], colorCodeOptions)
+            entries |= {entry_id[1]: text}
+        return entries
 
     def formatEntryID(self, line: str, identifier: int | str) -> str:
         prep = f"{identifier}_" if identifier != "" else ""
@@ -219,6 +309,10 @@ class XMLParser():
         else:
             raise ValueError("No match found in line for the given pattern.")
 
+    def getGeneration(self) -> int:
+        """ The number of the last parse """
+        return self._generation
+
     def getSanitizedInput(self) -> list[str]:
         return self._sanitized_input
 
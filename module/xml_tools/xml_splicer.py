@@ -0,0 +1,84 @@
+import re
+import traceback
+from typing import Iterator
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.general import StrPath
+from module.xml_tools.regex_patterns import Pattern
+
+
+class XMLSplicer():
+    _logger = logger
+
+    def __init__(self) -> None:
+        """ Write the output XML by replacing only the CDATA payloads of the language write tag in the input file's bytes.
+        Everything else, including line endings and whitespace, is copied untouched """
+        self._data = b""
+        # The byte range of each payload to replace, in file order
+        self._ranges = [] # type: list[tuple[int, int, bytes]]
+
+    def _indexPayloads(self, write_lang_tag: str) -> dict[str, tuple[int, int]] | None:
+        """ Find the byte range of each entry's CDATA payload in the language write tag.
+        Returns None if the language write tag is missing or has duplicate entry IDs """
+        start_tag = re.search(rb"<language id=\"" + re.escape(write_lang_tag.encode("utf-8")) + rb"\">", self._data)
+        if not start_tag:
+            return None
+        exit_tag = Pattern.raw_language_exit.search(self._data, start_tag.end())
+        block_end = exit_tag.start() if exit_tag else len(self._data)
+
+        payloads = {}
+        for match in Pattern.raw_entry.finditer(self._data, start_tag.end(), block_end):
+            if match[1] in payloads:
+                return None
+            payloads[match[1]] = match.span(2)
+        return payloads
+
+    def prepare(self, location: StrPath, write_lang_tag: str, payloads: dict[str, str]) -> bool:
+        """Load the input file and locate the payloads to replace.
+
+        Parameters
+        ----------
+        location : StrPath
+            The input XML file.
+
+        write_lang_tag : str
+            The language tag whose payloads are replaced.
+
+        payloads : dict[str, str]
+            The new payload of each entry ID, e.g. the substituter's payloads.
+
+        Returns
+        -------
+        bool
+            True if the file can be spliced, i.e. the language write tag has exactly the entries of *payloads*.
+            Otherwise, the output must be written from the substituter's preview XML.
+        """
+        self._data = b""
+        self._ranges = []
+        try:
+            with open(location, "rb") as file:
+                self._data = file.read()
+            ranges = self._indexPayloads(write_lang_tag)
+            entry_ids = {entry_id.encode("utf-8") for entry_id in payloads}
+            if ranges is None or ranges.keys() != entry_ids:
+                self._logger.debug(f"Cannot splice '{location}'. The '{write_lang_tag}' entries differ from the translated entries")
+                self._data = b""
+                return False
+            self._ranges = sorted((start, end, payloads[entry_id.decode("utf-8")].encode("utf-8"))
+                                  for entry_id, (start, end) in ranges.items())
+            return True
+        except Exception:
+            self._logger.warning(f"Cannot splice '{location}'\n" + traceback.format_exc(limit=AppArgs.traceback_limit))
+            self._data = b""
+            return False
+
+    def splice(self) -> Iterator[memoryview | bytes]:
+        """ The output XML as chunks of the input file interleaved with the new payloads """
+        view = memoryview(self._data)
+        position = 0
+        for start, end, payload in self._ranges:
+            yield view[position:start]
+            yield payload
+            position = end
+        yield view[position:]
@@ -1,4 +1,5 @@
 import re
+import time
 import traceback
 
 from app.common.signal_bus import signalBus
@@ -6,22 +7,34 @@ from app.common.signal_bus import signalBus
 from module.config.internal.app_args import AppArgs
 from module.logger import logger
 from module.tools.types.config import BaseConfig
+from module.tools.metrics import Metrics
+from module.tools.tracer import Tracer, traced
 from module.xml_tools import XMLParser
 from module.xml_tools.regex_patterns import Pattern
 
 
 class XMLSubstituter():
     _logger = logger
+    _tracer = Tracer()
+    _metrics = Metrics()
 
     def __init__(self, config: BaseConfig, parser: XMLParser) -> None:
         self._config = config
         self._parser = parser
         self._preview_XML = [] # type: list[str]
         self._failed_translations = [] # type: list[str]
+        # The CDATA payload written for each entry ID inside the language write tag
+        self._substituted_payloads = {} # type: dict[str, str]
+        # The entry ID, preview line and input line number of each substituted entry by its index in the parsed lines.
+        # Used to re-substitute single entries
+        self._substituted_entries = {} # type: dict[int, tuple[str, int, int]]
+        # The generation of the parse the last substitution used
+        self._parse_generation = None # type: int | None
         self._processColorCodes = True
         self._colorCodeDelim = ""
         self._colorCodeDelimSize = 0
 
+    @traced("substitute")
     def substitute(self, write_lang_tag: str, parsed_xml_lines: list[str],
                    extracted_text: list[str], sanitized_xml: list[str],
                    localized_text: list[str]):
@@ -30,14 +43,19 @@ class XMLSubstituter():
         Uses regex to insert input text between "[ and "]]" e.g. [text goes here]].
         The replacement scope is defined by XML language tags.
         """
-        self._preview_XML.clear()
-        self._failed_translations.clear()
+        self.clear()
+        self._parse_generation = self._parser.getGeneration()
         self._processColorCodes = self._config.getValue("colorCodeSep")
         self._colorCodeDelim = self._config.getValue("colorCodeDelim")
         self._colorCodeDelimSize = self._config.getValue("colorCodeDelimSize")
+        start = time.perf_counter()
         try:
             is_substituting = False
             is_skipping = False
+            # The first line number of each line in the input
+            line_numbers = {} # type: dict[str, int]
+            for i, line in enumerate(sanitized_xml, start=1):
+                line_numbers.setdefault(line, i)
 
             for line in sanitized_xml:
                 # Found language start tag "<language id="
@@ -58,18 +76,23 @@ class XMLSubstituter():
                 # We're inside the language write tag
                 if is_substituting:
                     # Create all entries with translated text
+                    k = 0 # The next unused translation
                     for j, parsed_line in enumerate(parsed_xml_lines):
                         try:
                             # Handle case where the source text is empty
-                            localization = localized_text[0] if extracted_text[j] else ""
+                            localization = localized_text[k] if extracted_text[j] else ""
                             # Insert translation into the source line
-                            line_number = sanitized_xml.index(parsed_line) + 1
-                            self._preview_XML.append(re.sub(Pattern.cdata, f"[CDATA[{self._preprocessLine(parsed_line, line_number, localization)}]]", parsed_line) + "\n")
-                            # Only pop if the translation was used
-                            if localization: localized_text.pop(0)
+                            line_number = line_numbers[parsed_line]
+                            entry_id = self._parser.formatEntryID(parsed_line, "")
+                            payload = self._preprocessLine(parsed_line, line_number, localization)
+                            self._substituted_entries[j] = (entry_id, len(self._preview_XML), line_number)
+                            self._preview_XML.append(self._insertPayload(parsed_line, payload))
+                            self._substituted_payloads[entry_id] = payload
+                            # Only advance if the translation was used
+                            if localization: k += 1
                         except IndexError:
                             # This should only occur for localized_text but both are present just in case
-                            content = f"{"Extracted XML tags" if localized_text else "Localized text"} ran out of lines at {j}/{len(parsed_xml_lines)}"
+                            content = f"{"Extracted XML tags" if k < len(localized_text) else "Localized text"} ran out of lines at {j}/{len(parsed_xml_lines)}"
                             self._logger.critical(content)
                             signalBus.xmlProcessException.emit("PE_OuttaLines", "Critical error", content)
                     is_substituting = False
@@ -82,6 +105,54 @@ class XMLSubstituter():
             content = "An unexpected exception occurred while translating XML"
             self._logger.error(content + "\n" + trace)
             signalBus.xmlProcessException.emit("PE_Translation", content, trace)
+        self._tracer.annotate(entries=len(self._substituted_payloads), lines=len(self._preview_XML))
+        self._metrics.observeStage("substitute", time.perf_counter() - start, len(self._substituted_payloads))
+
+    def clear(self) -> None:
+        """ Discard the result of the last substitution, e.g. when another file is parsed """
+        self._preview_XML.clear()
+        self._failed_translations.clear()
+        self._substituted_payloads.clear()
+        self._substituted_entries.clear()
+        self._parse_generation = None
+
+    @traced("resubstitute")
+    def resubstitute(self, index: int, parsed_line: str, localization: str) -> int | None:
+        """Substitute a single entry of the last substitution again, e.g. after its translation was edited.
+
+        Parameters
+        ----------
+        index : int
+            The index of the entry in the parsed lines of the last substitution.
+
+        parsed_line : str
+            The parsed line of the entry.
+
+        localization : str
+            The new translation of the entry.
+
+        Returns
+        -------
+        int | None
+            The index of the updated line in the preview XML.
+            None if the entry was not substituted by a substitution of the current parse,
+            in which case a full substitution is required.
+        """
+        if index not in self._substituted_entries or self._parse_generation != self._parser.getGeneration():
+            return None
+        entry_id, preview_index, line_number = self._substituted_entries[index]
+        if entry_id != self._parser.formatEntryID(parsed_line, ""):
+            return None
+        if parsed_line in self._failed_translations:
+            self._failed_translations.remove(parsed_line)
+        payload = self._preprocessLine(parsed_line, line_number, localization)
+        self._preview_XML[preview_index] = self._insertPayload(parsed_line, payload)
+        self._substituted_payloads[entry_id] = payload
+        return preview_index
+
+    def _insertPayload(self, line: str, payload: str) -> str:
+        """ The source line with the payload as its CDATA. The payload is inserted as-is, like the output splicer does """
+        return re.sub(Pattern.cdata, lambda _: f"[CDATA[{payload}]]", line) + "\n"
 
     def _preprocessLine(self, line: str, line_number: int, localization: str) -> str:
         repl = localization
@@ -107,5 +178,13 @@ class XMLSubstituter():
     def getPreviewXML(self) -> list[str]:
         return self._preview_XML
 
+    def getSubstitutedEntryIDs(self) -> list[str]:
+        """ The entry IDs written inside the language write tag, in order """
+        return list(self._substituted_payloads)
+
+    def getSubstitutedPayloads(self) -> dict[str, str]:
+        """ The CDATA payload written for each entry ID inside the language write tag """
+        return self._substituted_payloads
+
     def getFailedTranslations(self) -> list[str]:
         return self._failed_translations
\ No newline at end of file
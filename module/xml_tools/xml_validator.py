@@ -1,100 +1,155 @@
 import re
+import time
 import traceback
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from app.common.signal_bus import signalBus
 
 from module.config.internal.app_args import AppArgs
 from module.logger import logger
 from module.tools.types.config import BaseConfig
-from module.tools.utilities import formatListForDisplay
+from module.tools.metrics import Metrics
+from module.tools.tracer import Tracer, traced
+from module.tools.utilities import LazyString, formatListForDisplay
 from module.xml_tools import XMLParser, XMLSubstituter
 from module.xml_tools.regex_patterns import Pattern
 
 
 class XMLValidator():
     _logger = logger
+    _tracer = Tracer()
+    _metrics = Metrics()
 
     def __init__(self, config: BaseConfig, parser: XMLParser,
                  substituter: XMLSubstituter) -> None:
         self._config = config
         self._parser = parser
         self._substituter = substituter
+        # The result of the last validation
+        self._missing_entryIDs = [] # type: list[str]
+        self._reported_failures = [] # type: list[str]
+        self._is_empty = True
 
-    def _parseEntryIDs(self, preview: list[str], lang_tag: str) -> list[str]:
-        entryIDs = [] # type: list[str]
+    def difference(self, source: Iterable[Any], target: Iterable[Any]) -> list[str]:
+        """ Get difference between source and target.
+            I.e. find all values in source which are not in target
+        """
+        target = set(target)
+        return [item for item in source if item not in target]
+
+    @traced("validatePreview")
+    def validatePreview(self, extract_lang_tag: str, write_lang_tag: str) -> None:
+        """ Validate the result of the last substitution.
+            The entries extracted by the parser are compared against the entries written by the substituter
+        """
         try:
-            begin_search = False
-            for line in preview:
-                if begin_search:
-                    # Found language exit tag "</language". Thus, language extraction is complete
-                    if re.search(Pattern.language_exit, line):
-                        break
-                    else:
-                        try:
-                            entryIDs.append(self._parser.formatEntryID(line, ""))
-                        except TypeError:
-                            # No entry ID was found
-                            pass
-
-                # Found language start tag "<language id="
-                if re.search(Pattern.language_start, line):
-                    # The language start tag is the one we're looking for
-                    if re.search((f"({lang_tag})(?=\">)"), line):
-                        begin_search = True
-            return entryIDs
+            missing_entryIDs, is_empty = self.findMissingEntries(*self.snapshot())
+            self.applyValidation(missing_entryIDs, is_empty, extract_lang_tag, write_lang_tag)
         except Exception:
             trace = traceback.format_exc(limit=AppArgs.traceback_limit)
             msg = "An unexpected exception occurred while validating XML"
             self._logger.error(msg + "\n" + trace)
-            signalBus.xmlProcessException.emit("PE_Validation", msg, trace)
+            signalBus.xmlProcessException.emit("PE_Validate", msg, trace)
 
-    def difference(self, source: Iterable[Any], target: Iterable[Any]) -> list[str]:
-        """ Get difference between source and target.
-            I.e. find all values in source which are not in target
+    def snapshot(self) -> tuple[list[str], list[str]]:
+        """ Copy the input of `findMissingEntries`, allowing it to run in another thread """
+        return list(self._parser.getParsedLines()), self._substituter.getSubstitutedEntryIDs()
+
+    @traced("findMissingEntries")
+    def findMissingEntries(self, parsed_lines: list[str], write_entryIDs: list[str],
+                           is_cancelled: Callable[[], bool]=lambda: False) -> tuple[list[str], bool] | None:
+        """Find the extracted entries which were not written by the substituter.
+        Only uses its arguments, so it is safe to run in another thread.
+
+        Parameters
+        ----------
+        parsed_lines : list[str]
+            The parsed lines of the extracted entries.
+
+        write_entryIDs : list[str]
+            The entry IDs written by the substituter.
+
+        is_cancelled : Callable[[], bool], optional
+            Polled during the search. Stop searching when it returns True.
+
+        Returns
+        -------
+        tuple[list[str], bool] | None
+            The missing entry IDs and whether either set of entries is empty.
+            None if cancelled.
         """
-        diff = []
-        for item in source:
-            if item not in target:
-                diff.append(item)
-        return diff
+        start = time.perf_counter()
+        extract_entryIDs = []
+        for i, line in enumerate(parsed_lines):
+            if i % 1000 == 0 and is_cancelled():
+                return None
+            extract_entryIDs.append(self._parser.formatEntryID(line, ""))
+        if is_cancelled():
+            return None
+        self._tracer.annotate(extractEntries=len(extract_entryIDs), writeEntries=len(write_entryIDs))
+        missing_entryIDs = self.difference(extract_entryIDs, write_entryIDs)
+        self._metrics.observeStage("validate", time.perf_counter() - start, len(extract_entryIDs))
+        return missing_entryIDs, not extract_entryIDs or not write_entryIDs
+
+    def applyValidation(self, missing_entryIDs: list[str], is_empty: bool,
+                        extract_lang_tag: str, write_lang_tag: str) -> None:
+        """ Report the result of `findMissingEntries` """
+        self._missing_entryIDs = missing_entryIDs
+        self._is_empty = is_empty
+        self._report(extract_lang_tag, write_lang_tag, notify_missing=True, notify_failed=True)
 
-    def validatePreview(self, preview: list[str], extract_lang_tag: str, write_lang_tag: str) -> None:
+    @traced("validateEntries")
+    def validateEntries(self, entry_ids: list[str], extract_lang_tag: str, write_lang_tag: str) -> None:
+        """ Validate only the given entries after they were re-substituted.
+            Messages are only shown again if the validation result changed
+        """
+        start = time.perf_counter()
         try:
-            isValid, showErrors = True, False
-            extract_entryIDs = self._parseEntryIDs(preview, extract_lang_tag)
-            write_entryIDs = self._parseEntryIDs(preview, write_lang_tag)
-            diff = self.difference(extract_entryIDs, write_entryIDs)
-
-            # Empty set
-            if not extract_entryIDs or not write_entryIDs:
-                isValid = False
-
-            # The write_entryIDs are missing entries compared to extract_entryIDs
-            if diff:
-                isValid, showErrors = False, True
+            write_entryIDs = self._substituter.getSubstitutedPayloads()
+            missing_size = len(self._missing_entryIDs)
+            substituted = {entry_id for entry_id in entry_ids if entry_id in write_entryIDs}
+            if substituted:
+                self._missing_entryIDs = self.difference(self._missing_entryIDs, substituted)
+            self._report(
+                extract_lang_tag,
+                write_lang_tag,
+                notify_missing=missing_size != len(self._missing_entryIDs),
+                notify_failed=self._reported_failures != self._substituter.getFailedTranslations()
+            )
+            self._metrics.observeStage("validateEntries", time.perf_counter() - start, len(entry_ids))
+        except Exception:
+            trace = traceback.format_exc(limit=AppArgs.traceback_limit)
+            msg = "An unexpected exception occurred while validating XML"
+            self._logger.error(msg + "\n" + trace)
+            signalBus.xmlProcessException.emit("PE_Validate", msg, trace)
+
+    def _report(self, extract_lang_tag: str, write_lang_tag: str, notify_missing: bool, notify_failed: bool) -> None:
+        isValid, showErrors = not self._is_empty, False
+
+        # The written entries are missing entries compared to the extracted entries
+        diff = self._missing_entryIDs
+        if diff:
+            isValid, showErrors = False, True
+            if notify_missing:
                 message_size = self._config.getValue("messageSize")
                 entry_grammar = "entries" if len(diff) != 1 else "entry"
                 msg = f"Missing {len(diff)} {write_lang_tag} {"(source)" if extract_lang_tag == write_lang_tag else ""}{entry_grammar}"
-                self._logger.warning(f"{msg}:\n  {formatListForDisplay(diff, message_size, join_string="\n  ")}")
+                self._logger.warning("%s:\n  %s", msg, LazyString(formatListForDisplay, list(diff), message_size, join_string="\n  "))
                 signalBus.xmlValidationError.emit("VE_E1_BrokenTranslation", msg, formatListForDisplay(diff, message_size))
 
-            # Failed to translate some entries
-            _failed_translations = self._substituter.getFailedTranslations()
-            if _failed_translations:
-                isValid, showErrors = False, True
+        # Failed to translate some entries
+        _failed_translations = self._substituter.getFailedTranslations()
+        self._reported_failures = list(_failed_translations)
+        if _failed_translations:
+            isValid, showErrors = False, True
+            if notify_failed:
                 line_positions = self._parser.getInputLinePositions()
                 fail_size = len(_failed_translations)
                 message_size = self._config.getValue("messageSize")
                 entry_grammar = "entries" if fail_size != 1 else "entry"
                 msg = f"Failed to translate {fail_size} {entry_grammar}"
                 content = [f"Line {line_positions[val]}: {re.search(Pattern.entry_id, val)[1]}" for val in _failed_translations]
-                self._logger.warning(f"{msg}:\n  {formatListForDisplay(content, message_size, join_string="\n  ")}")
+                self._logger.warning("%s:\n  %s", msg, LazyString(formatListForDisplay, content, message_size, join_string="\n  "))
                 signalBus.xmlValidationError.emit("VE_W1_FailTranslation", msg, formatListForDisplay(content, message_size))
 
-            signalBus.xmlPreviewInvalid.emit(isValid, showErrors)
-        except Exception:
-            trace = traceback.format_exc(limit=AppArgs.traceback_limit)
-            msg = "An unexpected exception occurred while validating XML"
-            self._logger.error(msg + "\n" + trace)
-            signalBus.xmlProcessException.emit("PE_Validate", msg, trace)
\ No newline at end of file
+        signalBus.xmlPreviewInvalid.emit(isValid, showErrors)
\ No newline at end of file
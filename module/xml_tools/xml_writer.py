@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from module.config.internal.app_args import AppArgs
+from module.logger import logger
+from module.tools.types.config import BaseConfig
+from module.tools.utilities import writeFileAtomically
+
+
+class XMLWriter():
+    _logger = logger
+
+    def __init__(self, config: BaseConfig) -> None:
+        self._config = config
+
+    def _chunk(self, lines: Iterable[str]) -> Iterator[str]:
+        """ Join lines into chunks of roughly `AppArgs.xml_write_chunk_size` characters """
+        chunk, size = [], 0
+        for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= AppArgs.xml_write_chunk_size:
+                yield "".join(chunk)
+                chunk, size = [], 0
+        if chunk:
+            yield "".join(chunk)
+
+    def write(self, lines: Iterable[str], destination: str | Path) -> None:
+        """Stream XML lines to the destination file.
+        The destination is replaced atomically, i.e. it is never left partially written.
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            The lines of the XML file, including line endings. E.g. the substituter's preview XML.
+
+        destination : str | Path
+            The file to write to.
+        """
+        self._logger.debug(f"Saving XML to {destination}")
+        writeFileAtomically(destination, self._chunk(lines), fsync=self._config.getValue("syncOnSave"))
+
+    def writeBytes(self, chunks: Iterable[bytes | memoryview], destination: str | Path) -> None:
+        """ Stream bytes to the destination file, e.g. the splicer's output. The destination is replaced atomically """
+        self._logger.debug(f"Saving XML to {destination}")
+        writeFileAtomically(destination, chunks, fsync=self._config.getValue("syncOnSave"), encoding=None)
\ No newline at end of file